@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+HYI Kodlayıcı Performans Testi
+Eski `create_packet` uygulaması ile `HYIEncoder` arasındaki saniyedeki
+paket sayısını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_hyi_encoder.py [paket_sayisi]
+"""
+
+import os
+import struct
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.ground_station.data_models import RocketData, PayloadData
+from src.ground_station.serial_communication import HYIProtocol, HYIEncoder
+
+
+def legacy_create_packet(team_id, counter, rocket_data, payload_data):
+    """Önceki sürümdeki `HYIProtocol.create_packet` (karşılaştırma için)"""
+    packet = bytearray(78)
+    packet[0] = 0xFF
+    packet[1] = 0xFF
+    packet[2] = 0x54
+    packet[3] = 0x52
+    packet[4] = team_id
+    packet[5] = counter
+    packet[6:10] = struct.pack('<f', rocket_data.get('MSIrtifa', 0.0))
+    packet[10:14] = struct.pack('<f', rocket_data.get('RoketGPSIrtifa', 0.0))
+    packet[14:18] = struct.pack('<f', rocket_data.get('Enlem', 0.0))
+    packet[18:22] = struct.pack('<f', rocket_data.get('Boylam', 0.0))
+    packet[22:26] = struct.pack('<f', payload_data.get('GorevYukuIrtifa', 0.0))
+    packet[26:30] = struct.pack('<f', payload_data.get('GorevYukuEnlem', 0.0))
+    packet[30:34] = struct.pack('<f', payload_data.get('GorevYukuBoylam', 0.0))
+    packet[46:50] = struct.pack('<f', rocket_data.get('Gx', 0.0))
+    packet[50:54] = struct.pack('<f', rocket_data.get('Gy', 0.0))
+    packet[54:58] = struct.pack('<f', rocket_data.get('Gz', 0.0))
+    packet[58:62] = struct.pack('<f', rocket_data.get('Ax', 0.0))
+    packet[62:66] = struct.pack('<f', rocket_data.get('Ay', 0.0))
+    packet[66:70] = struct.pack('<f', rocket_data.get('Az', 0.0))
+    packet[70:74] = struct.pack('<f', rocket_data.get('aci', 0.0))
+    packet[74] = rocket_data.get('durum', 0)
+    packet[75] = sum(packet[4:75]) % 256
+    packet[76] = 0x0D
+    packet[77] = 0x0A
+    return packet
+
+
+def measure(name, count, func):
+    """Fonksiyonu `count` kez çalıştırıp saniyedeki paket sayısını yazar"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<40} {count / elapsed:>12,.0f} paket/s")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rocket = RocketData(sayac=42, MSIrtifa=1234.5, RoketGPSIrtifa=1230.0,
+                        Enlem=39.5419883728027, Boylam=28.0079479217529,
+                        Hiz=210.0, Gx=1.5, Gy=-2.0, Gz=0.25, Ax=0.1, Ay=0.2,
+                        Az=9.81, aci=12.0, durum=2)
+    payload = PayloadData(GorevYukuIrtifa=1200.0, GorevYukuEnlem=39.54,
+                          GorevYukuBoylam=28.0, GorevYukuBasinc=880.0,
+                          GorevYukuSicaklik=15.0, GorevYukuNem=40.0)
+    encoder = HYIEncoder(team_id=7)
+
+    # Çıktıların birebir aynı olduğunu doğrula
+    expected = legacy_create_packet(7, 42, rocket.to_dict(), payload.to_dict())
+    assert bytes(encoder.encode(42, rocket, payload)) == bytes(expected)
+
+    print(f"{count:,} paket kodlanıyor\n")
+
+    def run_legacy():
+        for _ in range(count):
+            legacy_create_packet(7, 42, rocket.to_dict(), payload.to_dict())
+
+    def run_create_packet():
+        for _ in range(count):
+            HYIProtocol.create_packet(7, 42, rocket.to_dict(), payload.to_dict())
+
+    def run_encoder():
+        encode = encoder.encode
+        for _ in range(count):
+            encode(42, rocket, payload)
+
+    def run_batch():
+        encoder.encode_many((42, rocket, payload) for _ in range(count))
+
+    before = measure("Önce: struct.pack + to_dict", count, run_legacy)
+    measure("HYIProtocol.create_packet (to_dict)", count, run_create_packet)
+    after = measure("HYIEncoder.encode (pack_into)", count, run_encoder)
+    measure("HYIEncoder.encode_many (toplu)", count, run_batch)
+    print(f"\nHızlanma: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Uçtan Uca Veri Yolu Performans Testi
+Sentetik bir uçuş kaydını "en hızlı" modda ana pencereye besler ve
+ayrıştırma + arayüz güncelleme yolunun saniyede işlediği satır sayısını ölçer.
+
+Kullanım:
+    python benchmarks/bench_replay_pipeline.py [satir_sayisi] [kayit_dosyasi]
+
+Kayıt dosyası verilirse sentetik kayıt yerine o dosya oynatılır.
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+from functools import partial
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from src.ground_station.flight_recorder import FlightRecorder
+from src.ground_station.main_window import GroundStationMainWindow
+from src.ground_station.replay import ReplaySource
+
+
+def write_synthetic_recording(path: str, count: int):
+    """50 Hz roket ve 10 Hz görev yükü satırlarından oluşan kayıt yazar"""
+    recorder = FlightRecorder(path, batch_size=4096)
+    start = time.time()
+    for i in range(count):
+        t = i / 50.0
+        altitude = 3000.0 * math.sin(min(t / 60.0, 1.0) * math.pi / 2)
+        line = (f"{i},{altitude:.2f},{altitude - 5:.2f},{39.54 + t * 1e-5:.7f},"
+                f"{28.0 + t * 1e-5:.7f},{120.0:.2f},{math.sin(t):.3f},"
+                f"{math.cos(t):.3f},0.0,0.1,0.2,9.81,{t % 360:.2f},2")
+        recorder.record('rocket', line.encode(), start + t)
+        if i % 5 == 0:
+            payload = f"{altitude:.2f},39.54,28.0,{1013.25 - altitude / 8.3:.2f},15.0,40.0"
+            recorder.record('payload', payload.encode(), start + t)
+    recorder.close()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication(sys.argv)
+    window = GroundStationMainWindow()
+    window.show()
+
+    # Ertelenen başlangıç işleri (3D görünüm, port taraması) ölçüme girmesin
+    while window.rocket_3d is None:
+        app.processEvents()
+
+    if len(sys.argv) > 2:
+        path = sys.argv[2]
+        cleanup = False
+    else:
+        handle, path = tempfile.mkstemp(suffix='.gsrec')
+        os.close(handle)
+        os.remove(path)
+        write_synthetic_recording(path, count)
+        cleanup = True
+
+    # Bitiş bildirimi oynatma thread'inden sinyal ile arayüz thread'ine taşınır
+    window.serial_signals.replay_finished.connect(app.quit)
+    source = ReplaySource(path, window.serial_manager.frame_queue, speed=None)
+    source.on_finished = partial(window.serial_signals.replay_finished.emit, source)
+    print(f"{len(source.log):,} kayıt en hızlı modda oynatılıyor")
+    start = time.perf_counter()
+    source.start()
+    app.exec_()
+
+    # Kuyrukta kalanları da işle
+    window.update_data()
+    elapsed = time.perf_counter() - start
+    processed = sum(buffer.total for buffer in window.telemetry_history.buffers.values())
+    print(f"İşlenen satır    : {processed:,}")
+    print(f"Süre             : {elapsed:.2f} s")
+    print(f"Veri yolu hızı   : {processed / elapsed:,.0f} satır/s")
+
+    window.close()
+    if cleanup:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Şema Kodlayıcı Testi
+Elle yazılmış alan listeli `from_csv_line`/`to_dict` uygulamaları ile
+`telemetry_schema.json`'dan derlenen fonksiyonların satır başına süresini
+ve şemanın derlenme süresini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_schema_codec.py [satir_sayisi]
+"""
+
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.ground_station.data_models import (RocketData, TELEMETRY_SCHEMA,
+                                            load_telemetry_schema)
+from src.ground_station.telemetry_codec import compile_schema
+
+LINE = "42,1234.5,1230.0,39.5419883,28.0079479,210.0,1.5,-2.0,0.25,0.1,0.2,9.81,12.0,2\n"
+
+
+def legacy_from_csv_line(line):
+    """Önceki sürümdeki `RocketData.from_csv_line` (karşılaştırma için)"""
+    values = line.strip().split(',')
+    if len(values) >= 14:
+        return RocketData(
+            sayac=int(values[0]),
+            MSIrtifa=float(values[1]),
+            RoketGPSIrtifa=float(values[2]),
+            Enlem=float(values[3]),
+            Boylam=float(values[4]),
+            Hiz=float(values[5]),
+            Gx=float(values[6]),
+            Gy=float(values[7]),
+            Gz=float(values[8]),
+            Ax=float(values[9]),
+            Ay=float(values[10]),
+            Az=float(values[11]),
+            aci=float(values[12]),
+            durum=int(values[13])
+        )
+    raise ValueError(f"Roket verisi için 14 alan gerekli, {len(values)} alan geldi")
+
+
+def legacy_to_dict(record):
+    """Önceki sürümdeki `to_dict` (karşılaştırma için)"""
+    return dict(zip(record._fields, record))
+
+
+def measure(name, count, func, argument):
+    """Fonksiyonu `count` kez çalıştırıp çağrı başına süreyi yazar"""
+    start = time.perf_counter()
+    for _ in range(count):
+        func(argument)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<36} {elapsed / count * 1e6:>8.3f} µs")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    record = RocketData.from_csv_line(LINE)
+    assert legacy_from_csv_line(LINE) == record
+    assert legacy_to_dict(record) == record.to_dict()
+
+    start = time.perf_counter()
+    compile_schema(load_telemetry_schema())
+    print(f"Şema okuma + derleme: {(time.perf_counter() - start) * 1e3:.2f} ms "
+          f"({len(TELEMETRY_SCHEMA)} grup)\n")
+
+    print(f"{count:,} satır")
+    before = measure("Önce: from_csv_line (elle)", count, legacy_from_csv_line, LINE)
+    after = measure("Sonra: from_csv_line (şemadan)", count, RocketData.from_csv_line, LINE)
+    print(f"Hızlanma: {before / after:.2f}x\n")
+
+    before = measure("Önce: to_dict (zip)", count, legacy_to_dict, record)
+    after = measure("Sonra: to_dict (şemadan)", count, RocketData.to_dict, record)
+    print(f"Hızlanma: {before / after:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
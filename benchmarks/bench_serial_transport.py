@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Seri Taşıma Katmanı Testi
+Çok sayıda sahte (pty) bağlantıya telemetri yazar ve seçici (selectors)
+tabanlı `SerialManager` ile tek olay döngülü `AsyncSerialManager` için
+okunan satır hızını ve çalışan thread sayısını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_serial_transport.py [baglanti_sayisi] [satir_sayisi]
+"""
+
+import os
+import pty
+import sys
+import threading
+import time
+import tty
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.ground_station.serial_communication import create_serial_manager
+
+LINE = b"42,1234.5,1230.0,39.5419883,28.0079479,210.0,1.5,-2.0,0.25,0.1,0.2,9.81,12.0,2\n"
+
+
+def open_links(count):
+    """`count` adet pty çifti açar, (yazıcı uç, port adı) listesi döndürür"""
+    links = []
+    for _ in range(count):
+        master, slave = pty.openpty()
+        tty.setraw(master)
+        tty.setraw(slave)
+        links.append((master, slave, os.ttyname(slave)))
+    return links
+
+
+def measure(transport, link_count, lines_per_link):
+    """Tüm satırlar okunana kadar geçen süreyi ve thread sayısını yazar"""
+    links = open_links(link_count)
+    manager = create_serial_manager(transport)
+    for index, (_, _, name) in enumerate(links):
+        link_id = f"link{index}"
+        manager.register_link(link_id, 'rocket')
+        manager.connect(name, 115200, link_id)
+        manager.start_reader(link_id)
+    threads = threading.active_count()
+
+    expected = link_count * lines_per_link
+    received = 0
+    wakeup = threading.Event()
+    done = threading.Event()
+    manager.frame_queue.set_notify(wakeup.set)
+
+    # Arayüz/arayüzsüz istasyon gibi kuyruğu bildirimle boşaltan tüketici
+    def consume():
+        nonlocal received
+        while not done.is_set():
+            if wakeup.wait(0.1):
+                wakeup.clear()
+            received += len(manager.get_frames())
+            if received >= expected:
+                done.set()
+
+    consumer = threading.Thread(target=consume, daemon=True)
+    burst = LINE * 10
+    start = time.perf_counter()
+    consumer.start()
+    for _ in range(lines_per_link // 10):
+        for master, _, _ in links:
+            os.write(master, burst)
+    done.wait(5.0)
+    elapsed = time.perf_counter() - start
+    done.set()
+    consumer.join()
+    dropped = manager.frame_queue.dropped
+
+    manager.close_all()
+    for master, slave, _ in links:
+        os.close(master)
+        os.close(slave)
+    print(f"{transport:<8} {link_count:>3} bağlantı  {threads:>3} thread  "
+          f"{received:>7}/{expected} satır  {dropped:>6} atılan  "
+          f"{received / elapsed:>10,.0f} satır/s")
+
+
+def main():
+    link_count = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    lines_per_link = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    for transport in ('thread', 'asyncio'):
+        measure(transport, link_count, lines_per_link)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Başlangıç Süresi Testi
+Arayüzü başlatır ve içe aktarma, Qt başlatma, pencere oluşturma, ilk çizim
+ve 3D görünüm sürelerini yazar. Toplam süre `STARTUP_BUDGET_MS` değerini
+aşarsa 1 ile çıkar; böylece CI'da başlangıç gerilemeleri yakalanır.
+
+Kullanım:
+    python benchmarks/bench_startup.py
+"""
+
+import os
+import sys
+import time
+
+started = time.perf_counter()
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from src.ground_station.main_window import (GroundStationMainWindow, StartupTimer,
+                                            STARTUP_BUDGET_MS)
+
+
+def main():
+    startup = StartupTimer(started)
+    startup.mark("içe aktarma")
+    app = QApplication(sys.argv)
+    startup.mark("Qt başlatma")
+
+    window = GroundStationMainWindow(startup)
+    window.show()
+
+    # Ertelenen başlangıç işleri bitince çık
+    original_finish = window.finish_startup
+
+    def finish_and_quit():
+        original_finish()
+        app.quit()
+
+    window.finish_startup = finish_and_quit
+    app.exec_()
+
+    for stage, duration in startup.stages:
+        print(f"{stage:<16} {duration:>7.1f} ms")
+    print(f"{'Toplam':<16} {startup.total_ms:>7.1f} ms (hedef {STARTUP_BUDGET_MS} ms)")
+    print(f"Yüklenen modüller: OpenGL={'OpenGL' in sys.modules}, "
+          f"numpy={'numpy' in sys.modules}, pandas={'pandas' in sys.modules}")
+
+    window.close()
+    sys.exit(0 if startup.total_ms <= STARTUP_BUDGET_MS else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Telemetri Kaydı Bellek/Ayırma Testi
+Eski `@dataclass` + `to_dict()` yolu ile tuple tabanlı `RocketData` yolunu
+çerçeve başına süre ve ayrılan bellek açısından karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_telemetry_records.py [cerceve_sayisi]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.ground_station.data_models import RocketData
+
+
+@dataclass
+class LegacyRocketData:
+    """Önceki sürümdeki `RocketData` (karşılaştırma için)"""
+    sayac: int = 0
+    MSIrtifa: float = 0.0
+    RoketGPSIrtifa: float = 0.0
+    Enlem: float = 0.0
+    Boylam: float = 0.0
+    Hiz: float = 0.0
+    Gx: float = 0.0
+    Gy: float = 0.0
+    Gz: float = 0.0
+    Ax: float = 0.0
+    Ay: float = 0.0
+    Az: float = 0.0
+    aci: float = 0.0
+    durum: int = 0
+
+    def to_dict(self):
+        return {
+            'sayac': self.sayac, 'MSIrtifa': self.MSIrtifa,
+            'RoketGPSIrtifa': self.RoketGPSIrtifa, 'Enlem': self.Enlem,
+            'Boylam': self.Boylam, 'Hiz': self.Hiz, 'Gx': self.Gx,
+            'Gy': self.Gy, 'Gz': self.Gz, 'Ax': self.Ax, 'Ay': self.Ay,
+            'Az': self.Az, 'aci': self.aci, 'durum': self.durum
+        }
+
+
+VALUES = (42, 1234.5, 1230.0, 39.5419883728027, 28.0079479217529, 210.0,
+          1.5, -2.0, 0.25, 0.1, 0.2, 9.81, 12.0, 2)
+
+
+def legacy_frame():
+    """Eski yol: dataclass + ekran için bir, HYI için bir `to_dict()`"""
+    record = LegacyRocketData(*VALUES)
+    for _ in record.to_dict().items():
+        pass
+    record.to_dict()
+    return record
+
+
+def slotted_frame():
+    """Yeni yol: tuple tabanlı kayıt, alanlara sözlüksüz erişim"""
+    record = RocketData(*VALUES)
+    for _ in zip(record._fields, record):
+        pass
+    record.MSIrtifa
+    return record
+
+
+def measure(name, count, frame):
+    """Çerçeve başına süreyi ve ayrılan/tutulan belleği yazar"""
+    start = time.perf_counter()
+    for _ in range(count):
+        frame()
+    elapsed = time.perf_counter() - start
+
+    # Çerçeve başına geçici ayırmalar (tepe) ve tutulan kayıt boyutu
+    tracemalloc.start()
+    frame()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    kept = [frame() for _ in range(10000)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    print(f"{name:<28} {elapsed / count * 1e6:>8.2f} µs/çerçeve  "
+          f"{peak:>6} B tepe  {retained / 10000:>7.1f} B/kayıt")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{count:,} çerçeve\n")
+    before = measure("Önce: dataclass + to_dict", count, legacy_frame)
+    after = measure("Sonra: NamedTuple", count, slotted_frame)
+    print(f"\nHızlanma: {before / after:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Telemetri Yayın Testi
+Yerel makinede 50 sahte aboneye (TCP, WebSocket, UDP ve hiç okumayan
+yavaş TCP aboneleri) anlık görüntü yayınlar. Yayın çağrısının süresini
+(veri thread'inin ne kadar bekletildiğini) ve abone başına teslim edilen
+ve birleştirilen anlık görüntü sayılarını yazar.
+
+Kullanım:
+    python benchmarks/bench_telemetry_server.py [anlik_goruntu_sayisi] [hiz_hz]
+"""
+
+import asyncio
+import base64
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.ground_station.data_models import TelemetryData, RocketData, PayloadData
+from src.ground_station.telemetry_server import TelemetryServer
+
+# Abone dağılımı (toplam 50)
+TCP_CLIENTS = 36
+WS_CLIENTS = 6
+UDP_CLIENTS = 4
+SLOW_CLIENTS = 4
+
+
+class Clients:
+    """Tüm sahte aboneleri tek bir olay döngüsünde çalıştırır"""
+
+    def __init__(self, ports):
+        self.ports = ports
+        self.received = {}
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.writers = []
+        self.tasks = []
+        self.stalled = []
+
+    def start(self):
+        asyncio.run_coroutine_threadsafe(self._start(), self.loop).result()
+
+    async def _start(self):
+        for index in range(TCP_CLIENTS):
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.ports['tcp'])
+            self.writers.append(writer)
+            self.tasks.append(self.loop.create_task(self._count_lines(f"tcp{index}", reader)))
+        for index in range(WS_CLIENTS):
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.ports['ws'])
+            self.writers.append(writer)
+            key = base64.b64encode(os.urandom(16))
+            writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+                         b"Connection: Upgrade\r\nSec-WebSocket-Version: 13\r\n"
+                         b"Sec-WebSocket-Key: " + key + b"\r\n\r\n")
+            await reader.readuntil(b'\r\n\r\n')
+            self.tasks.append(self.loop.create_task(self._count_ws_frames(f"ws{index}", reader)))
+        for index in range(UDP_CLIENTS):
+            name = f"udp{index}"
+            self.received[name] = 0
+            await self.loop.create_datagram_endpoint(
+                lambda name=name: UDPClient(self, name),
+                remote_addr=('127.0.0.1', self.ports['udp'])
+            )
+        for _ in range(SLOW_CLIENTS):
+            # Hiç okumayan abone: alma tamponu küçük, kısa sürede dolar
+            sock = socket.socket()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.connect(('127.0.0.1', self.ports['tcp']))
+            self.stalled.append(sock)
+        await asyncio.sleep(0.3)
+
+    async def _count_lines(self, name, reader):
+        self.received[name] = 0
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            self.received[name] += data.count(b'\n')
+
+    async def _count_ws_frames(self, name, reader):
+        self.received[name] = 0
+        while True:
+            try:
+                header = await reader.readexactly(2)
+            except asyncio.IncompleteReadError:
+                return
+            length = header[1] & 0x7F
+            if length == 126:
+                length = int.from_bytes(await reader.readexactly(2), 'big')
+            await reader.readexactly(length)
+            self.received[name] += 1
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self._close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    async def _close(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        for writer in self.writers:
+            writer.close()
+        for sock in self.stalled:
+            sock.close()
+
+
+class UDPClient(asyncio.DatagramProtocol):
+    """Abone olmak için bir datagram gönderen ve gelenleri sayan UDP abonesi"""
+
+    def __init__(self, clients, name):
+        self.clients = clients
+        self.name = name
+
+    def connection_made(self, transport):
+        transport.sendto(b'abone')
+
+    def datagram_received(self, data, address):
+        self.clients.received[self.name] += 1
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 5000.0
+
+    server = TelemetryServer(tcp_port=0, udp_port=0, ws_port=0, log=lambda message: None)
+    server.start()
+    clients = Clients(server.ports)
+    clients.start()
+    print(f"{len(server.subscribers) + len(server.udp.subscribers)} abone, "
+          f"{count} anlık görüntü, {rate:.0f} Hz\n")
+
+    telemetry = TelemetryData()
+    telemetry.payload = PayloadData(1000.0, 39.9, 32.8, 900.0, 21.5, 40.0)
+    durations = []
+    interval = 1.0 / rate
+    next_publish = time.perf_counter()
+    for counter in range(count):
+        telemetry.rocket = RocketData(counter, 1234.5, 1230.0, 39.9, 32.8, 210.0,
+                                      1.5, -2.0, 0.25, 0.1, 0.2, 9.81, 12.0, 2)
+        start = time.perf_counter()
+        server.publish(telemetry)
+        durations.append(time.perf_counter() - start)
+        next_publish += interval
+        delay = next_publish - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    time.sleep(0.5)
+
+    durations.sort()
+    print(f"publish: ort {statistics.mean(durations) * 1e6:.1f} µs, "
+          f"p99 {durations[int(len(durations) * 0.99)] * 1e6:.1f} µs, "
+          f"en fazla {durations[-1] * 1e3:.2f} ms")
+
+    stalled_names = {f"tcp:127.0.0.1:{sock.getsockname()[1]}" for sock in clients.stalled}
+    stalled = [subscriber for subscriber in server.subscribers
+               if subscriber.name in stalled_names]
+    for kind in ('tcp', 'ws', 'udp'):
+        counts = [value for name, value in clients.received.items() if name.startswith(kind)]
+        print(f"{kind:<4} {len(counts):>2} abone: teslim en az {min(counts)}, "
+              f"en çok {max(counts)} / {count}")
+    print(f"yavaş {len(stalled):>2} abone: gönderilen en çok "
+          f"{max((subscriber.sent for subscriber in stalled), default=0)}, "
+          f"birleştirilen {sum(subscriber.coalesced for subscriber in stalled)}")
+    stats = server.get_stats()
+    print(f"\ntoplam gönderilen {stats['sent']}, birleştirilen {stats['coalesced']}")
+
+    server.close()
+    clients.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ seri port üzerinden alır, işler ve görselleştirir.
 
 Kullanım:
     python main.py
+    python main.py --headless --rocket-port /dev/ttyUSB0 --record
 
 Gereksinimler:
     - Python 3.7+
@@ -23,7 +24,7 @@ import os
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from src.ground_station.main_window import main
+from src.ground_station.__main__ import main
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,9 +1,77 @@
 """
 Ground Station Ana Modülü
 Yer istasyonu uygulamasını başlatır.
+
+Kullanım:
+    python -m ground_station                       # arayüz
+    python -m ground_station --headless --rocket-port /dev/ttyUSB0 --record
 """
 
-from .main_window import main
+import argparse
+import sys
+import time
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Komut satırı argümanlarını ayrıştırır"""
+    parser = argparse.ArgumentParser(
+        prog="ground_station", description="Yer İstasyonu - Roket Telemetri Sistemi"
+    )
+    parser.add_argument('--headless', action='store_true',
+                        help="Arayüz olmadan çalıştır (Qt yüklenmez)")
+    parser.add_argument('--rocket-port', help="Roket telemetri portu")
+    parser.add_argument('--payload-port', help="Görev yükü telemetri portu")
+    parser.add_argument('--hyi-port', help="HYI çıkış portu")
+    parser.add_argument('--link', nargs=3, action='append', metavar=('KIMLIK', 'ROL', 'PORT'),
+                        help="Ek bağlantı (rol: rocket, payload, hyi); birden çok kez verilebilir")
+    parser.add_argument('--transport', choices=('thread', 'asyncio'), default='thread',
+                        help="Seri taşıma katmanı: bağlantı başına thread ya da tek asyncio döngüsü")
+    parser.add_argument('--baud', type=int, default=115200, help="Baud hızı (varsayılan: 115200)")
+    parser.add_argument('--hyi-rate', type=float, default=None,
+                        help="Otomatik HYI gönderim hızı (Hz)")
+    parser.add_argument('--team-id', type=int, default=0, help="HYI takım ID'si")
+    parser.add_argument('--record', nargs='?', const='', default=None, metavar='DOSYA',
+                        help="Uçuş kaydı yaz (dosya verilmezse recordings/ altına)")
+    parser.add_argument('--replay', metavar='DOSYA', help="Seri port yerine uçuş kaydını oynat")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Oynatma hızı çarpanı (0: olabildiğince hızlı)")
+    parser.add_argument('--serve-tcp', type=int, metavar='PORT',
+                        help="Anlık görüntüleri TCP abonelerine yayınla")
+    parser.add_argument('--serve-udp', type=int, metavar='PORT',
+                        help="Anlık görüntüleri UDP abonelerine yayınla")
+    parser.add_argument('--serve-ws', type=int, metavar='PORT',
+                        help="Anlık görüntüleri WebSocket abonelerine yayınla (JSON)")
+    parser.add_argument('--serve-host', default='127.0.0.1',
+                        help="Yayın adresi (varsayılan: yalnızca yerel)")
+    parser.add_argument('--serve-format', choices=('json', 'binary'), default='json',
+                        help="TCP/UDP yayın biçimi (varsayılan: json)")
+    parser.add_argument('--duration', type=float, default=None,
+                        help="Çalışma süresi (saniye)")
+    parser.add_argument('--stats-interval', type=float, default=5.0,
+                        help="İstatistik yazdırma aralığı (saniye)")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        args.speed = None
+    return args
+
+
+def main(argv=None):
+    """Argümanlara göre arayüzü ya da arayüzsüz istasyonu başlatır"""
+    started = time.perf_counter()
+    args = parse_args(argv)
+    if args.headless:
+        # Qt ve OpenGL yalnızca arayüz modunda içe aktarılır
+        from .headless import run_headless
+        sys.exit(run_headless(args))
+    
+    telemetry_server = None
+    if any(port is not None for port in (args.serve_tcp, args.serve_udp, args.serve_ws)):
+        from .telemetry_server import create_telemetry_server
+        telemetry_server = create_telemetry_server(args)
+    
+    from .main_window import main as gui_main
+    gui_main(started, args.transport, telemetry_server)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,384 @@
+"""
+Asenkron Seri Taşıma Modülü
+Tüm seri bağlantıları tek bir asyncio olay döngüsünde, bloklamadan okur ve yazar.
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import serial
+from serial.tools import list_ports
+
+from .serial_communication import (FrameQueue, SerialFrame, LinkRegistry, POLL_INTERVAL,
+                                   link_fileno)
+
+
+# Tek okumada alınacak en fazla bayt
+READ_CHUNK_SIZE = 4096
+
+# Bağlantı başına yazılmayı bekleyen en fazla bayt (geri basınç sınırı)
+DEFAULT_WRITE_LIMIT = 64 * 1024
+
+# `connect` çağrısının port açılmasını bekleyeceği en uzun süre (saniye)
+OPEN_TIMEOUT = 2.0
+
+
+class SerialLink:
+    """Olay döngüsündeki tek bir seri bağlantının durumu"""
+    
+    def __init__(self, link_id: str, connection, decoder, write_limit: int):
+        self.link_id = link_id
+        self.connection = connection
+        self.fd = link_fileno(connection)
+        self.reading = False
+        self.decoder = decoder
+        self.write_queue: deque = deque()
+        self.write_limit = write_limit
+        self.pending_bytes = 0
+        self.writer_registered = False
+        self.poll_task: Optional[asyncio.Task] = None
+        self.drain_task: Optional[asyncio.Task] = None
+        
+        # İstatistikler
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.lines = 0
+        self.write_drops = 0
+
+
+class AsyncSerialManager(LinkRegistry):
+    """
+    Tek olay döngüsüyle çalışan seri port yöneticisi.
+    
+    `SerialManager` ile aynı arayüzü sunar, ancak bağlantı başına thread
+    açmaz: olay döngüsü kendi thread'inde çalışır, POSIX'te portların dosya
+    tanımlayıcıları `add_reader`/`add_writer` ile izlenir, diğer bağlantılar
+    kısa aralıklarla yoklanır. Portlar zaman aşımı sıfır ile açılır; hiçbir
+    okuma ya da yazma döngüyü bekletmez.
+    
+    Yazmalar bağlantının kuyruğuna eklenir ve port yazılabilir oldukça
+    boşaltılır (tanımlayıcısı olmayan bağlantılarda yürütücü thread'inde).
+    Bekleyen bayt `write_limit` değerini aşarsa `write_data` paketi atıp
+    False döndürür; takılan bir port diğer bağlantıları ve çağıran
+    thread'i durdurmaz.
+    """
+    
+    def __init__(self, write_limit: int = DEFAULT_WRITE_LIMIT):
+        """
+        Args:
+            write_limit: Bağlantı başına bekleyen en fazla yazma baytı
+        """
+        super().__init__()
+        self.links: Dict[str, SerialLink] = {}
+        self.frame_queue = FrameQueue()
+        self.write_limit = write_limit
+        # Okunan her satırı diske yazan kaydedici (`FlightRecorder`)
+        self.recorder = None
+        self._pending_lock = threading.Lock()
+        
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="SerialLoop", daemon=True)
+        self._thread.start()
+    
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+    
+    @property
+    def readers(self) -> Dict[str, SerialLink]:
+        """Okuması açık bağlantılar (`SerialManager.readers` karşılığı)"""
+        return {link_id: link for link_id, link in self.links.items() if link.reading}
+    
+    def get_available_ports(self) -> List[str]:
+        """Mevcut seri portları listeler"""
+        ports = list_ports.comports()
+        return [port.device for port in ports]
+    
+    def connect_async(self, port_name: str, baud_rate: int, connection_type: str,
+                      callback: Optional[Callable[[bool], None]] = None
+                      ) -> concurrent.futures.Future:
+        """
+        Porta bloklamadan bağlanır
+        
+        Args:
+            port_name: Port adı ya da pyserial URL'si (örn: 'loop://')
+            baud_rate: Baud hızı
+            connection_type: Bağlantı kimliği (`register_link` ile tanımlanmış)
+            callback: Sonuçla (bool) olay döngüsü thread'inde çağrılır
+        
+        Returns:
+            Future: Bağlantı sonucu (bool)
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._open(port_name, baud_rate, connection_type), self.loop
+        )
+        if callback:
+            future.add_done_callback(
+                lambda done: callback(not done.cancelled() and done.exception() is None
+                                      and done.result())
+            )
+        return future
+    
+    def connect(self, port_name: str, baud_rate: int, connection_type: str) -> bool:
+        """
+        Porta bağlanır ve sonucu `OPEN_TIMEOUT` kadar bekler
+        
+        Zaman aşımında açma iptal edilir; port sonradan açılırsa bağlantı
+        kaydedilmeden kapatılır.
+        
+        Returns:
+            bool: Bağlantı başarılı ise True
+        """
+        future = self.connect_async(port_name, baud_rate, connection_type)
+        try:
+            return future.result(OPEN_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            if not future.cancel():
+                # İptalden hemen önce tamamlandı
+                return future.result()
+            print(f"Seri port bağlantı zaman aşımı ({connection_type}): {port_name}")
+            return False
+    
+    def disconnect(self, connection_type: str) -> bool:
+        """
+        Bağlantıyı kapatır (kapanış olay döngüsünde yapılır)
+        
+        Returns:
+            bool: Bağlantı vardı ise True
+        """
+        link = self.links.get(connection_type)
+        if link is None:
+            return False
+        self.loop.call_soon_threadsafe(self._close, link)
+        return True
+    
+    def is_connected(self, connection_type: str) -> bool:
+        """Bağlantı durumunu kontrol eder"""
+        link = self.links.get(connection_type)
+        return bool(link and link.connection.is_open)
+    
+    def start_reader(self, connection_type: str) -> bool:
+        """
+        Bağlantıdan gelen satırları `frame_queue` kuyruğuna iletmeye başlar
+        
+        Returns:
+            bool: Bağlantı açık ise True
+        """
+        link = self.links.get(connection_type)
+        if link is None:
+            return False
+        link.reading = True
+        return True
+    
+    def stop_reader(self, connection_type: str):
+        """Bağlantının satırlarını kuyruğa iletmeyi durdurur"""
+        link = self.links.get(connection_type)
+        if link:
+            link.reading = False
+    
+    def get_frames(self) -> List[SerialFrame]:
+        """Biriken tüm çerçeveleri döndürür"""
+        return self.frame_queue.drain()
+    
+    def write_data(self, connection_type: str, data: bytes) -> bool:
+        """
+        Veriyi bağlantının yazma kuyruğuna ekler
+        
+        Args:
+            connection_type: Bağlantı türü
+            data: Yazılacak veri
+        
+        Returns:
+            bool: Kuyruğa eklendi ise True, bağlantı yoksa ya da sınır aşıldıysa False
+        """
+        link = self.links.get(connection_type)
+        if link is None or not link.connection.is_open:
+            return False
+        data = bytes(data)
+        with self._pending_lock:
+            if link.pending_bytes + len(data) > link.write_limit:
+                link.write_drops += 1
+                return False
+            link.pending_bytes += len(data)
+        self.loop.call_soon_threadsafe(self._enqueue, link, data)
+        return True
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Bağlantı başına okuma/yazma istatistiklerini döndürür"""
+        return {
+            link_id: {
+                'bytes_read': link.bytes_read,
+                'bytes_written': link.bytes_written,
+                'lines': link.lines,
+                'pending_bytes': link.pending_bytes,
+                'write_drops': link.write_drops
+            }
+            for link_id, link in list(self.links.items())
+        }
+    
+    def close_all(self):
+        """Tüm bağlantıları kapatır ve olay döngüsünü durdurur"""
+        if not self.loop.is_running():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._close_all(), self.loop)
+        try:
+            future.result(OPEN_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            print("Seri bağlantılar zamanında kapatılamadı")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=OPEN_TIMEOUT)
+    
+    # Olay döngüsü tarafı
+    
+    async def _open(self, port_name: str, baud_rate: int, connection_type: str) -> bool:
+        if connection_type not in self.link_configs:
+            print(f"Tanımsız bağlantı: {connection_type}")
+            return False
+        old = self.links.get(connection_type)
+        if old:
+            self._close(old)
+        # Port açma (ör. USB dönüştürücü takılırsa) döngüyü bekletmesin
+        opening = self.loop.run_in_executor(
+            None, lambda: serial.serial_for_url(
+                port_name, baud_rate, timeout=0, write_timeout=0
+            )
+        )
+        try:
+            connection = await asyncio.shield(opening)
+        except asyncio.CancelledError:
+            # Açma iptal edildi (zaman aşımı); port sonradan açılırsa kapatılır
+            opening.add_done_callback(self._close_abandoned)
+            raise
+        except (serial.SerialException, ValueError, OSError) as e:
+            print(f"Seri port bağlantı hatası ({connection_type}): {e}")
+            return False
+        
+        link = SerialLink(connection_type, connection, self.create_decoder(connection_type),
+                          self.write_limit)
+        self.links[connection_type] = link
+        if link.fd is not None:
+            self.loop.add_reader(link.fd, self._read, link)
+        else:
+            # Yazmalar yürütücüde yapılır; sıfır zaman aşımı kısmi yazmayı bildiremez
+            connection.write_timeout = None
+            link.poll_task = self.loop.create_task(self._poll(link))
+        return True
+    
+    @staticmethod
+    def _close_abandoned(opening: asyncio.Future):
+        if opening.cancelled() or opening.exception() is not None:
+            return
+        try:
+            opening.result().close()
+        except (serial.SerialException, OSError) as e:
+            print(f"Seri port kapatma hatası: {e}")
+    
+    async def _poll(self, link: SerialLink):
+        while link.connection.is_open:
+            self._read(link)
+            await asyncio.sleep(POLL_INTERVAL)
+    
+    def _read(self, link: SerialLink):
+        connection = link.connection
+        try:
+            chunk = connection.read(connection.in_waiting or READ_CHUNK_SIZE)
+        except (serial.SerialException, OSError) as e:
+            print(f"Veri okuma hatası ({link.link_id}): {e}")
+            self._close(link)
+            return
+        if not chunk:
+            return
+        link.bytes_read += len(chunk)
+        lines = link.decoder.feed(chunk)
+        if not lines or not link.reading:
+            return
+        
+        # Aynı okumada gelen satırlar aynı zaman damgasını paylaşır
+        link.lines += len(lines)
+        timestamp = time.time()
+        monotonic = time.monotonic()
+        recorder = self.recorder
+        for line in lines:
+            if recorder:
+                recorder.record(link.link_id, line, timestamp)
+            self.frame_queue.put(SerialFrame(link.link_id, line, timestamp, monotonic))
+    
+    def _enqueue(self, link: SerialLink, data: bytes):
+        link.write_queue.append(data)
+        if len(link.write_queue) == 1 and not link.writer_registered:
+            self._flush(link)
+    
+    def _flush(self, link: SerialLink):
+        """Kuyruğu port kabul ettiği kadar boşaltır, kalan için yazılabilirliği bekler"""
+        if link.fd is None:
+            if link.drain_task is None or link.drain_task.done():
+                link.drain_task = self.loop.create_task(self._drain(link))
+            return
+        
+        while link.write_queue:
+            data = link.write_queue[0]
+            try:
+                written = os.write(link.fd, data)
+            except BlockingIOError:
+                written = 0
+            except (serial.SerialException, OSError) as e:
+                print(f"Veri yazma hatası ({link.link_id}): {e}")
+                self._close(link)
+                return
+            
+            link.bytes_written += written
+            with self._pending_lock:
+                link.pending_bytes -= written
+            if written < len(data):
+                link.write_queue[0] = data[written:]
+                if not link.writer_registered:
+                    self.loop.add_writer(link.fd, self._flush, link)
+                    link.writer_registered = True
+                return
+            link.write_queue.popleft()
+        
+        if link.writer_registered:
+            self.loop.remove_writer(link.fd)
+            link.writer_registered = False
+    
+    async def _drain(self, link: SerialLink):
+        """Tanımlayıcısı olmayan bağlantının kuyruğunu yürütücüde yazar"""
+        while link.write_queue:
+            data = link.write_queue.popleft()
+            try:
+                await self.loop.run_in_executor(None, link.connection.write, data)
+            except (serial.SerialException, OSError) as e:
+                print(f"Veri yazma hatası ({link.link_id}): {e}")
+                self._close(link)
+                return
+            link.bytes_written += len(data)
+            with self._pending_lock:
+                link.pending_bytes -= len(data)
+    
+    def _close(self, link: SerialLink):
+        if self.links.get(link.link_id) is link:
+            del self.links[link.link_id]
+        if link.fd is not None:
+            self.loop.remove_reader(link.fd)
+            if link.writer_registered:
+                self.loop.remove_writer(link.fd)
+                link.writer_registered = False
+        for task in (link.poll_task, link.drain_task):
+            if task:
+                task.cancel()
+        link.write_queue.clear()
+        with self._pending_lock:
+            link.pending_bytes = 0
+        try:
+            link.connection.close()
+        except (serial.SerialException, OSError) as e:
+            print(f"Seri port kapatma hatası ({link.link_id}): {e}")
+    
+    async def _close_all(self):
+        for link in list(self.links.values()):
+            self._close(link)
@@ -3,138 +3,57 @@ Veri Modelleri
 Roket ve görev yükü verilerini temsil eden sınıflar.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple
 import json
+import os
 
+from .telemetry_codec import compile_schema
 
-@dataclass
-class RocketData:
-    """Roket telemetri verileri"""
-    sayac: int = 0
-    MSIrtifa: float = 0.0
-    RoketGPSIrtifa: float = 0.0
-    Enlem: float = 0.0
-    Boylam: float = 0.0
-    Hiz: float = 0.0
-    Gx: float = 0.0
-    Gy: float = 0.0
-    Gz: float = 0.0
-    Ax: float = 0.0
-    Ay: float = 0.0
-    Az: float = 0.0
-    aci: float = 0.0
-    durum: int = 0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Sözlük formatına dönüştürür"""
-        return {
-            'sayac': self.sayac,
-            'MSIrtifa': self.MSIrtifa,
-            'RoketGPSIrtifa': self.RoketGPSIrtifa,
-            'Enlem': self.Enlem,
-            'Boylam': self.Boylam,
-            'Hiz': self.Hiz,
-            'Gx': self.Gx,
-            'Gy': self.Gy,
-            'Gz': self.Gz,
-            'Ax': self.Ax,
-            'Ay': self.Ay,
-            'Az': self.Az,
-            'aci': self.aci,
-            'durum': self.durum
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'RocketData':
-        """Sözlükten nesne oluşturur"""
-        return cls(**data)
-    
-    @classmethod
-    def from_csv_line(cls, line: str) -> 'RocketData':
-        """CSV satırından nesne oluşturur"""
-        values = line.strip().split(',')
-        if len(values) >= 14:
-            return cls(
-                sayac=int(values[0]),
-                MSIrtifa=float(values[1]),
-                RoketGPSIrtifa=float(values[2]),
-                Enlem=float(values[3]),
-                Boylam=float(values[4]),
-                Hiz=float(values[5]),
-                Gx=float(values[6]),
-                Gy=float(values[7]),
-                Gz=float(values[8]),
-                Ax=float(values[9]),
-                Ay=float(values[10]),
-                Az=float(values[11]),
-                aci=float(values[12]),
-                durum=int(values[13])
-            )
-        return cls()
-
-
-@dataclass
-class PayloadData:
-    """Görev yükü telemetri verileri"""
-    GorevYukuIrtifa: float = 0.0
-    GorevYukuEnlem: float = 0.0
-    GorevYukuBoylam: float = 0.0
-    GorevYukuBasinc: float = 0.0
-    GorevYukuSicaklik: float = 0.0
-    GorevYukuNem: float = 0.0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Sözlük formatına dönüştürür"""
-        return {
-            'GorevYukuIrtifa': self.GorevYukuIrtifa,
-            'GorevYukuEnlem': self.GorevYukuEnlem,
-            'GorevYukuBoylam': self.GorevYukuBoylam,
-            'GorevYukuBasinc': self.GorevYukuBasinc,
-            'GorevYukuSicaklik': self.GorevYukuSicaklik,
-            'GorevYukuNem': self.GorevYukuNem
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'PayloadData':
-        """Sözlükten nesne oluşturur"""
-        return cls(**data)
+
+# Telemetri alanlarını tanımlayan şema dosyası
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'data', 'telemetry_schema.json'
+)
+
+
+def load_telemetry_schema(path: str = SCHEMA_PATH) -> Dict[str, Any]:
+    """Telemetri şemasını JSON dosyasından okur"""
+    with open(path, encoding='utf-8') as schema_file:
+        return json.load(schema_file)
+
+
+# Şema bir kez okunur ve grupları kodlayıcılara derlenir; kayıt alanları,
+# CSV ayrıştırma ve sözlük çıktısı buradan gelir
+TELEMETRY_SCHEMA = load_telemetry_schema()
+SCHEMA_CODECS = compile_schema(TELEMETRY_SCHEMA)
+
+
+class RocketData(SCHEMA_CODECS['rocket'].record_base):
+    """Roket telemetri verileri (alanlar şemanın 'rocket' grubundan)"""
+    __slots__ = ()
     
-    @classmethod
-    def from_csv_line(cls, line: str) -> 'PayloadData':
-        """CSV satırından nesne oluşturur"""
-        values = line.strip().split(',')
-        if len(values) >= 6:
-            return cls(
-                GorevYukuIrtifa=float(values[0]),
-                GorevYukuEnlem=float(values[1]),
-                GorevYukuBoylam=float(values[2]),
-                GorevYukuBasinc=float(values[3]),
-                GorevYukuSicaklik=float(values[4]),
-                GorevYukuNem=float(values[5])
-            )
-        return cls()
-
-
-@dataclass
-class BMP280Data:
-    """BMP280 sensör verileri"""
-    sicaklik: float = 0.0
-    basinc: float = 0.0
-    yukseklik: float = 0.0
+    to_dict = SCHEMA_CODECS['rocket'].to_dict
+    from_csv_line = classmethod(SCHEMA_CODECS['rocket'].parse)
+    # Değerler şemadaki tiplere çevrilir (JSON'daki `12.0` tamsayı alanında 12 olur)
+    from_dict = classmethod(SCHEMA_CODECS['rocket'].from_dict)
+
+
+class PayloadData(SCHEMA_CODECS['payload'].record_base):
+    """Görev yükü telemetri verileri (alanlar şemanın 'payload' grubundan)"""
+    __slots__ = ()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Sözlük formatına dönüştürür"""
-        return {
-            'sicaklik': self.sicaklik,
-            'basinc': self.basinc,
-            'yukseklik': self.yukseklik
-        }
+    to_dict = SCHEMA_CODECS['payload'].to_dict
+    from_csv_line = classmethod(SCHEMA_CODECS['payload'].parse)
+    from_dict = classmethod(SCHEMA_CODECS['payload'].from_dict)
+
+
+class BMP280Data(SCHEMA_CODECS['bmp280'].record_base):
+    """BMP280 sensör verileri (alanlar şemanın 'bmp280' grubundan)"""
+    __slots__ = ()
     
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'BMP280Data':
-        """Sözlükten nesne oluşturur"""
-        return cls(**data)
+    to_dict = SCHEMA_CODECS['bmp280'].to_dict
+    from_dict = classmethod(SCHEMA_CODECS['bmp280'].from_dict)
     
     @classmethod
     def from_json(cls, json_str: str) -> 'BMP280Data':
@@ -146,6 +65,27 @@ class BMP280Data:
             return cls()
 
 
+class HYIPacket(NamedTuple):
+    """Çözülmüş HYI paketi"""
+    team_id: int = 0
+    counter: int = 0
+    MSIrtifa: float = 0.0
+    RoketGPSIrtifa: float = 0.0
+    Enlem: float = 0.0
+    Boylam: float = 0.0
+    GorevYukuIrtifa: float = 0.0
+    GorevYukuEnlem: float = 0.0
+    GorevYukuBoylam: float = 0.0
+    Gx: float = 0.0
+    Gy: float = 0.0
+    Gz: float = 0.0
+    Ax: float = 0.0
+    Ay: float = 0.0
+    Az: float = 0.0
+    aci: float = 0.0
+    durum: int = 0
+
+
 class TelemetryData:
     """Tüm telemetri verilerini yöneten ana sınıf"""
     
@@ -0,0 +1,301 @@
+"""
+Uçuş Kaydedici
+Gelen ham telemetri satırlarını sabit uzunluklu kayıtlar halinde diske yazar
+ve kayıt dosyalarını bellek eşlemeli (memory-mapped) olarak okur.
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# Dosya başlığı: sihirli değer, sürüm, kayıt uzunluğu
+FILE_MAGIC = b'GSREC\x00'
+FILE_VERSION = 2
+HEADER_STRUCT = struct.Struct('<6sHH6x')
+
+# Sürüm 2'de başlığı bağlantı adı tablosu izler (ID başına sabit uzunluklu,
+# sıfırla doldurulmuş UTF-8 ad); sürüm 1'de adlar veri kayıtlarının arasına
+# meta kayıtları olarak yazılır
+LINK_NAME_SIZE = 64
+LINK_TABLE_OFFSET = HEADER_STRUCT.size
+HEADER_SIZES = {1: HEADER_STRUCT.size, 2: 16384}
+HEADER_SIZE = HEADER_SIZES[FILE_VERSION]
+
+# Kayıt: alınma zamanı, bağlantı ID, ham satır uzunluğu, ham satır
+RECORD_SIZE = 256
+RECORD_STRUCT = struct.Struct('<dBxH')
+RECORD_DATA_SIZE = RECORD_SIZE - RECORD_STRUCT.size
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('link', 'u1'),
+    ('reserved', 'u1'),
+    ('length', '<u2'),
+    ('data', 'u1', (RECORD_DATA_SIZE,))
+])
+
+# Bağlantı adlarını tanımlayan meta kayıtların bağlantı ID'si (sürüm 1);
+# aynı zamanda bir dosyadaki en fazla bağlantı sayısı
+LINK_META_ID = 255
+
+# Uçuş kayıtlarının varsayılan dizini
+RECORDINGS_DIR = 'recordings'
+RECORDING_EXTENSION = '.gsrec'
+
+
+def default_recording_path(directory: str = RECORDINGS_DIR) -> str:
+    """Zaman damgalı yeni bir kayıt dosyası yolu döndürür"""
+    os.makedirs(directory, exist_ok=True)
+    name = time.strftime('ucus_%Y%m%d_%H%M%S') + RECORDING_EXTENSION
+    return os.path.join(directory, name)
+
+
+class FlightRecorder:
+    """
+    Ham satırları zaman damgası ve bağlantı ID'si ile dosyaya ekleyen kaydedici.
+    
+    Kayıtlar bellekte biriktirilir ve `batch_size` kayda ya da
+    `flush_interval` süresine ulaşıldığında tek `write()` ile yazılır.
+    Birden çok okuyucu thread'den aynı anda çağrılabilir.
+    """
+    
+    def __init__(self, path: str, batch_size: int = 64, flush_interval: float = 1.0):
+        """
+        Args:
+            path: Kayıt dosyası (varsa sonuna eklenir)
+            batch_size: Diske yazmadan önce biriktirilecek kayıt sayısı
+            flush_interval: Biriken kayıtların en fazla bekleme süresi (saniye)
+        
+        Raises:
+            ValueError: Var olan dosyanın başlığı bu sürümle uyumsuz ise
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self.version = FILE_VERSION
+        self._link_ids: Dict[str, int] = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER_STRUCT.size:
+            # Önceki kayıttaki bağlantı ID'lerini ve dosya sürümünü koru
+            log = FlightLog(path)
+            self.version = log.version
+            self._link_ids = {name: link_id for link_id, name in log.links.items()}
+            size = log.header_size + len(log.records) * RECORD_SIZE
+            del log
+            # Çökme sonrası yarım kalan son kaydı at; yoksa sonraki tüm
+            # kayıtlar kayar
+            self._file = open(path, 'r+b')
+            self._file.truncate(size)
+            self._file.seek(size)
+        else:
+            self._file = open(path, 'wb')
+            header = HEADER_STRUCT.pack(FILE_MAGIC, FILE_VERSION, RECORD_SIZE)
+            self._file.write(header.ljust(HEADER_SIZE, b'\x00'))
+            self._file.flush()
+    
+    def record(self, link: str, raw: bytes, timestamp: Optional[float] = None):
+        """
+        Tek bir ham satırı kaydeder
+        
+        Args:
+            link: Bağlantı adı (örn. 'rocket')
+            raw: Ham satır (uzunsa kırpılır, gerçek uzunluk saklanır)
+            timestamp: Alınma zamanı (None ise şimdiki zaman)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            link_id = self._link_ids.get(link)
+            if link_id is None:
+                link_id = self._register_link(link, timestamp)
+            self._append(timestamp, link_id, raw)
+            if (self._pending >= self.batch_size or
+                    time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+    
+    def record_frame(self, frame):
+        """Okuyucudan gelen `SerialFrame` nesnesini kaydeder"""
+        self.record(frame.connection_type, frame.raw, frame.timestamp)
+    
+    def flush(self):
+        """Biriken kayıtları diske yazar"""
+        with self._lock:
+            self._flush()
+    
+    def close(self):
+        """Biriken kayıtları yazar ve dosyayı kapatır"""
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+                self._file.close()
+    
+    def _register_link(self, link: str, timestamp: float) -> int:
+        """Yeni bağlantıya ID atar ve adını başlıktaki tabloya (ya da meta kaydına) yazar"""
+        link_id = len(self._link_ids)
+        if link_id >= LINK_META_ID:
+            raise ValueError(f"Kayıt dosyasında en fazla {LINK_META_ID} bağlantı olabilir")
+        self._link_ids[link] = link_id
+        name = link.encode('utf-8')
+        if self.version == 1:
+            self._append(timestamp, LINK_META_ID, bytes([link_id]) + name)
+            return link_id
+        # Bağlantının kayıtlarından önce diske yazılır; uzun adlar kırpılır
+        end = self._file.tell()
+        self._file.seek(LINK_TABLE_OFFSET + link_id * LINK_NAME_SIZE)
+        self._file.write(name[:LINK_NAME_SIZE].ljust(LINK_NAME_SIZE, b'\x00'))
+        self._file.seek(end)
+        self._file.flush()
+        return link_id
+    
+    def _append(self, timestamp: float, link_id: int, raw: bytes):
+        """Kaydı yazma tamponuna ekler"""
+        record = bytearray(RECORD_SIZE)
+        RECORD_STRUCT.pack_into(record, 0, timestamp, link_id, min(len(raw), 0xFFFF))
+        data = raw[:RECORD_DATA_SIZE]
+        record[RECORD_STRUCT.size:RECORD_STRUCT.size + len(data)] = data
+        self._buffer += record
+        self._pending += 1
+    
+    def _flush(self):
+        if self._buffer and not self._file.closed:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self.records_written += self._pending
+            self._buffer.clear()
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+
+class FlightLog:
+    """
+    Kayıt dosyasını belleğe yüklemeden okuyan bellek eşlemeli okuyucu.
+    
+    Kayıtlar sabit uzunlukta olduğundan her kayda doğrudan erişilir; çok
+    GB'lık dosyalar da anında açılır. Bağlantı tablosu başlıktan okunur;
+    sürüm 1 dosyalarında ilk ihtiyaç duyulduğunda bağlantı sütunu taranarak
+    meta kayıtlarından çıkarılır. Yarım yazılmış son kayıt yok sayılır.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as log_file:
+            magic, version, record_size = HEADER_STRUCT.unpack(
+                log_file.read(HEADER_STRUCT.size))
+            if magic != FILE_MAGIC:
+                raise ValueError(f"Geçersiz kayıt dosyası: {path}")
+            if version not in HEADER_SIZES:
+                raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+            if record_size != RECORD_SIZE:
+                raise ValueError(f"Desteklenmeyen kayıt uzunluğu: {record_size}")
+            self.version = version
+            self.header_size = HEADER_SIZES[version]
+            link_table = log_file.read(self.header_size - HEADER_STRUCT.size)
+        
+        count = max(os.path.getsize(path) - self.header_size, 0) // RECORD_SIZE
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r',
+                                     offset=self.header_size, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        
+        self._links: Optional[Dict[int, str]] = None
+        self._data_indices: Optional[np.ndarray] = None
+        if version >= 2:
+            # Meta kaydı yok; veri kaydı sıra numarası dosyadaki sıra numarasıdır
+            self._links = {}
+            for link_id in range(len(link_table) // LINK_NAME_SIZE):
+                name = link_table[link_id * LINK_NAME_SIZE:(link_id + 1) * LINK_NAME_SIZE]
+                name = name.rstrip(b'\x00')
+                if name:
+                    self._links[link_id] = name.decode('utf-8', errors='ignore')
+    
+    @property
+    def links(self) -> Dict[int, str]:
+        """Bağlantı ID -> bağlantı adı tablosu"""
+        if self._links is None:
+            self._build_index()
+        return self._links
+    
+    @property
+    def data_indices(self) -> Optional[np.ndarray]:
+        """
+        Meta olmayan kayıtların dosyadaki sıra numaraları (sürüm 1)
+        
+        Sürüm 2 dosyalarında her kayıt veri kaydı olduğundan None döner.
+        """
+        if self._data_indices is None and self.version == 1:
+            self._build_index()
+        return self._data_indices
+    
+    def _build_index(self):
+        """Bağlantı tablosunu ve veri kayıtlarının dizinini meta kayıtlarından çıkarır"""
+        link_column = self.records['link']
+        self._links = {}
+        for index in np.flatnonzero(link_column == LINK_META_ID):
+            raw = self._raw(self.records[index])
+            self._links[raw[0]] = raw[1:].decode('utf-8', errors='replace')
+        self._data_indices = np.flatnonzero(link_column != LINK_META_ID)
+    
+    def _record_index(self, index):
+        """Veri kaydı sıra numarasını (ya da dilimini) dosyadaki sıra numarasına çevirir"""
+        data_indices = self.data_indices
+        return index if data_indices is None else data_indices[index]
+    
+    def __len__(self) -> int:
+        data_indices = self.data_indices
+        return len(self.records) if data_indices is None else data_indices.size
+    
+    def __getitem__(self, index: int) -> Tuple[float, str, bytes]:
+        """`index`. veri kaydını (zaman, bağlantı, ham satır) olarak döndürür"""
+        record = self.records[self._record_index(index)]
+        return (float(record['timestamp']),
+                self.links.get(int(record['link']), str(record['link'])),
+                self._raw(record))
+    
+    def data_records(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """`start`-`stop` aralığındaki veri kayıtlarını (`RECORD_DTYPE`) döndürür"""
+        return self.records[self._record_index(slice(start, stop))]
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Veri kayıtlarının alınma zamanları"""
+        return self.data_records()['timestamp']
+    
+    @property
+    def duration(self) -> float:
+        """Kaydın süresi (saniye)"""
+        if not len(self):
+            return 0.0
+        return self[-1][0] - self[0][0]
+    
+    def indices_for(self, link: str) -> np.ndarray:
+        """Bir bağlantıya ait veri kayıtlarının sıra numaralarını döndürür"""
+        link_ids = [link_id for link_id, name in self.links.items() if name == link]
+        if not link_ids:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(self.data_records()['link'] == link_ids[0])
+    
+    def iter_records(self, start: int = 0, stop: Optional[int] = None
+                     ) -> Iterator[Tuple[float, str, bytes]]:
+        """Veri kayıtlarını sırayla döndürür"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(start, stop):
+            yield self[index]
+    
+    def truncated(self) -> List[int]:
+        """Satırı kayıt uzunluğuna sığmayıp kırpılan veri kayıtları"""
+        lengths = self.data_records()['length']
+        return np.flatnonzero(lengths > RECORD_DATA_SIZE).tolist()
+    
+    def _raw(self, record) -> bytes:
+        length = min(int(record['length']), RECORD_DATA_SIZE)
+        return record['data'][:length].tobytes()
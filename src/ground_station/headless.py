@@ -0,0 +1,385 @@
+"""
+Arayüzsüz Yer İstasyonu
+Seri okuma, ayrıştırma, uçuş kaydı ve HYI gönderimini Qt yüklemeden çalıştırır.
+Röle bilgisayarlarında ve CI yük testlerinde kullanılır.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .serial_communication import create_serial_manager, HYITransmitter
+from .data_models import TelemetryData, RocketData, PayloadData
+from .telemetry_history import TelemetryHistory, schema_fields
+from .telemetry_parser import parse_csv_batch
+from .flight_recorder import FlightRecorder, default_recording_path
+from .replay import ReplaySource
+from .telemetry_server import create_telemetry_server
+from .link_stats import LinkStats
+
+
+# Ayrıştırılan telemetri bağlantıları ve kayıt tipleri
+TELEMETRY_RECORDS = {
+    'rocket': RocketData,
+    'payload': PayloadData
+}
+
+# Varsayılan istatistik yazdırma aralığı (saniye)
+DEFAULT_STATS_INTERVAL = 5.0
+
+
+def log(message: str):
+    """Zaman damgalı durum satırı yazar"""
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+class HeadlessGroundStation:
+    """
+    Arayüzsüz yer istasyonu.
+    
+    Okuyucu thread'ler çerçeveleri `FrameQueue`'ya bırakır; ana döngü kuyruk
+    boş değilken uyanır, satırları bağlantı başına toplu ayrıştırıp geçmişe
+    ekler ve en son anlık görüntüyü HYI vericisine iletir. İstatistikler
+    belirli aralıklarla yazdırılır.
+    
+    Ek bağlantılar (örn. ikinci roket) kendi kimlikleriyle ayrı geçmiş
+    gruplarına yazılır; HYI'ya yalnızca varsayılan 'rocket' ve 'payload'
+    bağlantıları iletilir. 'hyi' rolündeki ek bağlantılar dinlenir ve
+    doğrulanan paketler sayılır.
+    """
+    
+    def __init__(self, ports: Dict[str, str], baud_rate: int = 115200,
+                 hyi_rate: Optional[float] = None, team_id: int = 0,
+                 record: Optional[str] = None, replay: Optional[str] = None,
+                 replay_speed: Optional[float] = 1.0,
+                 stats_interval: float = DEFAULT_STATS_INTERVAL, transport: str = 'thread',
+                 links: Sequence[Tuple[str, str, str]] = (), telemetry_server=None):
+        """
+        Args:
+            ports: Bağlantı türü -> port adı ('rocket', 'payload', 'hyi')
+            baud_rate: Tüm portlar için baud hızı
+            hyi_rate: Otomatik HYI gönderim hızı (Hz, None ise kapalı)
+            team_id: HYI takım ID'si
+            record: Uçuş kaydı dosyası ('' ise varsayılan yol, None ise kapalı)
+            replay: Seri portlar yerine oynatılacak uçuş kaydı
+            replay_speed: Oynatma hızı çarpanı (None ise en hızlı)
+            stats_interval: İstatistik yazdırma aralığı (saniye)
+            transport: Seri taşıma katmanı ('thread' ya da 'asyncio')
+            links: Ek bağlantılar (kimlik, rol, port)
+            telemetry_server: Anlık görüntüleri yayınlayan `TelemetryServer` (isteğe bağlı)
+        
+        Raises:
+            ValueError: Ek bağlantının rolü geçersiz ise
+        """
+        self.ports = dict(ports)
+        self.baud_rate = baud_rate
+        self.hyi_rate = hyi_rate
+        self.team_id = team_id
+        self.record_path = record
+        self.replay_path = replay
+        self.replay_speed = replay_speed
+        self.stats_interval = stats_interval
+        
+        self.serial_manager = create_serial_manager(transport)
+        self.telemetry_data = TelemetryData()
+        self.telemetry_history = TelemetryHistory()
+        self.telemetry_fields = {group: schema_fields(group) for group in TELEMETRY_RECORDS}
+        self.hyi_transmitter: Optional[HYITransmitter] = None
+        self.replay_source: Optional[ReplaySource] = None
+        self.telemetry_server = telemetry_server
+        
+        for link_id, role, port in links:
+            self.serial_manager.register_link(link_id, role)
+            self.ports[link_id] = port
+        
+        # Bağlantı kimliği -> işlenen/geçersiz satır sayısı
+        counted = list(TELEMETRY_RECORDS) + [link_id for link_id, _, _ in links]
+        self.lines = dict.fromkeys(counted, 0)
+        self.invalid = dict.fromkeys(counted, 0)
+        # Bağlantı kimliği -> hız, sayaç boşluğu ve kayıp istatistikleri
+        self.link_stats: Dict[str, LinkStats] = {}
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self.serial_manager.frame_queue.set_notify(self._wakeup.set)
+    
+    def start(self) -> bool:
+        """
+        Bağlantıları, kaydı, oynatmayı ve HYI vericisini başlatır
+        
+        Returns:
+            bool: En az bir veri kaynağı açıldıysa True
+        """
+        if self.record_path is not None:
+            path = self.record_path or default_recording_path()
+            try:
+                self.serial_manager.recorder = FlightRecorder(path)
+                log(f"Uçuş kaydı: {path}")
+            except OSError as e:
+                log(f"Uçuş kaydı başlatılamadı: {e}")
+        
+        sources = 0
+        for connection_type, port in self.ports.items():
+            if not self.serial_manager.connect(port, self.baud_rate, connection_type):
+                log(f"{connection_type} bağlantı hatası: {port}")
+                continue
+            log(f"{connection_type} bağlantısı başarılı: {port}")
+            role = self.serial_manager.link_role(connection_type)
+            # Varsayılan 'hyi' bağlantısı çıkıştır, ek HYI bağlantıları dinlenir
+            if role in TELEMETRY_RECORDS or (role == 'hyi' and connection_type != 'hyi'):
+                self.serial_manager.start_reader(connection_type)
+                sources += 1
+        
+        if self.replay_path:
+            try:
+                self.replay_source = ReplaySource(
+                    self.replay_path, self.serial_manager.frame_queue, self.replay_speed,
+                    on_finished=self._wakeup.set
+                )
+            except (OSError, ValueError) as e:
+                log(f"Kayıt açılamadı: {e}")
+            else:
+                self.replay_source.start()
+                log(f"Kayıt oynatılıyor: {self.replay_path} ({len(self.replay_source.log)} kayıt)")
+                sources += 1
+        
+        if self.hyi_rate:
+            self.hyi_transmitter = HYITransmitter(self.serial_manager, self.hyi_rate, self.team_id)
+            self.hyi_transmitter.start()
+            log(f"Otomatik HYI gönderimi: {self.hyi_rate:.1f} Hz")
+        
+        return sources > 0
+    
+    def stop(self):
+        """Ana döngünün durmasını ister (başka thread'den çağrılabilir)"""
+        self._stop_event.set()
+        self._wakeup.set()
+    
+    def run(self, duration: Optional[float] = None):
+        """
+        Durdurulana, süre dolana ya da oynatma bitene kadar veri işler
+        
+        Args:
+            duration: En fazla çalışma süresi (saniye, None ise sınırsız)
+        """
+        started = time.monotonic()
+        deadline = started + duration if duration else None
+        next_stats = started + self.stats_interval
+        try:
+            while not self._stop_event.is_set():
+                now = time.monotonic()
+                if deadline and now >= deadline:
+                    break
+                wait_until = min(next_stats, deadline) if deadline else next_stats
+                if self._wakeup.wait(max(wait_until - now, 0.0)):
+                    self._wakeup.clear()
+                self.process_frames()
+                
+                if time.monotonic() >= next_stats:
+                    self.print_stats(time.monotonic() - started)
+                    next_stats += self.stats_interval
+                
+                # Yalnızca oynatma kaynağı varsa, bittiğinde çık
+                if (self.replay_source and not self.replay_source.is_alive()
+                        and not self.serial_manager.readers):
+                    self.process_frames()
+                    break
+        finally:
+            self.print_stats(time.monotonic() - started)
+            self.close()
+    
+    def process_frames(self):
+        """Kuyruktaki çerçeveleri bağlantı başına toplu işler"""
+        grouped: Dict[str, List] = {}
+        for frame in self.serial_manager.get_frames():
+            grouped.setdefault(frame.connection_type, []).append(frame)
+        
+        updated = False
+        for link_id, frames in grouped.items():
+            role = self.serial_manager.link_role(link_id)
+            stats = self.get_link_stats(link_id, role)
+            stats.record_frames(frames)
+            if role in TELEMETRY_RECORDS:
+                updated |= self.ingest_frames(link_id, frames, role)
+            elif role == 'hyi':
+                # Paketler çözücüde doğrulandı, yalnızca sayılır ve sayaçları izlenir
+                self.lines[link_id] = self.lines.get(link_id, 0) + len(frames)
+                stats.record_counters([frame.raw[5] for frame in frames])
+        
+        if self.hyi_transmitter:
+            self.hyi_transmitter.update(self.telemetry_data.rocket, self.telemetry_data.payload)
+        if updated and self.telemetry_server:
+            self.telemetry_server.publish(self.telemetry_data)
+    
+    def get_link_stats(self, link_id: str, role: Optional[str] = None) -> LinkStats:
+        """Bağlantının istatistiklerini döndürür (yoksa oluşturur)"""
+        stats = self.link_stats.get(link_id)
+        if stats is None:
+            stats = self.link_stats[link_id] = LinkStats(link_id, role)
+        return stats
+    
+    def ingest_frames(self, group: str, frames: list, role: Optional[str] = None) -> bool:
+        """
+        Bir bağlantının satırlarını ayrıştırıp geçmişe ve anlık görüntüye ekler
+        
+        Args:
+            group: Bağlantı kimliği (geçmiş grubu)
+            frames: Bağlantının çerçeveleri
+            role: Bağlantı rolü (None ise `group`)
+        
+        Returns:
+            bool: Anlık görüntü güncellendiyse True
+        """
+        role = role or group
+        record_type = TELEMETRY_RECORDS[role]
+        stats = self.get_link_stats(group, role)
+        if group not in self.telemetry_history:
+            self.telemetry_history.add_group(group, role)
+        self.lines.setdefault(group, 0)
+        self.invalid.setdefault(group, 0)
+        lines = []
+        timestamps = []
+        latest = None
+        for frame in frames:
+            text = frame.text
+            if ',' in text:
+                lines.append(text)
+                timestamps.append(frame.timestamp)
+                continue
+            
+            # Geliş sırası korunur: önceki CSV satırları JSON satırından önce işlenir
+            if lines:
+                latest = self.ingest_lines(group, role, lines, timestamps) or latest
+                lines = []
+                timestamps = []
+            
+            # JSON satırları tek tek işlenir
+            try:
+                data = json.loads(text)
+                if role in data:
+                    latest = record_type.from_dict(data[role])
+                    self.telemetry_history.append(group, frame.timestamp, latest)
+                    self.lines[group] += 1
+                    if stats.sequence_field:
+                        stats.record_counters([getattr(latest, stats.sequence_field)])
+            except (ValueError, TypeError):
+                self.invalid[group] += 1
+                stats.record_invalid(1)
+        if lines:
+            latest = self.ingest_lines(group, role, lines, timestamps) or latest
+        
+        # Anlık görüntü (ve HYI) yalnızca varsayılan bağlantılardan beslenir
+        if latest is not None and group == role:
+            setattr(self.telemetry_data, group, latest)
+            return True
+        return False
+    
+    def ingest_lines(self, group: str, role: str, lines: list, timestamps: list):
+        """
+        CSV satırlarını tek geçişte ayrıştırıp geçmişe ekler
+        
+        Returns:
+            Son geçerli satırın kaydı, yoksa None
+        """
+        batch = parse_csv_batch(lines, self.telemetry_fields[role])
+        self.lines[group] += batch.valid_count
+        self.invalid[group] += batch.invalid_count
+        self.link_stats[group].record_batch(batch)
+        if not batch.valid_count:
+            return None
+        self.telemetry_history.extend(
+            group, np.asarray(timestamps)[batch.valid], batch.valid_columns()
+        )
+        return batch.record(batch.last_valid_index(), TELEMETRY_RECORDS[role])
+    
+    def get_stats(self) -> Dict[str, float]:
+        """Çalışma istatistiklerini döndürür"""
+        stats = {
+            f'{link_id}_lines': lines for link_id, lines in self.lines.items()
+        }
+        stats.update({
+            f'{link_id}_invalid': invalid for link_id, invalid in self.invalid.items()
+        })
+        stats['queue_dropped'] = self.serial_manager.frame_queue.dropped
+        recorder = self.serial_manager.recorder
+        stats['recorded'] = recorder.records_written if recorder else 0
+        if self.hyi_transmitter:
+            stats.update({f'hyi_{key}': value
+                          for key, value in self.hyi_transmitter.get_stats().items()})
+        if self.telemetry_server:
+            stats.update({f'serve_{key}': value
+                          for key, value in self.telemetry_server.get_stats().items()})
+        for link_id, link_stats in self.link_stats.items():
+            stats.update({f'link_{link_id}_{key}': value
+                          for key, value in link_stats.get_stats().items()})
+        return stats
+    
+    def print_stats(self, elapsed: float):
+        """İstatistik satırı yazdırır"""
+        rates = ", ".join(
+            f"{link_id} {lines} satır ({lines / elapsed:.1f}/s, "
+            f"{self.invalid.get(link_id, 0)} geçersiz)"
+            for link_id, lines in self.lines.items()
+        ) if elapsed > 0 else ""
+        stats = self.get_stats()
+        message = f"{rates}, kuyrukta atılan {stats['queue_dropped']}, kaydedilen {stats['recorded']}"
+        if self.hyi_transmitter:
+            message += (f", HYI {stats['hyi_rate']:.1f} Hz gönderilen {stats['hyi_sent']}"
+                        f" hata {stats['hyi_failed']}")
+        if self.telemetry_server:
+            message += (f", yayın {stats['serve_clients']} abone gönderilen {stats['serve_sent']}"
+                        f" birleştirilen {stats['serve_coalesced']}")
+        log(message)
+        if self.link_stats:
+            log("Bağlantılar: " + "; ".join(f"{link_id} {link_stats.summary()}"
+                                           for link_id, link_stats in self.link_stats.items()))
+    
+    def close(self):
+        """Tüm thread'leri durdurur, portları ve kaydı kapatır"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.stop()
+        if self.replay_source:
+            self.replay_source.stop()
+        self.serial_manager.close_all()
+        if self.telemetry_server:
+            self.telemetry_server.close()
+        if self.serial_manager.recorder:
+            self.serial_manager.recorder.close()
+            self.serial_manager.recorder = None
+
+
+def run_headless(args) -> int:
+    """
+    Komut satırı argümanlarıyla arayüzsüz istasyonu çalıştırır
+    
+    Returns:
+        int: Çıkış kodu
+    """
+    ports = {name: port for name, port in (
+        ('rocket', args.rocket_port),
+        ('payload', args.payload_port),
+        ('hyi', args.hyi_port)
+    ) if port}
+    try:
+        station = HeadlessGroundStation(
+            ports, args.baud, hyi_rate=args.hyi_rate, team_id=args.team_id,
+            record=args.record, replay=args.replay, replay_speed=args.speed,
+            stats_interval=args.stats_interval, transport=args.transport,
+            links=args.link or ()
+        )
+    except ValueError as e:
+        log(f"Geçersiz bağlantı: {e}")
+        return 1
+    station.telemetry_server = create_telemetry_server(args, log)
+    if not station.start():
+        log("Veri kaynağı yok: --rocket-port, --payload-port, --link ya da --replay verin")
+        station.close()
+        return 1
+    try:
+        station.run(args.duration)
+    except KeyboardInterrupt:
+        # `run` kapanışı zaten yaptı
+        pass
+    return 0
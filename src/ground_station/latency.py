@@ -0,0 +1,239 @@
+"""
+Gecikme Ölçümü
+Roket verisinin seri okumadan ekrana kadar geçtiği aşamaların sürelerini
+HDR tarzı log-doğrusal histogramlarda tutar ve JSON olarak dışa aktarır.
+"""
+
+import json
+import time
+from typing import Dict, Optional
+
+
+# Ölçülen aşamalar ve Debug sekmesindeki adları. Her aşama bir önceki zaman
+# damgasından ölçülür; widget ve GL çizim, model güncellemesinden başlar.
+LATENCY_STAGES = {
+    'queue': "Okuma → işleme",
+    'parse': "Ayrıştırma",
+    'model': "Model güncelleme",
+    'widget': "Widget güncelleme",
+    'paint': "GL çizim",
+    'display': "Uçtan uca (okuma → widget)",
+    'end_to_end': "Uçtan uca (okuma → GL)"
+}
+
+# Her ikinin kuvveti aralığı 2 ** (SUB_BUCKET_BITS - 1) kovaya bölünür (~%1.6 çözünürlük)
+SUB_BUCKET_BITS = 7
+
+# Kaydedilebilecek en büyük süre (µs); daha büyükleri son kovaya yazılır
+MAX_LATENCY_US = 60 * 1000 * 1000
+
+# Raporlanan yüzdelikler
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    Sabit bellekli log-doğrusal (HDR tarzı) süre histogramı.
+    
+    Değerler mikrosaniye olarak tutulur. 2 ** SUB_BUCKET_BITS altındaki
+    değerler birebir, daha büyükleri her ikinin kuvveti aralığında eşit
+    genişlikte alt kovalara sayılır; göreli hata aralık boyunca sabittir.
+    Kayıt yalnızca birkaç tamsayı işlemi ve bir liste artırmasıdır.
+    """
+    
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS,
+                 max_value: int = MAX_LATENCY_US):
+        """
+        Args:
+            sub_bucket_bits: Doğrusal bölgenin bit sayısı (çözünürlük)
+            max_value: Kaydedilebilecek en büyük değer (µs)
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.half_count = 1 << (sub_bucket_bits - 1)
+        self.max_value = max_value
+        self.counts = [0] * (self._index(max_value) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = max_value
+        self.max = 0
+    
+    def _index(self, value: int) -> int:
+        """Değerin kova indeksini döndürür"""
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return shift * self.half_count + (value >> shift)
+    
+    def bucket_range(self, index: int):
+        """Kovanın kapsadığı en küçük ve en büyük değeri döndürür (µs)"""
+        if index < 2 * self.half_count:
+            return index, index
+        shift = (index // self.half_count) - 1
+        mantissa = index - shift * self.half_count
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+    
+    def record(self, seconds: float):
+        """Tek bir süreyi (saniye) kaydeder"""
+        value = int(seconds * 1e6)
+        if value < 0:
+            value = 0
+        elif value > self.max_value:
+            value = self.max_value
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def percentile(self, percent: float) -> int:
+        """
+        Yüzdelik değeri döndürür (µs)
+        
+        Kovanın üst sınırı döndürülür, ölçülen en büyük değerle sınırlanır.
+        """
+        if not self.count:
+            return 0
+        target = max(1, int(percent / 100.0 * self.count + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_range(index)[1], self.max)
+        return self.max
+    
+    def reset(self):
+        """Tüm kayıtları siler"""
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.min = self.max_value
+        self.max = 0
+    
+    def to_dict(self) -> Dict:
+        """Özet değerleri ve boş olmayan kovaları sözlük olarak döndürür"""
+        data = {
+            'count': self.count,
+            'min_us': self.min if self.count else 0,
+            'max_us': self.max,
+            'mean_us': self.total / self.count if self.count else 0.0
+        }
+        for percent in PERCENTILES:
+            data[f"p{percent:g}_us"] = self.percentile(percent)
+        data['buckets'] = [
+            [*self.bucket_range(index), count]
+            for index, count in enumerate(self.counts) if count
+        ]
+        return data
+
+
+class LatencyTracker:
+    """
+    Roket verisi yolunun aşama gecikmeleri.
+    
+    Çağrı sırası: `dequeued` (okuyucu kuyruğundan alınma) -> `parsed` ->
+    `model_updated` -> `widget_updated` ve `painted`. Widget ve GL çizimi
+    yalnızca yeni bir model güncellemesinden sonra ilk kez ölçülür; araya
+    giren yeniden çizimler kaydedilmez.
+    """
+    
+    def __init__(self):
+        self.histograms = {stage: LatencyHistogram() for stage in LATENCY_STAGES}
+        self.read_time: Optional[float] = None
+        self.model_time: Optional[float] = None
+        self._pending_parse = None
+        self._widget_pending = False
+        self._paint_pending = False
+    
+    def dequeued(self, frames) -> float:
+        """Çerçevelerin okunmasından bu yana geçen süreyi kaydeder, şimdiki zamanı döndürür"""
+        now = time.monotonic()
+        histogram = self.histograms['queue']
+        for frame in frames:
+            histogram.record(now - frame.monotonic)
+        return now
+    
+    def parsed(self, started: float, read_time: float) -> float:
+        """
+        Ayrıştırma süresini kaydeder
+        
+        Args:
+            started: Ayrıştırmanın başladığı `time.monotonic()` değeri
+            read_time: Modele girecek en yeni çerçevenin okunma zamanı
+        """
+        now = time.monotonic()
+        self.histograms['parse'].record(now - started)
+        self._pending_parse = (read_time, now)
+        return now
+    
+    def model_updated(self):
+        """Ayrıştırılan verinin modele (anlık görüntü, geçmiş, HYI) yazılmasını işaretler"""
+        if self._pending_parse is None:
+            return
+        now = time.monotonic()
+        self.read_time, parsed = self._pending_parse
+        self._pending_parse = None
+        self.model_time = now
+        self.histograms['model'].record(now - parsed)
+        self._widget_pending = True
+        self._paint_pending = True
+    
+    def widget_updated(self):
+        """Telemetri widget'larının yeni veriyle güncellenmesini işaretler"""
+        if not self._widget_pending:
+            return
+        self._widget_pending = False
+        now = time.monotonic()
+        self.histograms['widget'].record(now - self.model_time)
+        self.histograms['display'].record(now - self.read_time)
+    
+    def painted(self):
+        """3D görünümün yeni veriyle çizilmesini işaretler"""
+        if not self._paint_pending:
+            return
+        self._paint_pending = False
+        now = time.monotonic()
+        self.histograms['paint'].record(now - self.model_time)
+        self.histograms['end_to_end'].record(now - self.read_time)
+    
+    def reset(self):
+        """Tüm histogramları sıfırlar"""
+        for histogram in self.histograms.values():
+            histogram.reset()
+    
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Aşama -> sayı, ortalama, yüzdelikler ve en büyük değer (ms)"""
+        stats = {}
+        for stage, histogram in self.histograms.items():
+            stage_stats = {
+                'count': histogram.count,
+                'mean_ms': histogram.total / histogram.count / 1000 if histogram.count else 0.0,
+                'max_ms': histogram.max / 1000
+            }
+            for percent in PERCENTILES:
+                stage_stats[f"p{percent:g}_ms"] = histogram.percentile(percent) / 1000
+            stats[stage] = stage_stats
+        return stats
+    
+    def to_dict(self) -> Dict:
+        """Tüm histogramları dışa aktarılabilir sözlük olarak döndürür"""
+        return {
+            'unit': 'us',
+            'sub_bucket_bits': SUB_BUCKET_BITS,
+            'exported_at': time.time(),
+            'stages': {
+                stage: dict(label=LATENCY_STAGES[stage], **histogram.to_dict())
+                for stage, histogram in self.histograms.items()
+            }
+        }
+    
+    def export_json(self, path: str):
+        """
+        Histogramları JSON dosyasına yazar
+        
+        Raises:
+            OSError: Dosya yazılamazsa
+        """
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(self.to_dict(), output, ensure_ascii=False, indent=2)
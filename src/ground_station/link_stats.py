@@ -0,0 +1,200 @@
+"""
+Bağlantı İstatistikleri
+Bağlantı başına çerçeve ve bayt hızlarını, ayrıştırma hatalarını ve sayaç
+alanından (`sayac`, HYI sayacı) sıra boşluklarını, tekrarları ve kayıp
+oranını akış halinde izler.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+# Rollere göre sayaç alanı ve sarma değeri: roket sayacı 16 bit, HYI sayacı 8 bit
+SEQUENCE_FIELDS = {'rocket': 'sayac'}
+SEQUENCE_MODULO = {'rocket': 2 ** 16, 'hyi': 256}
+
+# Hız ve kayıp oranının hesaplandığı kayan pencere (saniye)
+STATS_WINDOW = 10.0
+
+# Sayaç bundan fazla geri giderse verici yeniden başlamış sayılır
+RESET_THRESHOLD = 64
+
+# Pencere kovalarındaki sayaçların sırası
+_FRAMES, _BYTES, _INVALID, _SEQUENCED, _LOST = range(1, 6)
+
+
+class LinkStats:
+    """
+    Tek bir bağlantının akış istatistikleri.
+    
+    Sayaçlar sarma değerine göre açılır (örn. 65535 -> 0 bir adımdır) ve
+    görülen en yüksek değerle karşılaştırılır: ileri atlamalar boşluk ve
+    kayıp, en yüksek değeri geçmeyen sayaçlar (tekrar ya da geç gelen
+    çerçeve) tekrar olarak sayılır. Hızlar ve kayıp yüzdesi son
+    `window` saniyedeki saniyelik kovalardan hesaplanır; bellek sabittir.
+    """
+    
+    def __init__(self, link_id: str, role: Optional[str] = None,
+                 window: float = STATS_WINDOW):
+        """
+        Args:
+            link_id: Bağlantı kimliği
+            role: Bağlantı rolü; sayaç alanını ve sarma değerini belirler
+            window: Kayan pencere süresi (saniye)
+        """
+        self.link_id = link_id
+        self.role = role or link_id
+        self.sequence_field = SEQUENCE_FIELDS.get(self.role)
+        self.modulo = SEQUENCE_MODULO.get(self.role)
+        self.window = window
+        
+        self.frames = 0
+        self.bytes = 0
+        self.invalid = 0
+        self.sequenced = 0
+        self.gaps = 0
+        self.lost = 0
+        self.duplicates = 0
+        self.resets = 0
+        self.last_counter: Optional[int] = None
+        self._position = 0
+        self._highest = 0
+        self._buckets = deque()
+    
+    def _bucket(self, now: Optional[float]) -> list:
+        """Şimdiki saniyenin kovasını döndürür, pencereden çıkanları atar"""
+        second = int(time.monotonic() if now is None else now)
+        buckets = self._buckets
+        if not buckets or buckets[-1][0] != second:
+            buckets.append([second, 0, 0, 0, 0, 0])
+        while buckets[0][0] <= second - self.window:
+            buckets.popleft()
+        return buckets[-1]
+    
+    def record_frames(self, frames: Sequence, now: Optional[float] = None):
+        """Alınan çerçeveleri ve baytlarını sayar"""
+        count = len(frames)
+        nbytes = sum(len(frame.raw) for frame in frames)
+        self.frames += count
+        self.bytes += nbytes
+        bucket = self._bucket(now)
+        bucket[_FRAMES] += count
+        bucket[_BYTES] += nbytes
+    
+    def record_invalid(self, count: int, now: Optional[float] = None):
+        """Ayrıştırılamayan çerçeveleri sayar"""
+        if count:
+            self.invalid += count
+            self._bucket(now)[_INVALID] += count
+    
+    def record_batch(self, batch, now: Optional[float] = None):
+        """`CSVBatch` sonucundan hatalı satırları ve geçerli satırların sayaçlarını ekler"""
+        self.record_invalid(batch.invalid_count, now)
+        if self.sequence_field and batch.valid_count:
+            self.record_counters(batch.columns[self.sequence_field][batch.valid], now)
+    
+    def record_counters(self, counters, now: Optional[float] = None):
+        """
+        Geliş sırasıyla sayaç değerlerini işler
+        
+        Args:
+            counters: Sayaçlar (liste ya da NumPy dizisi)
+        """
+        counters = np.asarray(counters, dtype=np.int64).ravel()
+        if not counters.size:
+            return
+        if self.modulo:
+            counters = counters % self.modulo
+        bucket = self._bucket(now)
+        self.sequenced += counters.size
+        bucket[_SEQUENCED] += counters.size
+        
+        if self.last_counter is None:
+            # İlk sayaç taban olur
+            self.last_counter = int(counters[0])
+            counters = counters[1:]
+            if not counters.size:
+                return
+        
+        deltas = np.diff(counters, prepend=self.last_counter)
+        if self.modulo:
+            # Sarmayı hesaba katarak en kısa yöndeki adım
+            half = self.modulo // 2
+            deltas = (deltas + half) % self.modulo - half
+        self.last_counter = int(counters[-1])
+        
+        # Verici yeniden başladıysa sayaç o noktadan yeni taban olur
+        start = 0
+        for reset in np.flatnonzero(deltas < -RESET_THRESHOLD).tolist() + [deltas.size]:
+            lost = self._advance(deltas[start:reset])
+            bucket[_LOST] += lost
+            if reset < deltas.size:
+                self.resets += 1
+                self._position = self._highest = 0
+            start = reset + 1
+    
+    def _advance(self, deltas: np.ndarray) -> int:
+        """Sayaç adımlarını uygular, kayıp çerçeve sayısını döndürür"""
+        if not deltas.size:
+            return 0
+        positions = self._position + np.cumsum(deltas)
+        highest = np.maximum.accumulate(np.concatenate(([self._highest], positions)))
+        advance = positions - highest[:-1]
+        self._position = int(positions[-1])
+        self._highest = int(highest[-1])
+        
+        lost = int(np.maximum(advance - 1, 0).sum())
+        self.lost += lost
+        self.gaps += int(np.count_nonzero(advance > 1))
+        self.duplicates += int(np.count_nonzero(advance <= 0))
+        return lost
+    
+    def get_stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Toplamları ve son pencerenin hızlarını döndürür
+        
+        Returns:
+            Dict[str, float]: frames, bytes, invalid, gaps, lost, duplicates, resets,
+                fps, bps, invalid_pct, loss_pct (pencere), total_loss_pct
+        """
+        now = time.monotonic() if now is None else now
+        self._bucket(now)
+        buckets = self._buckets
+        span = max(now - buckets[0][0], 1.0)
+        frames, nbytes, invalid, sequenced, lost = (
+            sum(bucket[index] for bucket in buckets)
+            for index in (_FRAMES, _BYTES, _INVALID, _SEQUENCED, _LOST)
+        )
+        expected = sequenced + lost
+        total_expected = self.sequenced + self.lost
+        return {
+            'frames': self.frames,
+            'bytes': self.bytes,
+            'invalid': self.invalid,
+            'gaps': self.gaps,
+            'lost': self.lost,
+            'duplicates': self.duplicates,
+            'resets': self.resets,
+            'fps': frames / span,
+            'bps': nbytes / span,
+            'invalid_pct': 100.0 * invalid / frames if frames else 0.0,
+            'loss_pct': 100.0 * lost / expected if expected else 0.0,
+            'total_loss_pct': 100.0 * self.lost / total_expected if total_expected else 0.0
+        }
+    
+    def summary(self, now: Optional[float] = None) -> str:
+        """İstatistikleri tek satırlık metin olarak döndürür"""
+        stats = self.get_stats(now)
+        bps = stats['bps']
+        rate = f"{bps / 1024:.1f} kB/s" if bps >= 1024 else f"{bps:.0f} B/s"
+        text = (f"{stats['fps']:.1f} çerçeve/s, {rate}, "
+                f"hatalı %{stats['invalid_pct']:.1f}")
+        if self.modulo:
+            text += (f", kayıp %{stats['loss_pct']:.1f} ({self.lost} çerçeve, "
+                     f"{self.gaps} boşluk), tekrar {self.duplicates}")
+            if self.resets:
+                text += f", yeniden başlama {self.resets}"
+        return text
@@ -4,42 +4,197 @@ Yer istasyonu uygulamasının ana arayüzü.
 """
 
 import sys
+import threading
+import time
+from functools import partial
+from typing import Optional
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QTabWidget, QFrame, QStyleFactory, QLabel)
-from PyQt5.QtCore import QTimer, Qt
+                            QHBoxLayout, QTabWidget, QFrame, QStyleFactory, QLabel,
+                            QFileDialog)
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
-from .rocket_3d import RocketGLWidget
-from .serial_communication import SerialManager, HYIProtocol
+# OpenGL (rocket_3d), NumPy tabanlı modüller (geçmiş, ayrıştırıcı, kayıt,
+# grafikler, harita) ilk kullanıldıklarında içe aktarılır; bkz. STARTUP_BUDGET_MS
+from .serial_communication import create_serial_manager, HYIEncoder, HYITransmitter
 from .data_models import TelemetryData, RocketData, PayloadData
-from .ui_components import (SerialConnectionWidget, TelemetryDisplayWidget, 
-                          DebugConsole, StatusIndicator, ControlPanel)
+from .latency import LatencyTracker
+from .ui_components import (SerialConnectionWidget, LinkAddWidget, TelemetryDisplayWidget, 
+                          DebugConsole, LatencyWidget, StatusIndicator, ControlPanel,
+                          set_text_if_changed)
+
+
+# Arka planda okunan telemetri bağlantıları
+TELEMETRY_LINKS = ("rocket", "payload")
+
+# Telemetri rollerinin kayıt tipleri (JSON satırları için)
+TELEMETRY_RECORDS = {"rocket": RocketData, "payload": PayloadData}
+
+# Varsayılan bağlantı widget başlıkları
+LINK_TITLES = {
+    "rocket": "🚀 Roket Telemetri",
+    "payload": "📦 Görev Yükü Telemetri",
+    "hyi": "📡 HYI Telemetri"
+}
+
+# Ek bağlantı widget başlıklarındaki rol simgeleri
+ROLE_ICONS = {
+    "rocket": "🚀",
+    "payload": "📦"
+}
+
+# Telemetri ekranlarının yenilenme aralığı (ms, ~30 Hz)
+RENDER_INTERVAL_MS = 33
+
+# Başlangıçtan ilk çizime kadar hedeflenen en uzun süre (ms)
+STARTUP_BUDGET_MS = 1000
+
+
+class StartupTimer:
+    """Başlangıç aşamalarının (içe aktarma, pencere, ilk çizim...) sürelerini ölçer"""
+    
+    def __init__(self, started: Optional[float] = None):
+        """
+        Args:
+            started: Ölçümün başladığı `time.perf_counter()` değeri (None ise şimdi)
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.stages = []
+        self._last = self.started
+    
+    def mark(self, stage: str):
+        """Önceki işaretten bu yana geçen süreyi `stage` aşaması olarak kaydeder"""
+        now = time.perf_counter()
+        self.stages.append((stage, (now - self._last) * 1000))
+        self._last = now
+    
+    @property
+    def total_ms(self) -> float:
+        """Başlangıçtan son işarete kadar geçen süre (ms)"""
+        return (self._last - self.started) * 1000
+    
+    def report(self) -> str:
+        """Aşama sürelerini tek satır olarak döndürür"""
+        stages = ", ".join(f"{stage} {duration:.0f} ms" for stage, duration in self.stages)
+        return f"{stages}; toplam {self.total_ms:.0f} ms"
+
+
+class SerialSignals(QObject):
+    """Okuyucu thread'lerden arayüz thread'ine sinyal köprüsü"""
+    frames_ready = pyqtSignal()
+    replay_finished = pyqtSignal(object)
+    ports_ready = pyqtSignal(list)
+    connect_finished = pyqtSignal(str, str, bool)
 
 
 class GroundStationMainWindow(QMainWindow):
     """Ana yer istasyonu penceresi"""
     
-    def __init__(self):
+    def __init__(self, startup: Optional[StartupTimer] = None, transport: str = 'thread',
+                 telemetry_server=None):
+        """
+        Args:
+            startup: Başlangıç süre ölçümü (None ise pencere oluşturulurken başlar)
+            transport: Seri taşıma katmanı ('thread' ya da 'asyncio')
+            telemetry_server: Anlık görüntüleri yayınlayan `TelemetryServer` (isteğe bağlı)
+        """
         super().__init__()
+        self.startup = startup or StartupTimer()
+        self.startup_finished = False
         self.setWindowTitle("Yer İstasyonu v2.0 - Roket Telemetri Sistemi")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Veri yöneticileri
-        self.serial_manager = SerialManager()
+        # Veri yöneticileri (NumPy tabanlı geçmiş ilk veriyle oluşturulur)
+        self.serial_manager = create_serial_manager(transport)
         self.telemetry_data = TelemetryData()
+        self._telemetry_history = None
+        self._telemetry_fields = None
+        self.hyi_encoder = HYIEncoder()
+        self.hyi_transmitter = None
+        self.replay_source = None
+        self.telemetry_server = telemetry_server
+        
+        # Okuyucu thread'ler yeni veri bıraktığında arayüzü uyandır
+        self.serial_signals = SerialSignals()
+        self.serial_signals.frames_ready.connect(self.update_data)
+        self.serial_signals.replay_finished.connect(self.on_replay_finished)
+        self.serial_signals.ports_ready.connect(self.on_ports_ready)
+        self.serial_signals.connect_finished.connect(self.on_connect_finished)
+        self.serial_manager.frame_queue.set_notify(self.serial_signals.frames_ready.emit)
+        
+        # Ekran, veri hızından bağımsız olarak sabit aralıkla yenilenir
+        self.rocket_dirty = False
+        self.payload_dirty = False
+        self.render_timer = QTimer()
+        self.render_timer.timeout.connect(self.render_telemetry)
+        
+        # Uçuş kaydı ilk telemetri bağlantısında başlar
+        self.recorder_timer = QTimer()
+        self.recorder_timer.timeout.connect(self.flush_recorder)
+        
+        # Otomatik HYI gönderim istatistikleri
+        self.hyi_stats_timer = QTimer()
+        self.hyi_stats_timer.timeout.connect(self.update_hyi_stats)
+        
+        # Bağlantı başına hız/kayıp istatistikleri (ilk veriyle oluşturulur)
+        self.link_stats = {}
+        self.link_stats_timer = QTimer()
+        self.link_stats_timer.timeout.connect(self.update_link_stats)
         
-        # Timer'lar
-        self.data_timer = QTimer()
-        self.data_timer.timeout.connect(self.update_data)
+        # Seri okumadan ekrana aşama gecikmeleri (Debug sekmesinde gösterilir)
+        self.latency = LatencyTracker()
+        self.latency_timer = QTimer()
+        self.latency_timer.timeout.connect(self.update_latency_stats)
         
         # UI'yi başlat
         self.setup_ui()
         self.setup_connections()
         self.setup_styles()
+        self.startup.mark("pencere")
         
-        # İlk port taraması
+        # 3D görünüm ve ilk port taraması ilk çizimden sonra yapılır (bkz. finish_startup)
+    
+    @property
+    def telemetry_history(self):
+        """Telemetri geçmişi (ilk erişimde oluşturulur)"""
+        if self._telemetry_history is None:
+            from .telemetry_history import TelemetryHistory
+            self._telemetry_history = TelemetryHistory()
+        return self._telemetry_history
+    
+    @property
+    def telemetry_fields(self) -> dict:
+        """Grup -> alan adı/NumPy veri tipi eşlemesi (ilk erişimde okunur)"""
+        if self._telemetry_fields is None:
+            from .telemetry_history import schema_fields
+            self._telemetry_fields = {
+                group: schema_fields(group) for group in TELEMETRY_LINKS
+            }
+        return self._telemetry_fields
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.startup_finished:
+            self.startup_finished = True
+            # Çizim tamamlandıktan sonra çalışır
+            QTimer.singleShot(0, self.finish_startup)
+    
+    def finish_startup(self):
+        """İlk çizimden sonra ertelenen işleri yapar ve başlangıç sürelerini yazar"""
+        self.startup.mark("ilk çizim")
+        self.create_rocket_3d()
+        self.startup.mark("3D görünüm")
         self.refresh_ports()
+        self.latency_timer.start(1000)
         
+        self.debug_console.log(f"Başlangıç süreleri: {self.startup.report()}")
+        if self.startup.total_ms > STARTUP_BUDGET_MS:
+            self.debug_console.log(
+                f"Uyarı: başlangıç {self.startup.total_ms:.0f} ms sürdü "
+                f"(hedef {STARTUP_BUDGET_MS} ms)"
+            )
+    
     def setup_ui(self):
         """Kullanıcı arayüzünü oluşturur"""
         central_widget = QWidget()
@@ -66,11 +221,15 @@ class GroundStationMainWindow(QMainWindow):
         view_frame = QFrame()
         view_frame.setFrameShape(QFrame.StyledPanel)
         view_frame.setLineWidth(1)
-        view_layout = QVBoxLayout(view_frame)
-        view_layout.setContentsMargins(5, 5, 5, 5)
+        self.view_layout = QVBoxLayout(view_frame)
+        self.view_layout.setContentsMargins(5, 5, 5, 5)
         
-        self.rocket_3d = RocketGLWidget()
-        view_layout.addWidget(self.rocket_3d)
+        # OpenGL widget'ı ilk çizimden sonra oluşturulur (bkz. create_rocket_3d)
+        self.rocket_3d = None
+        self.rocket_3d_placeholder = QLabel("3D görünüm yükleniyor...")
+        self.rocket_3d_placeholder.setAlignment(Qt.AlignCenter)
+        self.rocket_3d_placeholder.setMinimumSize(400, 400)
+        self.view_layout.addWidget(self.rocket_3d_placeholder)
         
         layout.addWidget(view_frame)
         
@@ -131,6 +290,17 @@ class GroundStationMainWindow(QMainWindow):
         telemetry_tab = self.create_telemetry_tab()
         tab_widget.addTab(telemetry_tab, "📊 Telemetri")
         
+        # Grafikler ve Harita sekmeleri ilk açıldıklarında oluşturulur
+        self.plot_panel = None
+        self.map_view = None
+        self.plot_tab = self.create_lazy_tab()
+        self.map_tab = self.create_lazy_tab()
+        self.lazy_tabs = {
+            tab_widget.addTab(self.plot_tab, "📈 Grafikler"): self.ensure_plot_panel,
+            tab_widget.addTab(self.map_tab, "🗺 Harita"): self.ensure_map_view
+        }
+        tab_widget.currentChanged.connect(self.on_tab_changed)
+        
         # Kontroller sekmesi
         controls_tab = self.create_controls_tab()
         tab_widget.addTab(controls_tab, "🎮 Kontroller")
@@ -141,24 +311,125 @@ class GroundStationMainWindow(QMainWindow):
         
         return tab_widget
         
+    def create_lazy_tab(self) -> QWidget:
+        """İçeriği sonradan eklenecek boş sekme oluşturur"""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return widget
+    
+    def on_tab_changed(self, index: int):
+        """Ertelenmiş sekme ilk açıldığında içeriğini oluşturur"""
+        factory = self.lazy_tabs.pop(index, None)
+        if factory:
+            factory()
+    
+    def create_rocket_3d(self):
+        """OpenGL 3D görünümü oluşturur ve mevcut uçuş izini yükler"""
+        if self.rocket_3d is not None:
+            return
+        from .rocket_3d import RocketGLWidget
+        
+        self.rocket_3d = RocketGLWidget()
+        self.rocket_3d.latency = self.latency
+        self.view_layout.replaceWidget(self.rocket_3d_placeholder, self.rocket_3d)
+        self.rocket_3d_placeholder.deleteLater()
+        self.rocket_3d_placeholder = None
+        
+        rocket = self.telemetry_data.rocket
+        self.rocket_3d.update_rotation(rocket.Gx, rocket.Gy, rocket.Gz)
+        columns = self.history_columns("rocket")
+        if columns:
+            self.rocket_3d.extend_trajectory(
+                columns['Enlem'], columns['Boylam'], columns['MSIrtifa']
+            )
+    
+    def ensure_plot_panel(self):
+        """Grafik panelini oluşturur ve geçmişteki örneklerle doldurur"""
+        if self.plot_panel is None:
+            from .plots import PlotPanel
+            
+            self.plot_panel = PlotPanel()
+            self.plot_tab.layout().addWidget(self.plot_panel)
+            for group in TELEMETRY_LINKS:
+                columns = self.history_columns(group)
+                if columns:
+                    self.plot_panel.extend(group, columns['timestamp'], columns)
+        return self.plot_panel
+    
+    def ensure_map_view(self):
+        """Haritayı oluşturur ve geçmişteki konumlarla doldurur"""
+        if self.map_view is None:
+            from .map_view import MapWidget
+            
+            self.map_view = MapWidget()
+            self.map_tab.layout().addWidget(self.map_view)
+            for config in self.serial_manager.link_configs.values():
+                if config.role not in TELEMETRY_LINKS:
+                    continue
+                columns = self.history_columns(config.link_id)
+                if columns:
+                    self.extend_map_track(config.link_id, columns, config.role)
+        return self.map_view
+    
+    def history_columns(self, group: str) -> Optional[dict]:
+        """Geçmişteki tüm örnekleri sütunlar halinde döndürür, geçmiş yoksa None"""
+        if self._telemetry_history is None or group not in self._telemetry_history:
+            return None
+        buffer = self._telemetry_history[group]
+        if not len(buffer):
+            return None
+        return {name: buffer.window(name) for name in buffer.fields}
+    
     def create_connections_tab(self) -> QWidget:
         """Bağlantılar sekmesini oluşturur"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(5, 5, 5, 5)
         
-        # Seri port bağlantıları
-        self.rocket_connection = SerialConnectionWidget("🚀 Roket Telemetri", "rocket")
-        self.payload_connection = SerialConnectionWidget("📦 Görev Yükü Telemetri", "payload")
-        self.hyi_connection = SerialConnectionWidget("📡 HYI Telemetri", "hyi")
+        # Seri port bağlantıları (bağlantı kimliği -> widget)
+        self.connection_widgets = {}
+        self.available_ports = []
+        self.connections_layout = layout
+        for link_id, title in LINK_TITLES.items():
+            self.add_connection_widget(link_id, title)
         
-        layout.addWidget(self.rocket_connection)
-        layout.addWidget(self.payload_connection)
-        layout.addWidget(self.hyi_connection)
+        # Çok araçlı uçuşlar için ek bağlantılar
+        self.link_add_widget = LinkAddWidget()
+        layout.addWidget(self.link_add_widget)
         layout.addStretch()
         
         return widget
         
+    def add_connection_widget(self, link_id: str, title: str) -> SerialConnectionWidget:
+        """Bağlantı widget'ını oluşturur, düğmelerini bağlar ve listeye ekler"""
+        widget = SerialConnectionWidget(title, link_id)
+        widget.connect_button.clicked.connect(lambda: self.connect_serial(link_id))
+        widget.disconnect_button.clicked.connect(lambda: self.disconnect_serial(link_id))
+        for port in self.available_ports:
+            widget.port_combo.addItem(port)
+        
+        # Ekleme widget'ının üstüne yerleştir
+        self.connections_layout.insertWidget(len(self.connection_widgets), widget)
+        self.connection_widgets[link_id] = widget
+        return widget
+    
+    def add_link(self):
+        """Girilen kimlik ve rolle yeni bir telemetri bağlantısı tanımlar"""
+        link_id = self.link_add_widget.get_link_id()
+        role = self.link_add_widget.get_role()
+        if not link_id:
+            self.debug_console.log("Bağlantı kimliği boş olamaz")
+            return
+        if link_id in self.serial_manager.link_configs:
+            self.debug_console.log(f"Bağlantı zaten tanımlı: {link_id}")
+            return
+        
+        self.serial_manager.register_link(link_id, role)
+        self.add_connection_widget(link_id, f"{ROLE_ICONS[role]} {link_id}")
+        self.link_add_widget.link_id_edit.clear()
+        self.debug_console.log(f"Bağlantı eklendi: {link_id} ({role})")
+    
     def create_telemetry_tab(self) -> QWidget:
         """Telemetri sekmesini oluşturur"""
         widget = QWidget()
@@ -219,36 +490,32 @@ class GroundStationMainWindow(QMainWindow):
         self.debug_console = DebugConsole()
         layout.addWidget(self.debug_console)
         
+        self.latency_widget = LatencyWidget()
+        layout.addWidget(self.latency_widget)
+        
         return widget
         
     def setup_connections(self):
         """Sinyal bağlantılarını kurar"""
-        # Seri port bağlantıları
-        self.rocket_connection.connect_button.clicked.connect(
-            lambda: self.connect_serial("rocket")
-        )
-        self.rocket_connection.disconnect_button.clicked.connect(
-            lambda: self.disconnect_serial("rocket")
-        )
-        
-        self.payload_connection.connect_button.clicked.connect(
-            lambda: self.connect_serial("payload")
-        )
-        self.payload_connection.disconnect_button.clicked.connect(
-            lambda: self.disconnect_serial("payload")
-        )
-        
-        self.hyi_connection.connect_button.clicked.connect(
-            lambda: self.connect_serial("hyi")
-        )
-        self.hyi_connection.disconnect_button.clicked.connect(
-            lambda: self.disconnect_serial("hyi")
-        )
+        # Seri port düğmeleri `add_connection_widget` içinde bağlanır
+        self.link_add_widget.add_button.clicked.connect(self.add_link)
+        self.link_add_widget.link_id_edit.returnPressed.connect(self.add_link)
         
         # Kontrol paneli
         self.control_panel.send_hyi_button.clicked.connect(self.send_hyi_packet)
+        self.control_panel.auto_hyi_check.toggled.connect(self.toggle_hyi_transmitter)
+        self.control_panel.hyi_rate_spin.valueChanged.connect(self.update_hyi_settings)
+        self.control_panel.team_id_spin.valueChanged.connect(self.update_hyi_settings)
         self.control_panel.load_map_button.clicked.connect(self.load_map)
+        self.control_panel.map_tiles_browse_button.clicked.connect(self.browse_map_tiles)
+        self.control_panel.replay_browse_button.clicked.connect(self.browse_replay)
+        self.control_panel.replay_button.toggled.connect(self.toggle_replay)
+        self.control_panel.import_csv_button.clicked.connect(self.import_csv)
         
+        # Gecikme ölçümü
+        self.latency_widget.export_button.clicked.connect(self.export_latency)
+        self.latency_widget.reset_button.clicked.connect(self.reset_latency)
+    
     def setup_styles(self):
         """Uygulama stillerini ayarlar"""
         self.setStyleSheet("""
@@ -336,10 +603,18 @@ class GroundStationMainWindow(QMainWindow):
         """)
         
     def refresh_ports(self):
-        """Mevcut seri portları tarar"""
-        ports = self.serial_manager.get_available_ports()
-        
-        for connection_widget in [self.rocket_connection, self.payload_connection, self.hyi_connection]:
+        """Seri portları arka planda tarar; sonuç `on_ports_ready` ile gelir"""
+        threading.Thread(
+            target=lambda: self.serial_signals.ports_ready.emit(
+                self.serial_manager.get_available_ports()
+            ),
+            name="PortScan", daemon=True
+        ).start()
+    
+    def on_ports_ready(self, ports: list):
+        """Port taraması sonucunu bağlantı listelerine yazar"""
+        self.available_ports = ports
+        for connection_widget in self.connection_widgets.values():
             connection_widget.port_combo.clear()
             for port in ports:
                 connection_widget.port_combo.addItem(port)
@@ -348,61 +623,301 @@ class GroundStationMainWindow(QMainWindow):
         
     def connect_serial(self, connection_type: str):
         """Seri porta bağlanır"""
-        if connection_type == "rocket":
-            widget = self.rocket_connection
-        elif connection_type == "payload":
-            widget = self.payload_connection
-        elif connection_type == "hyi":
-            widget = self.hyi_connection
-        else:
+        widget = self.connection_widgets.get(connection_type)
+        if widget is None:
             return
             
         port = widget.get_port()
         baud_rate = widget.get_baud_rate()
         
-        if self.serial_manager.connect(port, baud_rate, connection_type):
+        if hasattr(self.serial_manager, 'connect_async'):
+            # Port olay döngüsünde açılır, arayüz beklemez
+            self.debug_console.log(f"{connection_type} bağlanıyor: {port}")
+            self.serial_manager.connect_async(
+                port, baud_rate, connection_type,
+                lambda ok: self.serial_signals.connect_finished.emit(connection_type, port, ok)
+            )
+            return
+        self.on_connect_finished(
+            connection_type, port, self.serial_manager.connect(port, baud_rate, connection_type)
+        )
+    
+    def on_connect_finished(self, connection_type: str, port: str, ok: bool):
+        """Bağlantı sonucunu arayüze yansıtır ve okuyucuyu başlatır"""
+        widget = self.connection_widgets[connection_type]
+        if ok:
             widget.set_connected(True)
             self.debug_console.log(f"{connection_type} bağlantısı başarılı: {port}")
             
-            # Veri okumayı başlat
-            if not self.data_timer.isActive():
-                self.data_timer.start(100)  # 100ms'de bir güncelle
+            # Arka plan okuyucusunu başlat
+            if self.serial_manager.link_role(connection_type) in TELEMETRY_LINKS:
+                self.start_recording()
+                self.serial_manager.start_reader(connection_type)
         else:
             self.debug_console.log(f"{connection_type} bağlantı hatası: {port}")
             
     def disconnect_serial(self, connection_type: str):
         """Seri port bağlantısını keser"""
         if self.serial_manager.disconnect(connection_type):
-            if connection_type == "rocket":
-                self.rocket_connection.set_connected(False)
-            elif connection_type == "payload":
-                self.payload_connection.set_connected(False)
-            elif connection_type == "hyi":
-                self.hyi_connection.set_connected(False)
-                
+            self.connection_widgets[connection_type].set_connected(False)
             self.debug_console.log(f"{connection_type} bağlantısı kesildi")
             
-            # Tüm bağlantılar kesildiyse timer'ı durdur
-            if not any(self.serial_manager.is_connected(conn_type) 
-                      for conn_type in ["rocket", "payload", "hyi"]):
-                self.data_timer.stop()
-                
+    def start_recording(self):
+        """Uçuş kaydını başlatır (zaten açıksa bir şey yapmaz)"""
+        if self.serial_manager.recorder:
+            return
+        from .flight_recorder import FlightRecorder, default_recording_path
+        
+        try:
+            path = default_recording_path()
+            self.serial_manager.recorder = FlightRecorder(path)
+            self.recorder_timer.start(1000)
+            self.debug_console.log(f"Uçuş kaydı başladı: {path}")
+        except OSError as e:
+            self.debug_console.log(f"Uçuş kaydı başlatılamadı: {e}")
+            
+    def flush_recorder(self):
+        """Biriken kayıtları diske yazar"""
+        if self.serial_manager.recorder:
+            self.serial_manager.recorder.flush()
+            
     def update_data(self):
-        """Veri güncellemelerini yapar"""
-        # Roket verilerini oku
-        if self.serial_manager.is_connected("rocket"):
-            rocket_data = self.serial_manager.read_data("rocket")
-            if rocket_data:
-                self.process_rocket_data(rocket_data)
+        """Okuyucu thread'lerin kuyruğa bıraktığı verileri işler"""
+        grouped = {}
+        for frame in self.serial_manager.get_frames():
+            grouped.setdefault(frame.connection_type, []).append(frame)
                 
-        # Görev yükü verilerini oku
-        if self.serial_manager.is_connected("payload"):
-            payload_data = self.serial_manager.read_data("payload")
-            if payload_data:
-                self.process_payload_data(payload_data)
+        for link_id, frames in grouped.items():
+            self.get_link_stats(link_id).record_frames(frames)
+        
+        rocket_frames = grouped.pop("rocket", None)
+        payload_frames = grouped.pop("payload", None)
+        if rocket_frames:
+            self.process_rocket_frames(rocket_frames)
+        if payload_frames:
+            self.process_payload_frames(payload_frames)
+        
+        for link_id, frames in grouped.items():
+            role = self.serial_manager.link_role(link_id)
+            if role in TELEMETRY_LINKS:
+                self.process_link_frames(link_id, role, frames)
+    
+    def get_link_stats(self, link_id: str):
+        """Bağlantının `LinkStats` nesnesini döndürür (yoksa oluşturur)"""
+        stats = self.link_stats.get(link_id)
+        if stats is None:
+            from .link_stats import LinkStats
+            
+            stats = LinkStats(link_id, self.serial_manager.link_role(link_id))
+            self.link_stats[link_id] = stats
+            if not self.link_stats_timer.isActive():
+                self.link_stats_timer.start(1000)
+        return stats
+    
+    def update_latency_stats(self):
+        """Gecikme tablosunu Debug sekmesinde yeniler"""
+        self.latency_widget.set_stats(self.latency.get_stats())
+    
+    def export_latency(self):
+        """Gecikme histogramlarını JSON dosyasına yazar"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Gecikme Histogramlarını Kaydet", "gecikme.json", "JSON Dosyaları (*.json)"
+        )
+        if not path:
+            return
+        try:
+            self.latency.export_json(path)
+            self.debug_console.log(f"Gecikme histogramları kaydedildi: {path}")
+        except OSError as e:
+            self.debug_console.log(f"Gecikme histogramları kaydedilemedi: {e}")
+    
+    def reset_latency(self):
+        """Gecikme histogramlarını sıfırlar"""
+        self.latency.reset()
+        self.update_latency_stats()
+    
+    def update_link_stats(self):
+        """Bağlantı istatistiklerini Bağlantılar sekmesinde gösterir"""
+        for link_id, stats in self.link_stats.items():
+            widget = self.connection_widgets.get(link_id)
+            if widget:
+                widget.set_stats(stats.summary())
+    
+    def process_rocket_frames(self, frames: list):
+        """Aynı anda gelen roket satırlarını toplu işler"""
+        self.ingest_frames("rocket", frames, RocketData, self.process_rocket_data,
+                           self.on_rocket_updated)
+            
+    def process_payload_frames(self, frames: list):
+        """Aynı anda gelen görev yükü satırlarını toplu işler"""
+        self.ingest_frames("payload", frames, PayloadData, self.process_payload_data,
+                           self.on_payload_updated)
+            
+    def process_link_frames(self, link_id: str, role: str, frames: list):
+        """
+        Ek bir bağlantının (örn. ikinci roket) satırlarını geliş sırasıyla
+        kendi geçmiş grubuna ve harita izine ekler. CSV satırları toplu, JSON
+        satırları tek tek ayrıştırılır. Telemetri ekranları, grafikler, 3D
+        görünüm ve HYI varsayılan bağlantılardan beslenir.
+        """
+        import json
+        
+        if link_id not in self.telemetry_history:
+            self.telemetry_history.add_group(link_id, role)
+        stats = self.get_link_stats(link_id)
+        lines = []
+        timestamps = []
+        for frame in frames:
+            text = frame.text
+            if ',' in text:
+                lines.append(text)
+                timestamps.append(frame.timestamp)
+                continue
+            if lines:
+                self.ingest_link_lines(link_id, role, lines, timestamps)
+                lines = []
+                timestamps = []
+            try:
+                json_data = json.loads(text)
+                if role in json_data:
+                    record = TELEMETRY_RECORDS[role].from_dict(json_data[role])
+                    self.store_link_samples(link_id, role, [frame.timestamp], {
+                        name: [value] for name, value in zip(record._fields, record)
+                    })
+                    if stats.sequence_field:
+                        stats.record_counters([getattr(record, stats.sequence_field)])
+            except (ValueError, TypeError) as e:
+                stats.record_invalid(1)
+                self.debug_console.log(f"{link_id} veri işleme hatası: {e}")
+        if lines:
+            self.ingest_link_lines(link_id, role, lines, timestamps)
+    
+    def ingest_link_lines(self, link_id: str, role: str, lines: list, timestamps: list):
+        """Ek bağlantının CSV satırlarını tek geçişte ayrıştırıp ekler"""
+        from .telemetry_parser import parse_csv_batch
+        import numpy as np
+        
+        batch = parse_csv_batch(lines, self.telemetry_fields[role])
+        self.get_link_stats(link_id).record_batch(batch)
+        if batch.invalid_count:
+            self.debug_console.log(f"{link_id} veri işleme hatası: {batch.invalid_count} geçersiz satır")
+        if batch.valid_count:
+            self.store_link_samples(link_id, role, np.asarray(timestamps)[batch.valid],
+                                    batch.valid_columns())
+    
+    def store_link_samples(self, link_id: str, role: str, timestamps, columns: dict):
+        """Ek bağlantının örneklerini geçmişe ve harita izine ekler"""
+        self.telemetry_history.extend(link_id, timestamps, columns)
+        if self.map_view:
+            self.extend_map_track(link_id, columns, role)
+    
+    def ingest_frames(self, group: str, frames: list, record_type, process_line, on_updated):
+        """
+        Satırları geliş sırasıyla işler; ardışık CSV satırları tek geçişte
+        ayrıştırılıp geçmişe eklenir
+        
+        CSV olmayan (JSON) satırlar `process_line` ile tek tek işlenir; öncesinde
+        gelen CSV satırları ondan önce işlenir. Her CSV grubunun son geçerli
+        satırı anlık görüntü olur ve `on_updated` çağrılır.
+        """
+        measure = group == "rocket"
+        if measure:
+            self.latency.dequeued(frames)
+        lines = []
+        timestamps = []
+        read_time = None
+        for frame in frames:
+            text = frame.text
+            if ',' in text:
+                lines.append(text)
+                timestamps.append(frame.timestamp)
+                read_time = frame.monotonic
+                continue
+            if lines:
+                self.ingest_lines(group, lines, timestamps, record_type, on_updated,
+                                  read_time if measure else None)
+                lines = []
+                timestamps = []
+            process_line(text, frame.timestamp, frame.monotonic)
+        if lines:
+            self.ingest_lines(group, lines, timestamps, record_type, on_updated,
+                              read_time if measure else None)
+    
+    def ingest_lines(self, group: str, lines: list, timestamps: list, record_type, on_updated,
+                     read_time: Optional[float] = None):
+        """
+        CSV satırlarını tek geçişte ayrıştırıp geçmişe ve anlık görüntüye ekler
+        
+        Args:
+            read_time: Son satırın okunma zamanı (`time.monotonic()`); verilirse
+                ayrıştırma ve uçtan uca gecikme ölçülür
+        """
+        from .telemetry_parser import parse_csv_batch
+        import numpy as np
+        
+        started = time.monotonic()
+        batch = parse_csv_batch(lines, self.telemetry_fields[group])
+        self.get_link_stats(group).record_batch(batch)
+        if batch.invalid_count:
+            self.debug_console.log(f"{group} veri işleme hatası: {batch.invalid_count} geçersiz satır")
+        if not batch.valid_count:
+            return
+        if read_time is not None:
+            self.latency.parsed(started, read_time)
+        
+        self.store_samples(group, np.asarray(timestamps)[batch.valid], batch.valid_columns())
+        setattr(self.telemetry_data, group, batch.record(batch.last_valid_index(), record_type))
+        on_updated()
                 
-    def process_rocket_data(self, data: str):
-        """Roket verilerini işler"""
+    def store_samples(self, group: str, timestamps, columns: dict):
+        """
+        Ayrıştırılmış örnekleri geçmişe, grafiklere, haritaya ve (roket için)
+        uçuş izine ekler. Henüz oluşturulmamış paneller açıldıklarında
+        geçmişten doldurulur.
+        """
+        self.telemetry_history.extend(group, timestamps, columns)
+        if self.plot_panel:
+            self.plot_panel.extend(group, timestamps, columns)
+        if self.map_view:
+            self.extend_map_track(group, columns)
+        if group == "rocket" and self.rocket_3d:
+            self.rocket_3d.extend_trajectory(
+                columns['Enlem'], columns['Boylam'], columns['MSIrtifa']
+            )
+    
+    def extend_map_track(self, group: str, columns: dict, role: Optional[str] = None):
+        """
+        Grubun konum sütunlarını harita yer izine ekler
+        
+        Args:
+            group: Geçmiş grubu / yer izi adı
+            columns: Grubun sütunları
+            role: Sütun adlarını belirleyen rol (None ise `group`)
+        """
+        if (role or group) == "rocket":
+            self.map_view.extend_track(group, columns['Enlem'], columns['Boylam'])
+        else:
+            self.map_view.extend_track(
+                group, columns['GorevYukuEnlem'], columns['GorevYukuBoylam']
+            )
+            
+    def store_record(self, group: str, timestamp: float, record):
+        """Tek bir kaydı (örn. JSON satırı) `store_samples` ile ekler"""
+        self.store_samples(group, [timestamp],
+                           {name: [value] for name, value in zip(record._fields, record)})
+        
+    def process_rocket_data(self, data: str, timestamp: Optional[float] = None,
+                            read_time: Optional[float] = None):
+        """
+        Roket verilerini işler
+        
+        Args:
+            data: CSV ya da JSON satırı
+            timestamp: Alınma zamanı (None ise şimdi)
+            read_time: Satırın okunma zamanı (`time.monotonic()`); None ise
+                gecikme ölçümü bu çağrıdan başlar
+        """
+        started = time.monotonic()
         try:
             # CSV formatında veri geliyorsa
             if ',' in data:
@@ -411,19 +926,28 @@ class GroundStationMainWindow(QMainWindow):
                 # JSON formatında veri geliyorsa
                 import json
                 json_data = json.loads(data)
-                if 'rocket' in json_data:
-                    self.telemetry_data.rocket = RocketData.from_dict(json_data['rocket'])
+                if 'rocket' not in json_data:
+                    # Yeni roket kaydı yok; eski sayaç tekrar sayılmasın
+                    return
+                self.telemetry_data.rocket = RocketData.from_dict(json_data['rocket'])
+            self.latency.parsed(started, started if read_time is None else read_time)
                     
-            # UI'yi güncelle
-            self.update_rocket_display()
-            self.update_3d_visualization()
-            self.update_status()
+            self.store_record("rocket", timestamp or time.time(), self.telemetry_data.rocket)
+            self.get_link_stats("rocket").record_counters([self.telemetry_data.rocket.sayac])
+            self.on_rocket_updated()
             
         except Exception as e:
+            self.get_link_stats("rocket").record_invalid(1)
             self.debug_console.log(f"Roket veri işleme hatası: {e}")
             
-    def process_payload_data(self, data: str):
-        """Görev yükü verilerini işler"""
+    def process_payload_data(self, data: str, timestamp: Optional[float] = None,
+                             read_time: Optional[float] = None):
+        """
+        Görev yükü verilerini işler
+        
+        `read_time` yalnızca `process_rocket_data` ile aynı imza içindir;
+        görev yükü için gecikme ölçülmez.
+        """
         try:
             # CSV formatında veri geliyorsa
             if ',' in data:
@@ -432,34 +956,129 @@ class GroundStationMainWindow(QMainWindow):
                 # JSON formatında veri geliyorsa
                 import json
                 json_data = json.loads(data)
-                if 'payload' in json_data:
-                    self.telemetry_data.payload = PayloadData.from_dict(json_data['payload'])
+                if 'payload' not in json_data:
+                    # Yeni görev yükü kaydı yok; eski örnek tekrar eklenmesin
+                    return
+                self.telemetry_data.payload = PayloadData.from_dict(json_data['payload'])
                     
-            # UI'yi güncelle
-            self.update_payload_display()
+            self.store_record("payload", timestamp or time.time(), self.telemetry_data.payload)
+            self.on_payload_updated()
             
         except Exception as e:
+            self.get_link_stats("payload").record_invalid(1)
             self.debug_console.log(f"Görev yükü veri işleme hatası: {e}")
             
+    def on_rocket_updated(self):
+        """Yeni roket verisini HYI'ya ve abonelere iletir, ekranı yenilenecek olarak işaretler"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.update(self.telemetry_data.rocket, self.telemetry_data.payload)
+        if self.telemetry_server:
+            self.telemetry_server.publish(self.telemetry_data)
+        
+        # 3D görünüm yalnızca en son yönelimi tutar, kendi hızında çizer
+        if self.rocket_3d:
+            rocket = self.telemetry_data.rocket
+            self.rocket_3d.update_rotation(rocket.Gx, rocket.Gy, rocket.Gz)
+        self.latency.model_updated()
+        self.rocket_dirty = True
+        self.schedule_render()
+        
+    def on_payload_updated(self):
+        """Yeni görev yükü verisini HYI'ya ve abonelere iletir, ekranı yenilenecek olarak işaretler"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.update(self.telemetry_data.rocket, self.telemetry_data.payload)
+        if self.telemetry_server:
+            self.telemetry_server.publish(self.telemetry_data)
+        self.payload_dirty = True
+        self.schedule_render()
+        
+    def schedule_render(self):
+        """Ekran yenileme zamanlayıcısını gerekirse başlatır"""
+        if not self.render_timer.isActive():
+            self.render_timer.start(RENDER_INTERVAL_MS)
+            
+    def render_telemetry(self):
+        """Son anlık görüntüyü ekrana çizer; yeni veri yoksa zamanlayıcı durur"""
+        if not (self.rocket_dirty or self.payload_dirty):
+            self.render_timer.stop()
+            return
+        
+        if self.rocket_dirty:
+            self.rocket_dirty = False
+            self.update_rocket_display()
+            self.update_3d_visualization()
+            self.update_status()
+            self.latency.widget_updated()
+        if self.payload_dirty:
+            self.payload_dirty = False
+            self.update_payload_display()
+        if self.plot_panel:
+            self.plot_panel.refresh()
+        if self.map_view:
+            self.map_view.refresh()
+        
+    def import_csv(self):
+        """Uçuş sonrası CSV kaydını telemetri geçmişine aktarır"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "CSV Kaydı Seç", "", "CSV Dosyaları (*.csv *.txt);;Tüm Dosyalar (*)"
+        )
+        if not path:
+            return
+        
+        # Grup, ilk satırın alan sayısından belirlenir
+        try:
+            with open(path, encoding='utf-8', errors='replace') as csv_file:
+                first_line = next((line for line in csv_file if line.strip()), "")
+        except OSError as e:
+            self.debug_console.log(f"CSV açılamadı: {e}")
+            return
+        field_count = first_line.count(',') + 1
+        group = "rocket" if field_count >= len(self.telemetry_fields["rocket"]) else "payload"
+        
+        from .telemetry_parser import parse_csv_file
+        import numpy as np
+        
+        batch = parse_csv_file(path, self.telemetry_fields[group])
+        if batch.valid_count:
+            # Dosyada zaman bilgisi yok; örnek sırası kullanılır
+            self.telemetry_history[group].clear()
+            if self.plot_panel:
+                self.plot_panel.clear(group)
+            if self.map_view:
+                self.map_view.clear_track(group)
+            if group == "rocket" and self.rocket_3d:
+                self.rocket_3d.clear_trajectory()
+            self.store_samples(
+                group, np.arange(batch.valid_count, dtype=np.float64), batch.valid_columns()
+            )
+            index = batch.last_valid_index()
+            if group == "rocket":
+                self.telemetry_data.rocket = batch.record(index, RocketData)
+                self.on_rocket_updated()
+            else:
+                self.telemetry_data.payload = batch.record(index, PayloadData)
+                self.on_payload_updated()
+        self.debug_console.log(
+            f"CSV içe aktarıldı ({group}): {batch.valid_count} geçerli, "
+            f"{batch.invalid_count} geçersiz satır"
+        )
+            
     def update_rocket_display(self):
         """Roket telemetri ekranını günceller"""
-        rocket_data = self.telemetry_data.rocket.to_dict()
-        self.rocket_telemetry.update_all_fields(rocket_data)
+        self.rocket_telemetry.update_record(self.telemetry_data.rocket)
         
     def update_payload_display(self):
         """Görev yükü telemetri ekranını günceller"""
-        payload_data = self.telemetry_data.payload.to_dict()
-        self.payload_telemetry.update_all_fields(payload_data)
+        self.payload_telemetry.update_record(self.telemetry_data.payload)
         
     def update_3d_visualization(self):
-        """3D görselleştirmeyi günceller"""
+        """3D görselleştirmenin rotasyon etiketlerini günceller"""
         rocket = self.telemetry_data.rocket
-        self.rocket_3d.update_rotation(rocket.Gx, rocket.Gy, rocket.Gz)
         
         # Rotasyon etiketlerini güncelle
-        self.x_rot_label.setText(f"X: {rocket.Gx:.1f}°")
-        self.y_rot_label.setText(f"Y: {rocket.Gy:.1f}°")
-        self.z_rot_label.setText(f"Z: {rocket.Gz:.1f}°")
+        set_text_if_changed(self.x_rot_label, f"X: {rocket.Gx:.1f}°")
+        set_text_if_changed(self.y_rot_label, f"Y: {rocket.Gy:.1f}°")
+        set_text_if_changed(self.z_rot_label, f"Z: {rocket.Gz:.1f}°")
         
     def update_status(self):
         """Durum göstergesini günceller"""
@@ -480,11 +1099,11 @@ class GroundStationMainWindow(QMainWindow):
         """HYI paketi gönderir"""
         if self.serial_manager.is_connected("hyi"):
             team_id = self.control_panel.get_team_id()
-            packet = HYIProtocol.create_packet(
-                team_id,
+            self.hyi_encoder.team_id = team_id
+            packet = self.hyi_encoder.encode(
                 self.telemetry_data.rocket.sayac,
-                self.telemetry_data.rocket.to_dict(),
-                self.telemetry_data.payload.to_dict()
+                self.telemetry_data.rocket,
+                self.telemetry_data.payload
             )
             
             if self.serial_manager.write_data("hyi", packet):
@@ -495,23 +1114,149 @@ class GroundStationMainWindow(QMainWindow):
         else:
             self.debug_console.log("HYI bağlantısı yok")
             
+    def toggle_hyi_transmitter(self, enabled: bool):
+        """Otomatik HYI gönderimini başlatır veya durdurur"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.stop()
+            self.hyi_transmitter = None
+            self.hyi_stats_timer.stop()
+            
+        if enabled:
+            self.hyi_transmitter = HYITransmitter(
+                self.serial_manager,
+                self.control_panel.get_hyi_rate(),
+                self.control_panel.get_team_id()
+            )
+            self.hyi_transmitter.update(self.telemetry_data.rocket, self.telemetry_data.payload)
+            self.hyi_transmitter.start()
+            self.hyi_stats_timer.start(1000)
+            self.debug_console.log(
+                f"Otomatik HYI gönderimi başladı ({self.control_panel.get_hyi_rate():.1f} Hz)"
+            )
+        else:
+            self.control_panel.update_hyi_status("Beklemede")
+            self.debug_console.log("Otomatik HYI gönderimi durduruldu")
+            
+    def update_hyi_settings(self):
+        """Otomatik gönderim hızını ve takım ID'sini günceller"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.set_rate(self.control_panel.get_hyi_rate())
+            self.hyi_transmitter.set_team_id(self.control_panel.get_team_id())
+            
+    def update_hyi_stats(self):
+        """Otomatik gönderim istatistiklerini gösterir"""
+        if self.hyi_transmitter:
+            stats = self.hyi_transmitter.get_stats()
+            self.control_panel.update_hyi_status(
+                f"{stats['rate']:.1f} Hz, jitter {stats['jitter_ms']:.1f} ms, "
+                f"atlanan {stats['dropped_ticks']}, hata {stats['failed']}"
+            )
+            
+    def browse_replay(self):
+        """Oynatılacak kayıt dosyasını seçtirir"""
+        from .flight_recorder import RECORDINGS_DIR, RECORDING_EXTENSION
+        
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Uçuş Kaydı Seç", RECORDINGS_DIR,
+            f"Uçuş Kayıtları (*{RECORDING_EXTENSION})"
+        )
+        if path:
+            self.control_panel.replay_path_edit.setText(path)
+            
+    def toggle_replay(self, enabled: bool):
+        """Kayıt oynatmayı başlatır veya durdurur"""
+        if not enabled:
+            if self.replay_source:
+                self.replay_source.stop()
+            self.control_panel.replay_button.setText("▶ Oynat")
+            return
+        
+        from .replay import ReplaySource
+        
+        path = self.control_panel.get_replay_path()
+        speed = self.control_panel.get_replay_speed()
+        try:
+            source = ReplaySource(path, self.serial_manager.frame_queue, speed)
+        except (OSError, ValueError) as e:
+            self.debug_console.log(f"Kayıt açılamadı: {e}")
+            self.control_panel.replay_button.setChecked(False)
+            return
+        
+        # Bitiş bildirimi kaynağı taşır: durdurulup hemen yeniden başlatılırsa
+        # eski oynatmanın geç gelen bildirimi yenisini kapatmaz
+        source.on_finished = partial(self.serial_signals.replay_finished.emit, source)
+        self.replay_source = source
+        source.start()
+        self.control_panel.replay_button.setText("■ Durdur")
+        self.control_panel.update_replay_status(f"{len(self.replay_source.log)} kayıt oynatılıyor")
+        self.debug_console.log(f"Kayıt oynatma başladı: {path}")
+        
+    def on_replay_finished(self, source):
+        """Oynatma bitince istatistikleri gösterir"""
+        if source is not self.replay_source:
+            # Yerine yenisi başlatılmış eski oynatma
+            return
+        self.replay_source = None
+        self.control_panel.replay_button.setText("▶ Oynat")
+        self.control_panel.replay_button.setChecked(False)
+        summary = (f"{source.frames_sent} kayıt, {source.elapsed:.2f} s, "
+                   f"{source.frames_per_second:.0f} kayıt/s")
+        self.control_panel.update_replay_status(summary)
+        self.debug_console.log(f"Kayıt oynatma bitti: {summary}")
+            
+    def browse_map_tiles(self):
+        """Çevrimdışı MBTiles dosyasını seçtirir"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Harita Karoları Seç", "", "MBTiles (*.mbtiles);;Tüm Dosyalar (*)"
+        )
+        if path:
+            self.control_panel.map_tiles_edit.setText(path)
+            
     def load_map(self):
-        """Harita yükleme işlemi"""
+        """Karo kaynağını açar ve haritayı girilen koordinatlara ortalar"""
         lat, lon = self.control_panel.get_coordinates()
+        self.ensure_map_view()
+        tiles_path = self.control_panel.get_map_tiles_path()
+        if tiles_path and tiles_path != getattr(self.map_view.source, 'path', None):
+            try:
+                self.map_view.set_tile_source(tiles_path)
+            except (OSError, ValueError) as e:
+                self.debug_console.log(f"Harita karoları açılamadı: {e}")
+        self.map_view.center_on(lat, lon)
         self.debug_console.log(f"Harita yüklendi: Enlem={lat:.6f}, Boylam={lon:.6f}")
         
     def closeEvent(self, event):
         """Pencere kapatılırken çağrılır"""
+        if self.hyi_transmitter:
+            self.hyi_transmitter.stop()
+        if self.replay_source:
+            self.replay_source.stop()
         self.serial_manager.close_all()
+        if self.telemetry_server:
+            self.telemetry_server.close()
+        if self.map_view:
+            self.map_view.close_source()
+        if self.serial_manager.recorder:
+            self.serial_manager.recorder.close()
         event.accept()
 
 
-def main():
-    """Ana fonksiyon"""
+def main(started: Optional[float] = None, transport: str = 'thread', telemetry_server=None):
+    """
+    Ana fonksiyon
+    
+    Args:
+        started: İçe aktarmadan önce alınan `time.perf_counter()` değeri
+        transport: Seri taşıma katmanı ('thread' ya da 'asyncio')
+        telemetry_server: Başlatılmış `TelemetryServer` (isteğe bağlı)
+    """
+    startup = StartupTimer(started)
+    startup.mark("içe aktarma")
     app = QApplication(sys.argv)
     app.setStyle(QStyleFactory.create('Fusion'))
+    startup.mark("Qt başlatma")
     
-    window = GroundStationMainWindow()
+    window = GroundStationMainWindow(startup, transport, telemetry_server)
     window.show()
     
     sys.exit(app.exec_())
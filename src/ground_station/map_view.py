@@ -0,0 +1,482 @@
+"""
+Çevrimdışı Harita Modülü
+Yerel karo (tile) dizininden ya da MBTiles dosyasından okunan harita üzerinde
+roket ve görev yükü yer izlerini çizer. İnternet bağlantısı gerektirmez.
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+
+
+# Karo boyutu (piksel)
+TILE_SIZE = 256
+
+# Çözülmüş karo önbelleğinin varsayılan üst sınırı (~250 karo)
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Görünür alanın çevresinde önceden yüklenecek karo halkası
+PREFETCH_MARGIN = 1
+
+# Eksik karo için en fazla kaç üst seviyeye bakılacağı
+PARENT_FALLBACK_LEVELS = 4
+
+# Yer izi renkleri
+TRACK_COLORS = {
+    'rocket': "#E74C3C",
+    'payload': "#3498DB"
+}
+
+# Ek bağlantıların (örn. ikinci roket) yer izi renkleri, sırayla dağıtılır
+EXTRA_TRACK_COLORS = ("#27AE60", "#F39C12", "#8E44AD", "#16A085", "#D35400", "#2C3E50")
+
+MAX_LATITUDE = 85.05112878
+
+TileKey = Tuple[int, int, int]
+
+
+def project(latitude, longitude) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enlem/boylamı Web Mercator dünya koordinatlarına (0-1) çevirir
+    
+    Piksel koordinatı için sonuç `TILE_SIZE * 2 ** zoom` ile çarpılır.
+    """
+    latitude = np.clip(np.asarray(latitude, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    x = (longitude + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(np.radians(latitude))) / np.pi) / 2.0
+    return x, y
+
+
+def unproject(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """Web Mercator dünya koordinatlarını (0-1) enlem/boylama çevirir"""
+    longitude = np.asarray(x, dtype=np.float64) * 360.0 - 180.0
+    latitude = np.degrees(np.arctan(np.sinh(np.pi * (1.0 - 2.0 * np.asarray(y, dtype=np.float64)))))
+    return latitude, longitude
+
+
+class DirectoryTileSource:
+    """`{kök}/{z}/{x}/{y}.png` düzenindeki karo dizini"""
+    
+    EXTENSIONS = ('.png', '.jpg', '.jpeg')
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.path = root
+        levels = [int(name) for name in os.listdir(root) if name.isdigit()]
+        self.min_zoom = min(levels, default=0)
+        self.max_zoom = max(levels, default=18)
+    
+    def read(self, key: TileKey) -> Optional[bytes]:
+        """Karonun ham görüntü verisini döndürür, yoksa None"""
+        zoom, x, y = key
+        base = os.path.join(self.root, str(zoom), str(x), str(y))
+        for extension in self.EXTENSIONS:
+            try:
+                with open(base + extension, 'rb') as tile_file:
+                    return tile_file.read()
+            except OSError:
+                continue
+        return None
+    
+    def close(self):
+        pass
+
+
+class MBTilesSource:
+    """MBTiles (SQLite) karo dosyası; satırlar TMS düzeninde saklanır"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True,
+                                           check_same_thread=False)
+        metadata = dict(self._connection.execute("SELECT name, value FROM metadata"))
+        self.min_zoom = int(metadata.get('minzoom', 0))
+        self.max_zoom = int(metadata.get('maxzoom', 18))
+    
+    def read(self, key: TileKey) -> Optional[bytes]:
+        """Karonun ham görüntü verisini döndürür, yoksa None"""
+        zoom, x, y = key
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (zoom, x, (1 << zoom) - 1 - y)
+            ).fetchone()
+        return bytes(row[0]) if row else None
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def open_tile_source(path: str):
+    """
+    Yola göre karo kaynağını açar
+    
+    Raises:
+        ValueError: Yol bir dizin ya da .mbtiles dosyası değilse
+    """
+    if os.path.isdir(path):
+        return DirectoryTileSource(path)
+    if path.lower().endswith('.mbtiles') and os.path.isfile(path):
+        try:
+            return MBTilesSource(path)
+        except sqlite3.Error as e:
+            raise ValueError(f"MBTiles dosyası okunamadı: {e}")
+    raise ValueError(f"Karo kaynağı bulunamadı: {path}")
+
+
+class TileCache:
+    """
+    Çözülmüş karoları bayt sınırıyla tutan LRU önbellek.
+    
+    En son kullanılan karolar sonda tutulur; toplam boyut `max_bytes`
+    değerini aşınca en uzun süredir kullanılmayanlar atılır. Yükleyici
+    thread ile arayüz thread'i aynı anda kullanabilir.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images: "OrderedDict[TileKey, QImage]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._images)
+    
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._images
+    
+    def get(self, key: TileKey) -> Optional[QImage]:
+        """Karoyu döndürür ve en son kullanılan olarak işaretler"""
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+    
+    def peek(self, key: TileKey) -> Optional[QImage]:
+        """Karoyu kullanım sırasını ve sayaçları değiştirmeden döndürür"""
+        return self._images.get(key)
+    
+    def put(self, key: TileKey, image: QImage):
+        """Karoyu ekler ve gerekirse eski karoları atar"""
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.sizeInBytes()
+            self._images[key] = image
+            self.nbytes += image.sizeInBytes()
+            while self.nbytes > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self.nbytes -= evicted.sizeInBytes()
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self.nbytes = 0
+
+
+class TileLoader(threading.Thread):
+    """
+    Karoları arka planda okuyup çözen ve önbelleğe koyan thread.
+    
+    Her `request` çağrısı bekleyen istekleri yenileriyle değiştirir; böylece
+    hızlı kaydırmada artık görünmeyen karolar için zaman harcanmaz.
+    """
+    
+    def __init__(self, source, cache: TileCache, on_loaded=None):
+        super().__init__(name="TileLoader", daemon=True)
+        self.source = source
+        self.cache = cache
+        self.on_loaded = on_loaded
+        self.missing = set()
+        self._pending: List[TileKey] = []
+        self._condition = threading.Condition()
+        self._running = True
+    
+    def request(self, keys: Iterable[TileKey]):
+        """Yüklenecek karoları (öncelik sırasıyla) bildirir"""
+        keys = [key for key in keys if key not in self.cache and key not in self.missing]
+        with self._condition:
+            self._pending = keys
+            if keys:
+                self._condition.notify()
+    
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+    
+    def run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                key = self._pending.pop(0)
+            if key in self.cache or key in self.missing:
+                continue
+            
+            data = self.source.read(key)
+            image = QImage.fromData(data) if data else QImage()
+            if image.isNull():
+                self.missing.add(key)
+                continue
+            self.cache.put(key, image)
+            if self.on_loaded:
+                self.on_loaded()
+
+
+class GroundTrack:
+    """Dünya koordinatlarına bir kez izdüşürülmüş konumları tutan yer izi"""
+    
+    def __init__(self, capacity: int = 4096):
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def extend(self, latitude, longitude):
+        """Konumları toplu izdüşürüp ekler; (0, 0) konumlar atlanır"""
+        latitude = np.atleast_1d(np.asarray(latitude, dtype=np.float64))
+        longitude = np.atleast_1d(np.asarray(longitude, dtype=np.float64))
+        fix = (latitude != 0) | (longitude != 0)
+        if not fix.any():
+            return
+        x, y = project(latitude[fix], longitude[fix])
+        
+        end = self.count + x.size
+        if end > self.x.size:
+            capacity = max(end, 2 * self.x.size)
+            self.x = np.resize(self.x, capacity)
+            self.y = np.resize(self.y, capacity)
+        self.x[self.count:end] = x
+        self.y[self.count:end] = y
+        self.count = end
+    
+    def latest(self) -> Optional[Tuple[float, float]]:
+        if not self.count:
+            return None
+        return float(self.x[self.count - 1]), float(self.y[self.count - 1])
+    
+    def clear(self):
+        self.count = 0
+
+
+class MapWidget(QWidget):
+    """
+    Çevrimdışı karolar üzerinde yer izlerini gösteren harita.
+    
+    Fareyle sürükleyerek kaydırılır, tekerlekle yakınlaştırılır. Eksik
+    karolar arka planda yüklenirken varsa üst seviye karonun büyütülmüş
+    parçası gösterilir; çizim hiçbir zaman disk okumasını beklemez.
+    """
+    
+    tile_loaded = pyqtSignal()
+    
+    def __init__(self, cache_bytes: int = DEFAULT_CACHE_BYTES):
+        super().__init__()
+        self.cache = TileCache(cache_bytes)
+        self.source = None
+        self.loader: Optional[TileLoader] = None
+        self.tracks: Dict[str, GroundTrack] = {name: GroundTrack() for name in TRACK_COLORS}
+        self.track_colors: Dict[str, QColor] = {
+            name: QColor(color) for name, color in TRACK_COLORS.items()
+        }
+        self.zoom = 15
+        self.min_zoom = 0
+        self.max_zoom = 19
+        self.center_x = 0.5
+        self.center_y = 0.5
+        self.dirty = False
+        self._drag_origin = None
+        self.tile_loaded.connect(self.update)
+        self.setMinimumSize(300, 300)
+    
+    def set_tile_source(self, path: str):
+        """
+        Karo kaynağını değiştirir
+        
+        Raises:
+            ValueError: Kaynak açılamazsa
+        """
+        source = open_tile_source(path)
+        self.close_source()
+        self.source = source
+        self.min_zoom = source.min_zoom
+        self.max_zoom = source.max_zoom
+        self.zoom = min(max(self.zoom, self.min_zoom), self.max_zoom)
+        self.cache.clear()
+        self.loader = TileLoader(source, self.cache, self.tile_loaded.emit)
+        self.loader.start()
+        self.update()
+    
+    def close_source(self):
+        """Karo yükleyicisini durdurur ve kaynağı kapatır"""
+        if self.loader:
+            self.loader.stop()
+            self.loader.join(timeout=1.0)
+            self.loader = None
+        if self.source:
+            self.source.close()
+            self.source = None
+    
+    def center_on(self, latitude: float, longitude: float):
+        """Haritayı verilen konuma ortalar"""
+        x, y = project(latitude, longitude)
+        self.center_x, self.center_y = float(x), float(y)
+        self.update()
+    
+    def extend_track(self, name: str, latitude, longitude):
+        """Yer izine konum ekler (iz yoksa oluşturulur); çizim `refresh` ile yapılır"""
+        track = self.tracks.get(name)
+        if track is None:
+            extra = len(self.tracks) - len(TRACK_COLORS)
+            self.track_colors[name] = QColor(EXTRA_TRACK_COLORS[extra % len(EXTRA_TRACK_COLORS)])
+            track = self.tracks[name] = GroundTrack()
+        track.extend(latitude, longitude)
+        self.dirty = True
+    
+    def clear_track(self, name: str):
+        if name in self.tracks:
+            self.tracks[name].clear()
+        self.dirty = True
+    
+    def refresh(self):
+        """Yeni konum varsa ve harita görünürse yeniden çizdirir"""
+        if self.dirty and self.isVisible():
+            self.dirty = False
+            self.update()
+    
+    def _world_size(self, zoom: Optional[int] = None) -> int:
+        return TILE_SIZE << (self.zoom if zoom is None else zoom)
+    
+    def _viewport_origin(self) -> Tuple[float, float]:
+        """Görünür alanın sol üst köşesinin piksel koordinatı"""
+        size = self._world_size()
+        return (self.center_x * size - self.width() / 2.0,
+                self.center_y * size - self.height() / 2.0)
+    
+    def _tile_cells(self, margin: int = 0) -> List[Tuple[int, int]]:
+        """
+        Görünür karo hücrelerini merkeze yakınlık sırasıyla döndürür
+        
+        Sütunlar sarmalanmamıştır; 180. boylamı geçen görünümde ekran
+        konumu sütundan, karo anahtarı `sütun % 2**zoom` ile bulunur.
+        """
+        left, top = self._viewport_origin()
+        first_x = int(left // TILE_SIZE) - margin
+        first_y = max(int(top // TILE_SIZE) - margin, 0)
+        last_x = int((left + self.width()) // TILE_SIZE) + margin
+        last_y = min(int((top + self.height()) // TILE_SIZE) + margin, (1 << self.zoom) - 1)
+        center_x = (left + self.width() / 2.0) / TILE_SIZE - 0.5
+        center_y = (top + self.height() / 2.0) / TILE_SIZE - 0.5
+        cells = [(x, y) for x in range(first_x, last_x + 1) for y in range(first_y, last_y + 1)]
+        cells.sort(key=lambda cell: (cell[0] - center_x) ** 2 + (cell[1] - center_y) ** 2)
+        return cells
+    
+    def visible_tiles(self, margin: int = 0) -> List[TileKey]:
+        """Görünür (ve `margin` halkasındaki) karoları merkeze yakınlık sırasıyla döndürür"""
+        count = 1 << self.zoom
+        return [(self.zoom, x % count, y) for x, y in self._tile_cells(margin)]
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#1E272E"))
+        left, top = self._viewport_origin()
+        
+        if self.source:
+            self._draw_tiles(painter, left, top)
+            if self.loader:
+                self.loader.request(self.visible_tiles(PREFETCH_MARGIN))
+        
+        self._draw_tracks(painter, left, top)
+        
+        painter.setPen(QColor("#ECF0F1"))
+        status = "karo kaynağı yok" if not self.source else (
+            f"önbellek {len(self.cache)} karo, {self.cache.nbytes / 1e6:.1f} MB")
+        painter.drawText(8, self.height() - 8, f"Yakınlaştırma {self.zoom} - {status}")
+        painter.end()
+    
+    def _draw_tiles(self, painter: QPainter, left: float, top: float):
+        """Görünür karoları ya da eksikse üst seviye yedeklerini çizer"""
+        zoom = self.zoom
+        for column, y in self._tile_cells():
+            x = column % (1 << zoom)
+            target = QRectF(column * TILE_SIZE - left, y * TILE_SIZE - top, TILE_SIZE, TILE_SIZE)
+            image = self.cache.get((zoom, x, y))
+            if image is not None:
+                painter.drawImage(target, image)
+                continue
+            
+            for level in range(1, min(PARENT_FALLBACK_LEVELS, zoom) + 1):
+                parent = self.cache.peek((zoom - level, x >> level, y >> level))
+                if parent is None:
+                    continue
+                part = TILE_SIZE >> level
+                source = QRectF((x % (1 << level)) * part, (y % (1 << level)) * part, part, part)
+                painter.drawImage(target, parent, source)
+                break
+    
+    def _draw_tracks(self, painter: QPainter, left: float, top: float):
+        """Yer izlerini ve son konumları çizer"""
+        size = self._world_size()
+        for name, track in self.tracks.items():
+            if len(track) == 0:
+                continue
+            xs = track.x[:track.count] * size - left
+            ys = track.y[:track.count] * size - top
+            
+            # Aynı piksele düşen ardışık noktalar tek noktaya indirilir
+            pixels = np.round(xs).astype(np.int64) * 65536 + np.round(ys).astype(np.int64)
+            keep = np.flatnonzero(np.diff(pixels, prepend=pixels[0] - 1))
+            points = [QPointF(x, y) for x, y in zip(xs[keep].tolist(), ys[keep].tolist())]
+            
+            color = self.track_colors[name]
+            painter.setPen(QPen(color, 2))
+            if len(points) > 1:
+                painter.drawPolyline(QPolygonF(points))
+            painter.setBrush(color)
+            painter.drawEllipse(points[-1], 5, 5)
+            painter.setBrush(Qt.NoBrush)
+    
+    def wheelEvent(self, event):
+        step = 1 if event.angleDelta().y() > 0 else -1
+        self.zoom = min(max(self.zoom + step, self.min_zoom), self.max_zoom)
+        self.update()
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_origin = (event.pos(), self.center_x, self.center_y)
+    
+    def mouseMoveEvent(self, event):
+        if self._drag_origin is None:
+            return
+        origin, center_x, center_y = self._drag_origin
+        size = self._world_size()
+        delta = event.pos() - origin
+        self.center_x = (center_x - delta.x() / size) % 1.0
+        self.center_y = min(max(center_y - delta.y() / size, 0.0), 1.0)
+        self.update()
+    
+    def mouseReleaseEvent(self, event):
+        self._drag_origin = None
@@ -0,0 +1,338 @@
+"""
+Telemetri Grafikleri
+Uzun zaman serilerini piksel başına min/max seyreltmesiyle çizen şerit grafikler.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea
+from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
+
+
+# Seri başına tutulacak en fazla kova (bucket) sayısı
+DEFAULT_MAX_BUCKETS = 4096
+
+# Grafik sekmesi düzeni: (başlık, grup, [(alan, etiket, renk), ...])
+PLOT_LAYOUT = [
+    ("İrtifa (m)", "rocket", [
+        ("MSIrtifa", "MS", "#3498DB"),
+        ("RoketGPSIrtifa", "GPS", "#E67E22")
+    ]),
+    ("Hız (m/s)", "rocket", [
+        ("Hiz", "Hız", "#27AE60")
+    ]),
+    ("İvme", "rocket", [
+        ("Ax", "X", "#E74C3C"),
+        ("Ay", "Y", "#2ECC71"),
+        ("Az", "Z", "#3498DB")
+    ]),
+    ("Görev Yükü İrtifa (m)", "payload", [
+        ("GorevYukuIrtifa", "İrtifa", "#9B59B6")
+    ]),
+    ("Basınç (hPa)", "payload", [
+        ("GorevYukuBasinc", "Basınç", "#1ABC9C")
+    ]),
+    ("Sıcaklık / Nem", "payload", [
+        ("GorevYukuSicaklik", "°C", "#E74C3C"),
+        ("GorevYukuNem", "%", "#3498DB")
+    ])
+]
+
+
+class MinMaxDecimator:
+    """
+    Zaman serisini sabit sayıda min/max kovasında tutan artımlı seyreltici.
+    
+    Her kova `bucket_size` örneğin başlangıç zamanını, en küçük ve en büyük
+    değerini saklar. Kova sayısı `2 * max_buckets` değerine ulaşınca komşu
+    kovalar birleştirilir ve `bucket_size` iki katına çıkar. Yeni örnekler
+    yalnızca son kovalara eklenir; seri hiçbir zaman baştan işlenmez.
+    """
+    
+    def __init__(self, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        """
+        Args:
+            max_buckets: Birleştirmeden sonra kalacak kova sayısı
+        """
+        self.max_buckets = max_buckets
+        self.bucket_size = 1
+        self.times = np.zeros(2 * max_buckets, dtype=np.float64)
+        self.mins = np.zeros(2 * max_buckets, dtype=np.float64)
+        self.maxs = np.zeros(2 * max_buckets, dtype=np.float64)
+        self.count = 0
+        self.total = 0
+        self.last_time = 0.0
+        self.last_value = 0.0
+        self._partial_count = 0
+        self._partial_time = 0.0
+        self._partial_min = 0.0
+        self._partial_max = 0.0
+    
+    def __len__(self) -> int:
+        return self.count + (1 if self._partial_count else 0)
+    
+    def clear(self):
+        """Tüm örnekleri siler"""
+        self.bucket_size = 1
+        self.count = 0
+        self.total = 0
+        self._partial_count = 0
+    
+    def extend(self, timestamps, values):
+        """
+        Örnekleri ekler
+        
+        Args:
+            timestamps: Artan zaman dizisi
+            values: Aynı uzunlukta değer dizisi
+        """
+        times = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if not values.size:
+            return
+        self.total += values.size
+        self.last_time = float(times[-1])
+        self.last_value = float(values[-1])
+        
+        # Önce yarım kalan kovayı tamamla
+        if self._partial_count:
+            need = self.bucket_size - self._partial_count
+            head = values[:need]
+            self._partial_min = min(self._partial_min, float(head.min()))
+            self._partial_max = max(self._partial_max, float(head.max()))
+            self._partial_count += head.size
+            times, values = times[need:], values[need:]
+            if self._partial_count == self.bucket_size:
+                self._partial_count = 0
+                self._push(self._partial_time, self._partial_min, self._partial_max)
+        
+        while values.size:
+            size = self.bucket_size
+            full = min(values.size // size, self.times.size - self.count)
+            if not full:
+                # Kalan örnekler yeni bir yarım kova başlatır
+                self._partial_count = values.size
+                self._partial_time = float(times[0])
+                self._partial_min = float(values.min())
+                self._partial_max = float(values.max())
+                break
+            
+            block = values[:full * size].reshape(full, size)
+            end = self.count + full
+            self.times[self.count:end] = times[:full * size:size]
+            self.mins[self.count:end] = block.min(axis=1)
+            self.maxs[self.count:end] = block.max(axis=1)
+            self.count = end
+            times, values = times[full * size:], values[full * size:]
+            if self.count == self.times.size:
+                self._merge()
+    
+    def buckets(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Kovaları (yarım kova dahil) döndürür
+        
+        Returns:
+            (başlangıç zamanları, en küçük değerler, en büyük değerler)
+        """
+        count = self.count
+        if not self._partial_count:
+            return self.times[:count], self.mins[:count], self.maxs[:count]
+        return (np.append(self.times[:count], self._partial_time),
+                np.append(self.mins[:count], self._partial_min),
+                np.append(self.maxs[:count], self._partial_max))
+    
+    def _push(self, timestamp: float, minimum: float, maximum: float):
+        """Tamamlanan tek bir kovayı ekler"""
+        self.times[self.count] = timestamp
+        self.mins[self.count] = minimum
+        self.maxs[self.count] = maximum
+        self.count += 1
+        if self.count == self.times.size:
+            self._merge()
+    
+    def _merge(self):
+        """Komşu kova çiftlerini birleştirerek kova sayısını yarıya indirir"""
+        half = self.count // 2
+        self.times[:half] = self.times[:2 * half:2]
+        self.mins[:half] = np.minimum(self.mins[:2 * half:2], self.mins[1:2 * half:2])
+        self.maxs[:half] = np.maximum(self.maxs[:2 * half:2], self.maxs[1:2 * half:2])
+        self.count = half
+        self.bucket_size *= 2
+
+
+def pixel_envelope(times: np.ndarray, mins: np.ndarray, maxs: np.ndarray,
+                   start: float, end: float, width: int
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kovaları piksel sütunlarına indirger
+    
+    Aynı piksel sütununa düşen kovaların en küçük ve en büyük değeri alınır;
+    sonuç en fazla `width` noktadır.
+    
+    Returns:
+        (piksel sütunları, en küçük değerler, en büyük değerler)
+    """
+    span = max(end - start, 1e-9)
+    columns = ((times - start) * ((width - 1) / span)).astype(np.int64)
+    np.clip(columns, 0, width - 1, out=columns)
+    starts = np.flatnonzero(np.diff(columns, prepend=-1))
+    return (columns[starts],
+            np.minimum.reduceat(mins, starts),
+            np.maximum.reduceat(maxs, starts))
+
+
+class StripChartWidget(QWidget):
+    """
+    Bir ya da birkaç seriyi tüm uçuş boyunca gösteren şerit grafik.
+    
+    Seriler `MinMaxDecimator` ile tutulur ve her çizimde piksel başına
+    min/max zarfı olarak çizilir; çizilen nokta sayısı örnek sayısından
+    bağımsız olarak grafik genişliğiyle sınırlıdır.
+    """
+    
+    def __init__(self, title: str, series: List[Tuple[str, str, str]],
+                 max_buckets: int = DEFAULT_MAX_BUCKETS):
+        """
+        Args:
+            title: Grafik başlığı
+            series: (alan adı, etiket, renk) listesi
+            max_buckets: Seri başına kova sayısı
+        """
+        super().__init__()
+        self.title = title
+        self.series = series
+        self.decimators: Dict[str, MinMaxDecimator] = {
+            name: MinMaxDecimator(max_buckets) for name, _, _ in series
+        }
+        self.dirty = False
+        self.setMinimumHeight(120)
+    
+    def extend(self, name: str, timestamps, values):
+        """Bir seriye örnek ekler; çizim `refresh` ile yapılır"""
+        self.decimators[name].extend(timestamps, values)
+        self.dirty = True
+    
+    def clear(self):
+        """Tüm serileri temizler"""
+        for decimator in self.decimators.values():
+            decimator.clear()
+        self.dirty = True
+        self.update()
+    
+    def refresh(self):
+        """Yeni örnek varsa ve grafik görünürse yeniden çizdirir"""
+        if self.dirty and self.isVisible():
+            self.dirty = False
+            self.update()
+    
+    def _ranges(self) -> Optional[Tuple[float, float, float, float]]:
+        """Tüm serilerin zaman ve değer aralığını döndürür"""
+        decimators = [d for d in self.decimators.values() if len(d)]
+        if not decimators:
+            return None
+        buckets = [d.buckets() for d in decimators]
+        start = min(float(times[0]) for times, _, _ in buckets)
+        end = max(d.last_time for d in decimators)
+        low = min(float(mins.min()) for _, mins, _ in buckets)
+        high = max(float(maxs.max()) for _, _, maxs in buckets)
+        if high - low < 1e-9:
+            low, high = low - 1.0, high + 1.0
+        return start, end, low, high
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#1E272E"))
+        painter.setPen(QColor("#ECF0F1"))
+        painter.drawText(8, 16, self.title)
+        
+        plot = QRectF(50, 24, max(self.width() - 60, 10), max(self.height() - 40, 10))
+        painter.setPen(QColor("#576574"))
+        painter.drawRect(plot)
+        
+        ranges = self._ranges()
+        if ranges is None:
+            painter.end()
+            return
+        start, end, low, high = ranges
+        
+        # Eksen değerleri
+        painter.setPen(QColor("#BDC3C7"))
+        painter.drawText(4, int(plot.top()) + 10, f"{high:.1f}")
+        painter.drawText(4, int(plot.bottom()), f"{low:.1f}")
+        painter.drawText(int(plot.left()), int(plot.bottom()) + 14, f"{end - start:.1f} s")
+        
+        width = int(plot.width())
+        y_scale = plot.height() / (high - low)
+        legend_x = plot.right()
+        for name, label, color in reversed(self.series):
+            decimator = self.decimators[name]
+            
+            # Son değer göstergesi sağdan sola dizilir
+            text = f"{label}: {decimator.last_value:.2f}"
+            legend_x -= painter.fontMetrics().horizontalAdvance(text) + 12
+            painter.setPen(QColor(color))
+            painter.drawText(int(legend_x), 16, text)
+            if not len(decimator):
+                continue
+            
+            columns, mins, maxs = pixel_envelope(*decimator.buckets(), start, end, width)
+            xs = (plot.left() + columns).tolist()
+            tops = (plot.bottom() - (maxs - low) * y_scale).tolist()
+            bottoms = (plot.bottom() - (mins - low) * y_scale).tolist()
+            
+            # Her piksel sütununda en büyükten en küçüğe dikey çizgi
+            points = []
+            for x, top, bottom in zip(xs, tops, bottoms):
+                points.append(QPointF(x, top))
+                points.append(QPointF(x, bottom))
+            painter.setPen(QPen(QColor(color), 1))
+            painter.drawPolyline(QPolygonF(points))
+        painter.end()
+
+
+class PlotPanel(QScrollArea):
+    """`PLOT_LAYOUT` grafiklerini alt alta gösteren kaydırılabilir panel"""
+    
+    def __init__(self, layout=PLOT_LAYOUT):
+        super().__init__()
+        self.charts: Dict[str, List[StripChartWidget]] = {}
+        
+        container = QWidget()
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        for title, group, series in layout:
+            chart = StripChartWidget(title, series)
+            self.charts.setdefault(group, []).append(chart)
+            container_layout.addWidget(chart)
+        
+        self.setWidget(container)
+        self.setWidgetResizable(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    
+    def extend(self, group: str, timestamps, columns: Dict[str, np.ndarray]):
+        """
+        Bir telemetri grubunun yeni örneklerini ilgili grafiklere ekler
+        
+        Args:
+            group: 'rocket' ya da 'payload'
+            timestamps: Alınma zamanları
+            columns: Alan adı -> değer dizisi
+        """
+        for chart in self.charts.get(group, ()):
+            for name in chart.decimators:
+                chart.extend(name, timestamps, columns[name])
+    
+    def refresh(self):
+        """Yeni örnek alan görünür grafikleri yeniden çizdirir"""
+        for charts in self.charts.values():
+            for chart in charts:
+                chart.refresh()
+    
+    def clear(self, group: Optional[str] = None):
+        """Bir grubun (None ise tümünün) grafiklerini temizler"""
+        for chart_group, charts in self.charts.items():
+            if group is None or chart_group == group:
+                for chart in charts:
+                    chart.clear()
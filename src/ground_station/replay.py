@@ -0,0 +1,117 @@
+"""
+Kayıt Oynatma Modülü
+Uçuş kayıtlarını canlı veri yoluna (`FrameQueue`) besleyerek oturumu tekrar oynatır.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from .flight_recorder import FlightLog, RECORD_DATA_SIZE
+from .serial_communication import FrameQueue, SerialFrame
+
+
+# Kayıtlar diskten bu büyüklükte parçalar halinde okunur
+REPLAY_CHUNK_SIZE = 4096
+
+
+class ReplaySource(threading.Thread):
+    """
+    Kayıtlı bir oturumu `SerialManager` yerine veri kuyruğuna besleyen kaynak.
+    
+    Oynatma hızları:
+        speed = 1.0  -> gerçek zaman
+        speed = N    -> N kat hızlandırılmış
+        speed = None -> olabildiğince hızlı (uçtan uca performans testi)
+    
+    En hızlı modda kuyruk dolduğunda beklenir, böylece hiçbir çerçeve atılmaz
+    ve ölçülen hız ayrıştırma/arayüz yolunun gerçek kapasitesidir.
+    """
+    
+    def __init__(self, log, frame_queue: FrameQueue, speed: Optional[float] = 1.0,
+                 on_finished: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            log: Kayıt dosyası yolu ya da `FlightLog`
+            frame_queue: Çerçevelerin bırakılacağı kuyruk
+            speed: Oynatma hızı çarpanı (None ise en hızlı)
+            on_finished: Oynatma bitince (oynatma thread'inden) çağrılır
+        """
+        super().__init__(name="ReplaySource", daemon=True)
+        self.log = log if isinstance(log, FlightLog) else FlightLog(log)
+        self.frame_queue = frame_queue
+        self.speed = speed
+        self.on_finished = on_finished
+        self.frames_sent = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._stop_event = threading.Event()
+    
+    def stop(self):
+        """Oynatmanın durmasını ister"""
+        self._stop_event.set()
+    
+    @property
+    def elapsed(self) -> float:
+        """Oynatmanın süresi (saniye)"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+    
+    @property
+    def frames_per_second(self) -> float:
+        """Saniyede beslenen çerçeve sayısı"""
+        elapsed = self.elapsed
+        return self.frames_sent / elapsed if elapsed > 0 else 0.0
+    
+    @property
+    def progress(self) -> float:
+        """Oynatılan kayıtların oranı (0-1)"""
+        return self.frames_sent / len(self.log) if len(self.log) else 1.0
+    
+    def run(self):
+        self.started_at = time.monotonic()
+        try:
+            self._replay()
+        finally:
+            self.finished_at = time.monotonic()
+            if self.on_finished:
+                self.on_finished()
+    
+    def _replay(self):
+        log = self.log
+        count = len(log)
+        if not count:
+            return
+        links = log.links
+        realtime = bool(self.speed)
+        first_timestamp = log[0][0]
+        
+        for chunk_start in range(0, count, REPLAY_CHUNK_SIZE):
+            # Parçayı tek seferde memmap'ten oku, kayıt başına erişimden kaçın
+            records = np.array(log.data_records(chunk_start, chunk_start + REPLAY_CHUNK_SIZE))
+            timestamps = records['timestamp'].tolist()
+            link_ids = records['link'].tolist()
+            lengths = np.minimum(records['length'], RECORD_DATA_SIZE).tolist()
+            data = records['data']
+            
+            for row, timestamp in enumerate(timestamps):
+                if self._stop_event.is_set():
+                    return
+                if realtime:
+                    target = self.started_at + (timestamp - first_timestamp) / self.speed
+                    delay = target - time.monotonic()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        return
+                
+                link_id = link_ids[row]
+                frame = SerialFrame(
+                    links.get(link_id, str(link_id)),
+                    data[row, :lengths[row]].tobytes(),
+                    timestamp,
+                    time.monotonic()
+                )
+                self.frame_queue.put(frame, block=not realtime)
+                self.frames_sent += 1
@@ -4,27 +4,99 @@ OpenGL kullanarak roketin 3D modelini çizer ve rotasyon güncellemelerini yapar
 """
 
 import math
+import time
+from collections import deque
+from PyQt5.QtCore import QTimer
 from PyQt5.QtOpenGL import QGLWidget
 from PyQt5.QtWidgets import QSizePolicy
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
+from .trajectory import TrajectoryTrail
+
+
+# Varsayılan kare hızı sınırı
+DEFAULT_MAX_FPS = 60
+
+# Uçuş izinin sahnede kaplayacağı en büyük boy (sahne birimi)
+TRAIL_SCENE_SIZE = 20.0
+
 
 class RocketGLWidget(QGLWidget):
-    """3D roket görselleştirme widget'ı"""
+    """
+    3D roket görselleştirme widget'ı.
+    
+    Telemetri yalnızca en son yönelimi günceller; sahne kendi zamanlayıcısıyla
+    en fazla `max_fps` hızında yeniden çizilir. Çizilmeden üzerine yazılan
+    yönelimler atlanan kare olarak sayılır.
+    """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_fps: int = DEFAULT_MAX_FPS):
         super(RocketGLWidget, self).__init__(parent)
         self.x_rot = 0
         self.y_rot = 0
         self.z_rot = 0
+        self.rocket_list = 0
+        self.trail = TrajectoryTrail()
+        self.trail_buffer = 0
+        self.dirty = True
+        self.skipped_frames = 0
+        self.frame_times = deque(maxlen=240)
+        self.paint_times = deque(maxlen=240)
+        # Yeni verinin çizildiği anı işaretleyen `LatencyTracker` (isteğe bağlı)
+        self.latency = None
+        self.render_timer = QTimer(self)
+        self.render_timer.timeout.connect(self._on_render_tick)
+        self.set_max_fps(max_fps)
         self.setMinimumSize(400, 400)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
+    def set_max_fps(self, max_fps: int):
+        """Kare hızı sınırını ayarlar"""
+        self.max_fps = max_fps
+        self.render_timer.start(max(1, int(1000 / max_fps)))
+        
+    def _on_render_tick(self):
+        """Yeni yönelim varsa sahneyi yeniden çizdirir"""
+        if self.dirty:
+            self.update()
+        
     def initializeGL(self):
         """OpenGL başlatma"""
         glClearColor(0.0, 0.0, 0.0, 0.0)
         glEnable(GL_DEPTH_TEST)
+        self._build_rocket_list()
+        self._create_trail_buffer()
+        
+    def _build_rocket_list(self):
+        """
+        Roket geometrisini bir kez display list'e derler.
+        Her karede trigonometri ve binlerce glVertex çağrısı yerine
+        tek glCallList çağrısı yapılır.
+        """
+        if self.rocket_list:
+            glDeleteLists(self.rocket_list, 1)
+        self.rocket_list = glGenLists(1)
+        glNewList(self.rocket_list, GL_COMPILE)
+        self._draw_rocket_body()
+        self._draw_rocket_nose()
+        self._draw_rocket_fins()
+        self._draw_propeller()
+        self._draw_axes()
+        glEndList()
+        
+    def _create_trail_buffer(self):
+        """
+        Uçuş izi için tam kapasitede bir vertex buffer ayırır.
+        Sonraki karelerde yalnızca yeni köşeler glBufferSubData ile yüklenir.
+        """
+        if self.trail_buffer:
+            glDeleteBuffers(1, [self.trail_buffer])
+        self.trail_buffer = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.trail_buffer)
+        glBufferData(GL_ARRAY_BUFFER, self.trail.vertices.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.trail.synced = 0
         
     def resizeGL(self, w, h):
         """Pencere boyutu değiştiğinde çağrılır"""
@@ -36,21 +108,97 @@ class RocketGLWidget(QGLWidget):
         
     def paintGL(self):
         """3D sahneyi çizer"""
+        start = time.perf_counter()
+        self.dirty = False
+        self.paint_times.append(start)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
         gluLookAt(25, 0, 0, 0, 0, 0, 0, 1, 0)
         
+        # Uçuş izi dünya eksenlerinde, roket orijinde olacak şekilde çizilir
+        self._draw_trail()
+        
         # Rotasyon uygula
         glRotatef(self.x_rot, 1.0, 0.0, 0.0)
         glRotatef(self.z_rot, 0.0, 1.0, 0.0)
         glRotatef(self.y_rot, 0.0, 0.0, 1.0)
         
-        # Roket parçalarını çiz
-        self._draw_rocket_body()
-        self._draw_rocket_nose()
-        self._draw_rocket_fins()
-        self._draw_propeller()
-        self._draw_axes()
+        # Önceden derlenmiş roket geometrisini çiz
+        glCallList(self.rocket_list)
+        self.frame_times.append(time.perf_counter() - start)
+        if self.latency:
+            self.latency.painted()
+        
+        self._draw_overlay()
+        
+    def _draw_overlay(self):
+        """Kare istatistiklerini sol üst köşeye yazar"""
+        stats = self.get_render_stats()
+        glColor3f(1.0, 1.0, 1.0)
+        self.renderText(10, 20, f"FPS: {stats['fps']:.1f} / {self.max_fps}")
+        self.renderText(10, 36, f"Çizim: p50 {stats['p50_ms']:.2f}  p95 {stats['p95_ms']:.2f}  "
+                                f"p99 {stats['p99_ms']:.2f} ms")
+        self.renderText(10, 52, f"Atlanan: {self.skipped_frames}")
+        self.renderText(10, 68, f"İz: {self.trail.count} / {self.trail.total_points} nokta")
+        
+    def _draw_trail(self):
+        """Uçuş izini vertex buffer'dan tek çağrıyla çizer"""
+        trail = self.trail
+        if trail.count < 2 or not self.trail_buffer:
+            return
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.trail_buffer)
+        start, pending = trail.pending()
+        if pending.size:
+            glBufferSubData(GL_ARRAY_BUFFER, start * trail.vertices.itemsize * 3,
+                            pending.nbytes, pending)
+            trail.mark_synced()
+        
+        glPushMatrix()
+        scale = TRAIL_SCENE_SIZE / max(trail.extent, 1.0)
+        glScalef(scale, scale, scale)
+        x, y, z = trail.latest.tolist()
+        glTranslatef(-x, -y, -z)
+        glColor3f(1.0, 0.85, 0.0)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glDrawArrays(GL_LINE_STRIP, 0, trail.count)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glPopMatrix()
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+    def average_frame_time(self) -> float:
+        """Son karelerin ortalama çizim süresini döndürür (saniye)"""
+        if not self.frame_times:
+            return 0.0
+        return sum(self.frame_times) / len(self.frame_times)
+        
+    def get_render_stats(self) -> dict:
+        """
+        Çizim istatistiklerini döndürür
+        
+        Returns:
+            dict: Ölçülen FPS, çizim süresi yüzdelikleri (ms) ve atlanan kareler
+        """
+        paint_times = self.paint_times
+        fps = 0.0
+        if len(paint_times) > 1 and paint_times[-1] > paint_times[0]:
+            fps = (len(paint_times) - 1) / (paint_times[-1] - paint_times[0])
+        
+        frame_times = sorted(self.frame_times)
+        
+        def percentile(fraction):
+            if not frame_times:
+                return 0.0
+            return frame_times[min(len(frame_times) - 1, int(fraction * len(frame_times)))] * 1000
+        
+        return {
+            'fps': fps,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'skipped_frames': self.skipped_frames
+        }
         
     def _draw_rocket_body(self):
         """Roket gövdesini çizer"""
@@ -228,8 +376,20 @@ class RocketGLWidget(QGLWidget):
         glEnd()
         
     def update_rotation(self, x, y, z):
-        """Roket rotasyonunu günceller"""
+        """Roket rotasyonunu günceller; çizim bir sonraki karede yapılır"""
+        if self.dirty:
+            self.skipped_frames += 1
         self.x_rot = x
         self.y_rot = y
         self.z_rot = z
-        self.update()
+        self.dirty = True
+        
+    def extend_trajectory(self, latitude, longitude, altitude):
+        """Uçuş izine yeni GPS konumları ekler; çizim bir sonraki karede yapılır"""
+        self.trail.extend(latitude, longitude, altitude)
+        self.dirty = True
+        
+    def clear_trajectory(self):
+        """Uçuş izini temizler"""
+        self.trail.clear()
+        self.dirty = True
@@ -3,21 +3,377 @@ Seri Port İletişim Modülü
 Roket ve görev yükü ile seri port üzerinden iletişim kurar.
 """
 
+import os
+import selectors
 import serial
+import statistics
 import struct
+import threading
+import time
+from collections import deque
 from serial.tools import list_ports
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple, NamedTuple
 
+from .data_models import HYIPacket, TELEMETRY_SCHEMA
+from .telemetry_codec import compile_gatherer
 
-class SerialManager:
-    """Seri port yöneticisi"""
+
+# Okuyucu thread'lerin port başına bekleme süresi (saniye)
+READ_TIMEOUT = 0.1
+
+# Tanımlayıcısı olmayan bağlantıların (Windows, loop://) yoklama aralığı (saniye)
+POLL_INTERVAL = 0.005
+
+# Satır sonu gelmeden biriken verinin üst sınırı (bayt)
+MAX_PARTIAL_LINE = 64 * 1024
+
+
+def split_lines(buffer: bytearray, chunk: bytes) -> List[bytes]:
+    """
+    Okunan parçayı bağlantı tamponuna ekler ve tamamlanan satırları döndürür
+    
+    Yarım kalan satır tamponda saklanır ve sonraki parçayla tamamlanır.
+    Satır sonu gelmeden `MAX_PARTIAL_LINE` aşılırsa tampon atılır.
+    
+    Args:
+        buffer: Bağlantıya ait tampon (yerinde güncellenir)
+        chunk: Porttan okunan veri
+        
+    Returns:
+        List[bytes]: Boş olmayan, kırpılmış satırlar
+    """
+    buffer += chunk
+    end = buffer.rfind(b'\n')
+    if end < 0:
+        if len(buffer) > MAX_PARTIAL_LINE:
+            buffer.clear()
+        return []
+    
+    lines = bytes(buffer[:end]).split(b'\n')
+    del buffer[:end + 1]
+    return [line for line in map(bytes.strip, lines) if line]
+
+
+class SerialFrame(NamedTuple):
+    """Seri porttan okunan, zaman damgalı tek bir satır"""
+    connection_type: str
+    raw: bytes
+    timestamp: float
+    monotonic: float
+    
+    @property
+    def text(self) -> str:
+        """Satırı metin olarak döndürür"""
+        return self.raw.decode('utf-8', errors='replace').strip()
+
+
+class FrameQueue:
+    """
+    Okuyucu thread'lerden arayüze çerçeve taşıyan sınırlı kuyruk.
+    
+    Kuyruk dolduğunda en eski çerçeve atılır; böylece arayüz geride kalsa
+    bile her zaman en yeni veriler işlenir. Bildirim fonksiyonu yalnızca
+    kuyruk boşken yeni çerçeve geldiğinde çağrılır.
+    """
+    
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._frames = deque()
+        self._condition = threading.Condition()
+        self._notify: Optional[Callable[[], None]] = None
+        self._notify_pending = False
+    
+    def set_notify(self, callback: Optional[Callable[[], None]]):
+        """Yeni çerçeve bildirimi için fonksiyon atar"""
+        self._notify = callback
+    
+    def put(self, frame: SerialFrame, block: bool = False) -> bool:
+        """
+        Kuyruğa çerçeve ekler
+        
+        Args:
+            frame: Eklenecek çerçeve
+            block: True ise kuyruk doluyken yer açılmasını bekler
+            
+        Returns:
+            bool: Eski bir çerçeve atılmadan eklendi ise True
+        """
+        notify = None
+        dropped = False
+        with self._condition:
+            while len(self._frames) >= self.maxsize:
+                if block:
+                    self._condition.wait()
+                else:
+                    self._frames.popleft()
+                    self.dropped += 1
+                    dropped = True
+            self._frames.append(frame)
+            if not self._notify_pending and self._notify:
+                self._notify_pending = True
+                notify = self._notify
+        if notify:
+            notify()
+        return not dropped
+    
+    def drain(self) -> List[SerialFrame]:
+        """Kuyruktaki tüm çerçeveleri alır"""
+        with self._condition:
+            frames = list(self._frames)
+            self._frames.clear()
+            self._notify_pending = False
+            self._condition.notify_all()
+        return frames
+    
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+class LineDecoder:
+    """Satır sonuyla ayrılmış (CSV/JSON) telemetriyi satırlara böler"""
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Okunan parçayı ekler, tamamlanan satırları döndürür"""
+        return split_lines(self.buffer, chunk)
+
+
+class HYIFrameDecoder:
+    """
+    Bayt akışından doğrulanmış 78 baytlık HYI paketlerini ayırır
+    
+    Başka bir istasyonun HYI çıkışını dinleyen bağlantılar için kullanılır;
+    kontrol toplamı tutmayan başlıklar atlanır.
+    """
+    
+    def __init__(self):
+        self.buffer = bytearray()
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Okunan parçayı ekler, tamamlanan paketleri döndürür"""
+        buffer = self.buffer
+        buffer += chunk
+        packets = []
+        position = 0
+        while True:
+            start = buffer.find(HYI_HEADER, position)
+            if start < 0:
+                # Sonda başlığın ilk baytları olabilir, onları bırak
+                position = max(position, len(buffer) - len(HYI_HEADER) + 1)
+                break
+            if start + HYI_PACKET_SIZE > len(buffer):
+                position = start
+                break
+            packet = bytes(buffer[start:start + HYI_PACKET_SIZE])
+            try:
+                HYIProtocol.decode_packet(packet)
+            except ValueError:
+                position = start + 1
+                continue
+            packets.append(packet)
+            position = start + HYI_PACKET_SIZE
+        del buffer[:position]
+        if len(buffer) > MAX_PARTIAL_LINE:
+            buffer.clear()
+        return packets
+
+
+# Bağlantı çözücüleri: okunan baytları çerçevelere böler
+DECODERS = {
+    'line': LineDecoder,
+    'hyi': HYIFrameDecoder
+}
+
+# Bağlantı rolleri: telemetri grupları ve HYI
+LINK_ROLES = ('rocket', 'payload', 'hyi')
+
+# Rol verilip çözücü verilmediğinde kullanılacak çözücü
+ROLE_DECODERS = {
+    'rocket': 'line',
+    'payload': 'line',
+    'hyi': 'hyi'
+}
+
+
+class LinkConfig(NamedTuple):
+    """Kayıtlı bir seri bağlantının tanımı"""
+    link_id: str
+    role: str
+    decoder: str
+
+
+# Her zaman tanımlı olan bağlantılar (bağlantı kimliği rolüyle aynı)
+DEFAULT_LINKS = tuple(LinkConfig(role, role, ROLE_DECODERS[role]) for role in LINK_ROLES)
+
+
+def link_fileno(connection) -> Optional[int]:
+    """Seçiciye eklenebilecek dosya tanımlayıcısını döndürür (yoksa None)"""
+    if os.name != 'posix':
+        return None
+    try:
+        return connection.fileno()
+    except (AttributeError, NotImplementedError, OSError, serial.SerialException):
+        return None
+
+
+class LinkRegistry:
+    """
+    Bağlantı kimliklerini rol ve çözücüleriyle eşleyen kayıt.
+    
+    Seri port yöneticilerinin ortak tabanıdır. Varsayılan 'rocket',
+    'payload' ve 'hyi' bağlantıları her zaman tanımlıdır; çok araçlı
+    uçuşlarda ek alıcılar `register_link` ile eklenir.
+    """
     
     def __init__(self):
-        self.connections: Dict[str, Optional[serial.Serial]] = {
-            'rocket': None,
-            'payload': None,
-            'hyi': None
+        self.link_configs: Dict[str, LinkConfig] = {
+            config.link_id: config for config in DEFAULT_LINKS
         }
+    
+    def register_link(self, link_id: str, role: str,
+                      decoder: Optional[str] = None) -> LinkConfig:
+        """
+        Yeni bir bağlantı tanımlar (varsa tanımı günceller)
+        
+        Args:
+            link_id: Bağlantı kimliği (örn: 'rocket2')
+            role: Bağlantı rolü ('rocket', 'payload', 'hyi')
+            decoder: Çözücü adı (None ise role göre seçilir)
+        
+        Returns:
+            LinkConfig: Kaydedilen tanım
+        """
+        if role not in LINK_ROLES:
+            raise ValueError(f"Bilinmeyen bağlantı rolü: {role}")
+        decoder = decoder or ROLE_DECODERS[role]
+        if decoder not in DECODERS:
+            raise ValueError(f"Bilinmeyen çözücü: {decoder}")
+        config = LinkConfig(link_id, role, decoder)
+        self.link_configs[link_id] = config
+        return config
+    
+    def unregister_link(self, link_id: str):
+        """Bağlantıyı kapatır ve tanımını siler"""
+        self.disconnect(link_id)
+        self.link_configs.pop(link_id, None)
+    
+    def link_role(self, link_id: str) -> Optional[str]:
+        """Bağlantının rolünü döndürür (tanımlı değilse None)"""
+        config = self.link_configs.get(link_id)
+        return config.role if config else None
+    
+    def create_decoder(self, link_id: str):
+        """Bağlantının çözücüsünden yeni bir örnek oluşturur"""
+        return DECODERS[self.link_configs[link_id].decoder]()
+
+
+class SelectorReader(threading.Thread):
+    """
+    Tüm okuma bağlantılarını tek thread'de bekleyen okuyucu.
+    
+    POSIX'te port tanımlayıcıları `selectors` ile (epoll/kqueue) izlenir;
+    thread yalnızca veri gelen portlar için uyanır, bağlantı sayısı arttıkça
+    boşta harcanan işlemci artmaz. Tanımlayıcısı olmayan bağlantılar
+    (Windows, loop://) `POLL_INTERVAL` aralığıyla yoklanır.
+    """
+    
+    def __init__(self, manager: 'SerialManager', frame_queue: FrameQueue):
+        super().__init__(name="SerialReader", daemon=True)
+        self.manager = manager
+        self.frame_queue = frame_queue
+        self.selector = selectors.DefaultSelector()
+        self.polled: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+    
+    def add(self, link_id: str, connection):
+        """Bağlantıyı izlemeye başlar"""
+        fd = link_fileno(connection)
+        with self._lock:
+            if fd is None:
+                self.polled[link_id] = connection
+            else:
+                self.selector.register(fd, selectors.EVENT_READ, link_id)
+    
+    def remove(self, link_id: str):
+        """Bağlantıyı izlemeyi bırakır (port kapatılmadan önce çağrılmalı)"""
+        with self._lock:
+            self.polled.pop(link_id, None)
+            for key in list(self.selector.get_map().values()):
+                if key.data == link_id:
+                    self.selector.unregister(key.fileobj)
+    
+    def stop(self):
+        """Thread'in durmasını ister"""
+        self._stop_event.set()
+    
+    def run(self):
+        while not self._stop_event.is_set():
+            timeout = POLL_INTERVAL if self.polled else READ_TIMEOUT
+            if self.selector.get_map():
+                events = self.selector.select(timeout)
+            else:
+                self._stop_event.wait(timeout)
+                events = []
+            
+            with self._lock:
+                registered = self.selector.get_map()
+                for key, _ in events:
+                    # Seçim sırasında kaldırılan bağlantıları atla
+                    if registered.get(key.fd) is key:
+                        self._read(key.data, wait=True)
+                for link_id in list(self.polled):
+                    self._read(link_id, wait=False)
+        self.selector.close()
+    
+    def _read(self, link_id: str, wait: bool):
+        """
+        Hazır bağlantıyı okur ve satırları kuyruğa ekler
+        
+        Seçici hazır dediğinde `wait` ile okunur; port kapanmışsa (EOF)
+        okuma hata verir ve bağlantı izlemeden çıkarılır.
+        """
+        try:
+            lines = self.manager._read_frames(link_id, wait)
+        except Exception as e:
+            if not self._stop_event.is_set():
+                print(f"Veri okuma hatası ({link_id}): {e}")
+            self.manager.stop_reader(link_id)
+            return
+        if not lines:
+            return
+            
+        # Aynı okumada gelen satırlar aynı zaman damgasını paylaşır
+        timestamp = time.time()
+        monotonic = time.monotonic()
+        recorder = self.manager.recorder
+        for line in lines:
+            if recorder:
+                recorder.record(link_id, line, timestamp)
+            self.frame_queue.put(SerialFrame(link_id, line, timestamp, monotonic))
+
+
+class SerialManager(LinkRegistry):
+    """
+    Seri port yöneticisi
+
+    Bağlantılar `LinkRegistry` ile tanımlanır; okuması başlatılan tüm
+    bağlantılar tek bir `SelectorReader` thread'inde okunur.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.connections: Dict[str, serial.Serial] = {}
+        self.readers: Dict[str, serial.Serial] = {}
+        self.frame_queue = FrameQueue()
+        self._decoders: Dict[str, Any] = {}
+        self._reader: Optional[SelectorReader] = None
+        self._write_lock = threading.Lock()
+        # Okunan her satırı diske yazan kaydedici (`FlightRecorder`)
+        self.recorder = None
         
     def get_available_ports(self) -> List[str]:
         """Mevcut seri portları listeler"""
@@ -31,23 +387,27 @@ class SerialManager:
         Args:
             port_name: Port adı (örn: 'COM3', '/dev/ttyUSB0')
             baud_rate: Baud hızı
-            connection_type: Bağlantı türü ('rocket', 'payload', 'hyi')
+            connection_type: Bağlantı kimliği ('rocket', 'payload', 'hyi' ya da
+                `register_link` ile eklenen)
             
         Returns:
             bool: Bağlantı başarılı ise True
         """
+        if connection_type not in self.link_configs:
+            print(f"Tanımsız bağlantı: {connection_type}")
+            return False
         try:
-            if connection_type in self.connections:
-                # Mevcut bağlantıyı kapat
-                self.disconnect(connection_type)
+            # Mevcut bağlantıyı kapat
+            self.disconnect(connection_type)
+            self._decoders[connection_type] = self.create_decoder(connection_type)
                 
-                # Yeni bağlantı aç
-                self.connections[connection_type] = serial.Serial(
-                    port_name, 
-                    baud_rate, 
-                    timeout=1
-                )
-                return True
+            # Yeni bağlantı aç
+            self.connections[connection_type] = serial.serial_for_url(
+                port_name, 
+                baud_rate, 
+                timeout=READ_TIMEOUT
+            )
+            return True
         except Exception as e:
             print(f"Seri port bağlantı hatası ({connection_type}): {e}")
             return False
@@ -62,23 +422,94 @@ class SerialManager:
         Returns:
             bool: Bağlantı kapatıldı ise True
         """
+        self.stop_reader(connection_type)
         try:
-            if (connection_type in self.connections and 
-                self.connections[connection_type] and 
-                self.connections[connection_type].is_open):
-                
-                self.connections[connection_type].close()
-                self.connections[connection_type] = None
-                return True
+            # Başka bir thread'in yazması sürerken port kapanmasın
+            with self._write_lock:
+                connection = self.connections.pop(connection_type, None)
+                if connection and connection.is_open:
+                    connection.close()
+                    return True
         except Exception as e:
             print(f"Seri port kapatma hatası ({connection_type}): {e}")
         return False
     
     def is_connected(self, connection_type: str) -> bool:
         """Bağlantı durumunu kontrol eder"""
-        return (connection_type in self.connections and 
-                self.connections[connection_type] and 
-                self.connections[connection_type].is_open)
+        connection = self.connections.get(connection_type)
+        return bool(connection and connection.is_open)
+    
+    def start_reader(self, connection_type: str) -> bool:
+        """
+        Bağlantıyı ortak okuyucu thread'ine ekler (gerekirse thread'i başlatır).
+        Okunan satırlar zaman damgasıyla `frame_queue` kuyruğuna eklenir.
+        
+        Args:
+            connection_type: Bağlantı kimliği
+            
+        Returns:
+            bool: Bağlantı okunuyor ise True
+        """
+        if not self.is_connected(connection_type):
+            return False
+        if connection_type in self.readers:
+            return True
+        if self._reader is None or not self._reader.is_alive():
+            self._reader = SelectorReader(self, self.frame_queue)
+            self._reader.start()
+        connection = self.connections[connection_type]
+        self._reader.add(connection_type, connection)
+        self.readers[connection_type] = connection
+        return True
+    
+    def stop_reader(self, connection_type: str):
+        """Bağlantıyı ortak okuyucudan çıkarır"""
+        if self.readers.pop(connection_type, None) is not None and self._reader:
+            self._reader.remove(connection_type)
+    
+    def read_frames(self, connection_type: str, wait: bool = False) -> List[bytes]:
+        """
+        Port tamponundaki tüm veriyi tek `read()` çağrısıyla okur
+        
+        Yarım kalan satır bağlantıya ait tamponda saklanır ve sonraki
+        okumada tamamlanır.
+        
+        Args:
+            connection_type: Bağlantı türü
+            wait: True ise veri yokken port zaman aşımı kadar bekler
+            
+        Returns:
+            List[bytes]: Tamamlanmış satırlar, hata durumunda boş liste
+        """
+        try:
+            return self._read_frames(connection_type, wait)
+        except Exception as e:
+            print(f"Veri okuma hatası ({connection_type}): {e}")
+        return []
+    
+    def _read_frames(self, connection_type: str, wait: bool) -> List[bytes]:
+        """`read_frames` gövdesi; okuma hatalarını yukarı iletir"""
+        if not self.is_connected(connection_type):
+            return []
+        connection = self.connections[connection_type]
+        waiting = connection.in_waiting
+        if waiting:
+            chunk = connection.read(waiting)
+        elif wait:
+            # İlk bayt için zaman aşımı kadar bekle, ardından kalanı al
+            chunk = connection.read(1)
+            if chunk and connection.in_waiting:
+                chunk += connection.read(connection.in_waiting)
+        else:
+            return []
+        if not chunk:
+            return []
+        
+        return self._decoders[connection_type].feed(chunk)
+    
+    def get_frames(self) -> List[SerialFrame]:
+        """Okuyucuların biriktirdiği tüm çerçeveleri döndürür"""
+        return self.frame_queue.drain()
     
     def read_data(self, connection_type: str) -> Optional[str]:
         """
@@ -111,21 +542,215 @@ class SerialManager:
             bool: Yazma başarılı ise True
         """
         try:
-            if self.is_connected(connection_type):
-                self.connections[connection_type].write(data)
-                return True
+            # Zamanlayıcı ve arayüz aynı anda yazabilir, paketler karışmasın
+            with self._write_lock:
+                connection = self.connections.get(connection_type)
+                if connection and connection.is_open:
+                    connection.write(data)
+                    return True
         except Exception as e:
             print(f"Veri yazma hatası ({connection_type}): {e}")
         return False
     
     def close_all(self):
         """Tüm bağlantıları kapatır"""
-        for connection_type in self.connections:
+        for connection_type in list(self.connections):
             self.disconnect(connection_type)
+        if self._reader:
+            self._reader.stop()
+            if self._reader is not threading.current_thread():
+                self._reader.join(timeout=READ_TIMEOUT * 5)
+            self._reader = None
+
+
+def create_serial_manager(transport: str = 'thread'):
+    """
+    Seçilen taşıma katmanına göre seri port yöneticisini oluşturur
+    
+    Args:
+        transport: 'thread' (bağlantı başına okuyucu thread) ya da
+            'asyncio' (tüm bağlantılar tek olay döngüsünde)
+    """
+    if transport == 'asyncio':
+        from .async_serial import AsyncSerialManager
+        return AsyncSerialManager()
+    if transport != 'thread':
+        raise ValueError(f"Bilinmeyen taşıma katmanı: {transport}")
+    return SerialManager()
+
+
+# HYI paket yerleşimi: başlık, takım ID, sayaç, 7 float, 12 bayt boşluk,
+# 7 float, durum, kontrol toplamı ve footer (toplam 78 bayt)
+HYI_PACKET_SIZE = 78
+HYI_HEADER = b'\xff\xff\x54\x52'
+HYI_FOOTER = b'\x0d\x0a'
+HYI_STRUCT = struct.Struct('<4sBB7f12x7fBB2s')
+HYI_FIELDS = ('team_id', 'counter',
+              'MSIrtifa', 'RoketGPSIrtifa', 'Enlem', 'Boylam',
+              'GorevYukuIrtifa', 'GorevYukuEnlem', 'GorevYukuBoylam',
+              'Gx', 'Gy', 'Gz', 'Ax', 'Ay', 'Az', 'aci', 'durum')
+
+# Paket değerlerini roket/görev yükü kayıtlarından ya da sözlüklerinden HYI
+# sırasıyla toplayan, şemadan derlenmiş fonksiyonlar
+hyi_values = compile_gatherer(HYI_FIELDS[2:], TELEMETRY_SCHEMA)
+hyi_values_from_dicts = compile_gatherer(HYI_FIELDS[2:], TELEMETRY_SCHEMA, mapping=True)
+
+
+def hyi_dtype():
+    """HYI paketinin NumPy yapısal veri tipini döndürür"""
+    import numpy as np
+    
+    names = ['header'] + list(HYI_FIELDS) + ['checksum', 'footer']
+    formats = (['4u1', 'u1', 'u1'] + ['<f4'] * 7 + ['<f4'] * 7 +
+               ['u1', 'u1', '2u1'])
+    offsets = ([0, 4, 5] + [6 + 4 * i for i in range(7)] +
+               [46 + 4 * i for i in range(7)] + [74, 75, 76])
+    return np.dtype({'names': names, 'formats': formats,
+                     'offsets': offsets, 'itemsize': HYI_PACKET_SIZE})
+
+
+def pack_hyi_packet(buffer, offset: int, team_id: int, counter: int,
+                    *values) -> None:
+    """
+    HYI paketini tampona yazar ve kontrol toplamını hesaplar
+    
+    Args:
+        buffer: Yazılabilir tampon (en az `offset` + 78 bayt)
+        offset: Paketin başlangıç konumu
+        team_id: Takım ID'si
+        counter: Sayaç (8 bit, taşmada başa döner)
+        values: Başlık ile kontrol toplamı arasındaki 14 float ve durum
+    """
+    *floats, durum = values
+    HYI_STRUCT.pack_into(buffer, offset, HYI_HEADER, team_id & 0xFF,
+                         counter & 0xFF, *floats, int(durum) & 0xFF, 0,
+                         HYI_FOOTER)
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    view[offset + 75] = sum(view[offset + 4:offset + 75]) % 256
 
 
 class HYIProtocol:
-    """HYI protokolü için paket oluşturma ve gönderme"""
+    """HYI protokolü için paket oluşturma, gönderme ve çözme"""
+    
+    @staticmethod
+    def checksum(packet: bytes) -> int:
+        """Takım ID'den durum baytına kadar olan kontrol toplamını hesaplar"""
+        return sum(packet[4:75]) % 256
+    
+    @staticmethod
+    def decode_packet(packet: bytes) -> HYIPacket:
+        """
+        Tek bir HYI paketini çözer
+        
+        Args:
+            packet: 78 baytlık HYI paketi
+            
+        Returns:
+            HYIPacket: Çözülmüş paket
+            
+        Raises:
+            ValueError: Uzunluk, başlık, footer veya kontrol toplamı hatalı ise
+        """
+        if len(packet) != HYI_PACKET_SIZE:
+            raise ValueError(f"Geçersiz HYI paket uzunluğu: {len(packet)}")
+        values = HYI_STRUCT.unpack(packet)
+        if values[0] != HYI_HEADER:
+            raise ValueError("Geçersiz HYI başlığı")
+        if values[-1] != HYI_FOOTER:
+            raise ValueError("Geçersiz HYI footer")
+        if values[-2] != HYIProtocol.checksum(packet):
+            raise ValueError("HYI kontrol toplamı hatası")
+        return HYIPacket(*values[1:-2])
+    
+    @staticmethod
+    def decode_stream(data: bytes) -> Tuple[List[HYIPacket], int]:
+        """
+        Bayt akışındaki tüm geçerli HYI paketlerini bulur
+        
+        Başlık bulunup doğrulanamayan konumlar atlanır; akışın sonunda
+        yarım kalan paket bir sonraki çağrı için bırakılır.
+        
+        Args:
+            data: Ham bayt akışı
+            
+        Returns:
+            Tuple[List[HYIPacket], int]: Paketler ve tüketilen bayt sayısı
+        """
+        packets = []
+        position = 0
+        while True:
+            start = data.find(HYI_HEADER, position)
+            if start < 0:
+                # Sonda başlığın ilk baytları olabilir, onları bırak
+                return packets, max(position, len(data) - len(HYI_HEADER) + 1)
+            if start + HYI_PACKET_SIZE > len(data):
+                return packets, start
+            try:
+                packets.append(HYIProtocol.decode_packet(
+                    bytes(data[start:start + HYI_PACKET_SIZE])
+                ))
+                position = start + HYI_PACKET_SIZE
+            except ValueError:
+                position = start + 1
+    
+    @staticmethod
+    def parse_capture(data: bytes):
+        """
+        HYI kayıt verisini tek bir vektörel geçişte çözer
+        
+        Args:
+            data: Ham bayt akışı
+            
+        Returns:
+            numpy.ndarray: `hyi_dtype()` tipinde geçerli paketler
+        """
+        import numpy as np
+        
+        dtype = hyi_dtype()
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        count = buffer.size - HYI_PACKET_SIZE + 1
+        if count <= 0:
+            return np.empty(0, dtype=dtype)
+        
+        # Başlık ve footer'ı tutan aday konumlar
+        candidate = np.ones(count, dtype=bool)
+        for offset, value in enumerate(HYI_HEADER):
+            candidate &= buffer[offset:offset + count] == value
+        for offset, value in enumerate(HYI_FOOTER, start=76):
+            candidate &= buffer[offset:offset + count] == value
+        starts = np.flatnonzero(candidate)
+        
+        # Kontrol toplamını tüm adaylar için birlikte doğrula
+        rows = buffer[starts[:, None] + np.arange(HYI_PACKET_SIZE)]
+        checksum = rows[:, 4:75].sum(axis=1, dtype=np.uint32) % 256
+        valid = checksum == rows[:, 75]
+        starts = starts[valid]
+        rows = rows[valid]
+        
+        # Geçerli bir paketin içine denk gelen sahte başlıkları at. `decode_stream`
+        # gibi son kabul edilen paketten itibaren açgözlü seçilir; yalnızca
+        # bir öncekiyle çakışan (az sayıdaki) adaylar tek tek incelenir.
+        valid = np.ones(starts.size, dtype=bool)
+        for index in (np.flatnonzero(np.diff(starts) < HYI_PACKET_SIZE) + 1).tolist():
+            previous = index - 1
+            while not valid[previous]:
+                previous -= 1
+            valid[index] = starts[index] - starts[previous] >= HYI_PACKET_SIZE
+        return np.ascontiguousarray(rows[valid]).view(dtype).reshape(-1)
+    
+    @staticmethod
+    def load_capture(path: str):
+        """
+        HYI kayıt dosyasını okur ve çözer
+        
+        Args:
+            path: Kayıt dosyasının yolu
+            
+        Returns:
+            numpy.ndarray: `hyi_dtype()` tipinde geçerli paketler
+        """
+        with open(path, 'rb') as capture:
+            return HYIProtocol.parse_capture(capture.read())
     
     @staticmethod
     def create_packet(team_id: int, counter: int, rocket_data: Dict[str, Any], 
@@ -142,49 +767,159 @@ class HYIProtocol:
         Returns:
             bytearray: HYI paketi
         """
-        packet = bytearray(78)
-        
-        # Başlık
-        packet[0] = 0xFF
-        packet[1] = 0xFF
-        packet[2] = 0x54
-        packet[3] = 0x52
-        
-        # Takım ID ve sayaç
-        packet[4] = team_id
-        packet[5] = counter
-        
-        # Roket verileri
-        packet[6:10] = struct.pack('<f', rocket_data.get('MSIrtifa', 0.0))
-        packet[10:14] = struct.pack('<f', rocket_data.get('RoketGPSIrtifa', 0.0))
-        packet[14:18] = struct.pack('<f', rocket_data.get('Enlem', 0.0))
-        packet[18:22] = struct.pack('<f', rocket_data.get('Boylam', 0.0))
+        packet = bytearray(HYI_PACKET_SIZE)
+        pack_hyi_packet(packet, 0, team_id, counter,
+                        *hyi_values_from_dicts(rocket_data, payload_data))
+        return packet
+
+
+class HYIEncoder:
+    """
+    Tekrar kullanılan tampona HYI paketi yazan kodlayıcı.
+    
+    Paket tek bir önceden derlenmiş `struct.Struct` ile `pack_into` üzerinden
+    yazılır; gönderim başına yeni nesne oluşturulmaz. Dönen `memoryview`
+    bir sonraki `encode` çağrısında üzerine yazılır.
+    """
+    
+    def __init__(self, team_id: int = 0):
+        self.team_id = team_id
+        self.buffer = bytearray(HYI_PACKET_SIZE)
+        self._view = memoryview(self.buffer)
+    
+    def encode(self, counter: int, rocket, payload) -> memoryview:
+        """
+        Roket ve görev yükü verilerinden HYI paketi oluşturur
         
-        # Görev yükü verileri
-        packet[22:26] = struct.pack('<f', payload_data.get('GorevYukuIrtifa', 0.0))
-        packet[26:30] = struct.pack('<f', payload_data.get('GorevYukuEnlem', 0.0))
-        packet[30:34] = struct.pack('<f', payload_data.get('GorevYukuBoylam', 0.0))
+        Args:
+            counter: Sayaç
+            rocket: Roket verileri (`RocketData`)
+            payload: Görev yükü verileri (`PayloadData`)
         
-        # Gyro verileri
-        packet[46:50] = struct.pack('<f', rocket_data.get('Gx', 0.0))
-        packet[50:54] = struct.pack('<f', rocket_data.get('Gy', 0.0))
-        packet[54:58] = struct.pack('<f', rocket_data.get('Gz', 0.0))
+        Returns:
+            memoryview: Kodlayıcının tamponundaki paket
+        """
+        self.encode_into(self._view, 0, counter, rocket, payload)
+        return self._view
+    
+    def encode_into(self, buffer, offset: int, counter: int, rocket, payload):
+        """Paketi verilen tampona (veya `memoryview`) `offset` konumundan itibaren yazar"""
+        pack_hyi_packet(buffer, offset, self.team_id, counter, *hyi_values(rocket, payload))
+    
+    def encode_many(self, snapshots) -> bytearray:
+        """
+        Birden çok anlık görüntüyü tek bitişik tampona kodlar
         
-        # İvme verileri
-        packet[58:62] = struct.pack('<f', rocket_data.get('Ax', 0.0))
-        packet[62:66] = struct.pack('<f', rocket_data.get('Ay', 0.0))
-        packet[66:70] = struct.pack('<f', rocket_data.get('Az', 0.0))
+        Args:
+            snapshots: (sayaç, roket, görev yükü) üçlüleri
         
-        # Açı ve durum
-        packet[70:74] = struct.pack('<f', rocket_data.get('aci', 0.0))
-        packet[74] = rocket_data.get('durum', 0)
+        Returns:
+            bytearray: Art arda dizilmiş HYI paketleri
+        """
+        snapshots = list(snapshots)
+        buffer = bytearray(HYI_PACKET_SIZE * len(snapshots))
+        view = memoryview(buffer)
+        offset = 0
+        for counter, rocket, payload in snapshots:
+            self.encode_into(view, offset, counter, rocket, payload)
+            offset += HYI_PACKET_SIZE
+        return buffer
+
+
+class HYITransmitter(threading.Thread):
+    """
+    HYI paketlerini sabit hızda gönderen arka plan zamanlayıcısı.
+    
+    Her tikte yalnızca `update` ile verilen en son roket ve görev yükü
+    anlık görüntüsü gönderilir; eski görüntüler kuyruğa alınmaz. Gecikme
+    nedeniyle kaçırılan tikler telafi edilmez, sayılır.
+    """
+    
+    def __init__(self, serial_manager: SerialManager, rate_hz: float = 5.0,
+                 team_id: int = 0, connection_type: str = 'hyi'):
+        super().__init__(name="HYITransmitter", daemon=True)
+        self.serial_manager = serial_manager
+        self.connection_type = connection_type
+        self.encoder = HYIEncoder(team_id)
+        self.rate_hz = rate_hz
+        self.counter = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped_ticks = 0
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._intervals = deque(maxlen=100)
+        self._last_send: Optional[float] = None
+    
+    def update(self, rocket, payload):
+        """Gönderilecek en son roket ve görev yükü verisini ayarlar"""
+        with self._lock:
+            self._snapshot = (rocket, payload)
+    
+    def set_rate(self, rate_hz: float):
+        """Gönderim hızını değiştirir (Hz)"""
+        self.rate_hz = rate_hz
+    
+    def set_team_id(self, team_id: int):
+        """Takım ID'sini değiştirir"""
+        self.encoder.team_id = team_id
+    
+    def stop(self):
+        """Zamanlayıcının durmasını ister"""
+        self._stop_event.set()
+    
+    def run(self):
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
+            period = 1.0 / max(self.rate_hz, 0.1)
+            now = time.monotonic()
+            if now < next_tick:
+                self._stop_event.wait(next_tick - now)
+                continue
+            
+            # Bir periyottan fazla geciktiysek kaçan tikleri atla
+            missed = int((now - next_tick) / period)
+            if missed:
+                self.dropped_ticks += missed
+                next_tick += missed * period
+            next_tick += period
+            self._send(now)
+    
+    def _send(self, now: float):
+        """En son anlık görüntüyü kodlayıp gönderir"""
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot is None:
+            return
         
-        # Kontrol toplamı
-        checksum = sum(packet[4:75]) % 256
-        packet[75] = checksum
+        rocket, payload = snapshot
+        packet = self.encoder.encode(self.counter, rocket, payload)
+        if self.serial_manager.write_data(self.connection_type, packet):
+            self.counter = (self.counter + 1) % 256
+            self.sent += 1
+        else:
+            self.failed += 1
         
-        # Footer
-        packet[76] = 0x0D
-        packet[77] = 0x0A
+        if self._last_send is not None:
+            self._intervals.append(now - self._last_send)
+        self._last_send = now
+    
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Gönderim istatistiklerini döndürür
         
-        return packet
+        Returns:
+            Dict[str, float]: Gerçekleşen hız (Hz), jitter (ms), gönderilen,
+            başarısız ve atlanan tik sayıları
+        """
+        intervals = list(self._intervals)
+        rate = len(intervals) / sum(intervals) if intervals else 0.0
+        jitter = statistics.pstdev(intervals) * 1000 if len(intervals) > 1 else 0.0
+        return {
+            'rate': rate,
+            'jitter_ms': jitter,
+            'sent': self.sent,
+            'failed': self.failed,
+            'dropped_ticks': self.dropped_ticks
+        }
@@ -0,0 +1,164 @@
+"""
+Şema Derleyici
+`telemetry_schema.json` gruplarından kayıt tipleri ve alan sırasına özel
+ayrıştırma ve sözlük dönüşümü fonksiyonları ile struct biçimleri üretir.
+
+Fonksiyonlar başlangıçta bir kez kaynak koddan derlenir (`namedtuple` gibi):
+alan listesi döngüsü ya da ad araması yerine her alan sabit bir indeks ve
+dönüştürücüyle yazılır. Şemaya alan eklemek kayıtları, CSV ayrıştırmayı,
+sözlük çıktısını ve ikili biçimleri birlikte günceller.
+"""
+
+from collections import namedtuple
+from typing import Any, Callable, Dict, Sequence
+
+
+def integer_value(value: Any) -> int:
+    """Sözlükten gelen tamsayı alanını çevirir; kesirli ya da sonsuz değerler reddedilir"""
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Tamsayı alanına tamsayı olmayan değer: {value}")
+    return int(value)
+
+
+# Şemadaki alan tiplerinin Python dönüştürücüleri, varsayılanları ve struct kodları
+SCHEMA_CONVERTERS = {'integer': int, 'float': float}
+SCHEMA_DEFAULTS = {'integer': 0, 'float': 0.0}
+SCHEMA_STRUCT_CODES = {'integer': 'i', 'float': 'f'}
+
+# Sözlükten (JSON) gelen değerlerin dönüştürücüleri: JSON'da `12.0` gibi
+# yazılan tamsayılar da kabul edilir
+SCHEMA_VALUE_CONVERTERS = {'integer': integer_value, 'float': float}
+
+
+def _compile(source: str, name: str, namespace: Dict[str, Any]) -> Callable:
+    """Üretilen kaynak kodu derler ve `name` fonksiyonunu döndürür"""
+    exec(compile(source, f"<şema: {name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+class RecordCodec:
+    """
+    Tek bir şema grubunun derlenmiş kodlayıcısı.
+    
+    Attributes:
+        fields: Alan adları (CSV ve struct sırası)
+        types: Alan tipleri ('integer' ya da 'float')
+        record_base: Şema alanlarıyla oluşturulmuş `namedtuple` tabanı
+        struct_format: Bayt sırası öneki olmadan struct biçimi
+        parse: `from_csv_line(cls, line)` - CSV satırını `cls` kaydına çevirir
+        from_dict: `from_dict(cls, data)` - sözlüğü alan tiplerine çevrilmiş `cls` kaydına çevirir
+        to_dict: `to_dict(record)` - kaydı alan adı -> değer sözlüğüne çevirir
+    """
+    
+    def __init__(self, group: str, spec: Dict[str, Any]):
+        """
+        Args:
+            group: Şema grubunun adı ('rocket', 'payload', 'bmp280')
+            spec: Şemadaki grup tanımı ('description', 'fields')
+        """
+        self.group = group
+        self.description = spec.get('description', group)
+        self.fields = tuple(spec['fields'])
+        self.types = tuple(field.get('type', 'float') for field in spec['fields'].values())
+        self.record_base = namedtuple(
+            f"{group}_record", self.fields,
+            defaults=[SCHEMA_DEFAULTS.get(kind, 0.0) for kind in self.types]
+        )
+        self.struct_format = ''.join(SCHEMA_STRUCT_CODES.get(kind, 'f') for kind in self.types)
+        self.parse = self._compile_parse()
+        self.from_dict = self._compile_from_dict()
+        self.to_dict = self._compile_to_dict()
+    
+    def __len__(self) -> int:
+        return len(self.fields)
+    
+    def _compile_parse(self) -> Callable:
+        count = len(self.fields)
+        namespace = {
+            '_new': tuple.__new__,
+            '_message': f"{self.description} için {count} alan gerekli, {{}} alan geldi"
+        }
+        converters = []
+        for index, kind in enumerate(self.types):
+            converter = SCHEMA_CONVERTERS.get(kind, float)
+            namespace[f"_{converter.__name__}"] = converter
+            converters.append(f"_{converter.__name__}(values[{index}])")
+        source = (
+            "def from_csv_line(cls, line):\n"
+            "    values = line.strip().split(',')\n"
+            f"    if len(values) < {count}:\n"
+            "        raise ValueError(_message.format(len(values)))\n"
+            f"    return _new(cls, ({', '.join(converters)},))\n"
+        )
+        return _compile(source, 'from_csv_line', namespace)
+    
+    def _compile_from_dict(self) -> Callable:
+        namespace = {'_new': tuple.__new__}
+        converters = []
+        for index, kind in enumerate(self.types):
+            converter = SCHEMA_VALUE_CONVERTERS.get(kind, float)
+            namespace[f"_{converter.__name__}"] = converter
+            converters.append(f"_{converter.__name__}(record[{index}])")
+        source = (
+            "def from_dict(cls, data):\n"
+            "    record = cls(**data)\n"
+            f"    return _new(cls, ({', '.join(converters)},))\n"
+        )
+        return _compile(source, 'from_dict', namespace)
+    
+    def _compile_to_dict(self) -> Callable:
+        items = ', '.join(f"{name!r}: self[{index}]" for index, name in enumerate(self.fields))
+        source = f"def to_dict(self):\n    return {{{items}}}\n"
+        return _compile(source, 'to_dict', {})
+
+
+def compile_schema(schema: Dict[str, Any]) -> Dict[str, RecordCodec]:
+    """
+    Şemadaki her grup için kodlayıcı derler
+    
+    Args:
+        schema: Telemetri şeması
+    
+    Returns:
+        Dict[str, RecordCodec]: Grup adı -> kodlayıcı
+    """
+    return {group: RecordCodec(group, spec) for group, spec in schema.items()}
+
+
+def compile_gatherer(fields: Sequence[str], schema: Dict[str, Any],
+                     groups: Sequence[str] = ('rocket', 'payload'),
+                     mapping: bool = False) -> Callable:
+    """
+    Birden çok gruptan alanları verilen sırada toplayan fonksiyon derler
+    
+    Dış protokollerin (örn. HYI) alan sırası şemadan farklıdır; her alanın
+    hangi gruba ait olduğu şemadan bulunur.
+    
+    Args:
+        fields: Toplanacak alanlar (çıktı sırası)
+        schema: Telemetri şeması
+        groups: Fonksiyon argümanlarının sırasıyla grup adları
+        mapping: True ise argümanlar sözlüktür ve eksik alanlar varsayılanı alır,
+            False ise kayıt (`namedtuple`) alanları okunur
+    
+    Returns:
+        Callable: `gather(*gruplar) -> tuple`
+    
+    Raises:
+        ValueError: Alan verilen grupların hiçbirinde yoksa
+    """
+    expressions = []
+    for name in fields:
+        for group in groups:
+            spec = schema[group]['fields'].get(name)
+            if spec is not None:
+                break
+        else:
+            raise ValueError(f"Şemada bulunmayan alan: {name}")
+        if mapping:
+            default = SCHEMA_DEFAULTS.get(spec.get('type', 'float'), 0.0)
+            expressions.append(f"{group}.get({name!r}, {default!r})")
+        else:
+            expressions.append(f"{group}.{name}")
+    source = f"def gather({', '.join(groups)}):\n    return ({', '.join(expressions)},)\n"
+    return _compile(source, 'gather', {})
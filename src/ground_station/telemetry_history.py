@@ -0,0 +1,205 @@
+"""
+Telemetri Geçmişi
+Gelen telemetri örneklerini sabit kapasiteli NumPy halka tamponlarında saklar.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from .data_models import TELEMETRY_SCHEMA
+
+
+# Şemadaki alan tiplerinin NumPy karşılıkları
+SCHEMA_DTYPES = {
+    'integer': np.int64,
+    'float': np.float64
+}
+
+
+def schema_fields(group: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Şema grubundaki alanları sırasıyla NumPy veri tiplerine eşler
+    
+    Args:
+        group: Şema grubu ('rocket', 'payload', 'bmp280')
+        schema: Telemetri şeması (None ise yüklü şema)
+    
+    Returns:
+        Dict[str, Any]: Alan adı -> NumPy veri tipi
+    """
+    schema = schema or TELEMETRY_SCHEMA
+    return {
+        name: SCHEMA_DTYPES.get(spec.get('type'), np.float64)
+        for name, spec in schema[group]['fields'].items()
+    }
+
+
+# Varsayılan kapasite: 50 Hz'de ~43 dakika, 5 Hz'de ~7 saat
+DEFAULT_CAPACITY = 2 ** 17
+
+
+class ColumnarRingBuffer:
+    """
+    Sütun başına bir NumPy dizisi tutan sabit kapasiteli halka tampon.
+    
+    Her sütun `2 * capacity` uzunluğunda ayrılır ve her örnek hem `i` hem
+    `i + capacity` konumuna yazılır. Böylece son `n` örnek her zaman
+    bitişik bir dilimdir ve `window` kopya oluşturmadan görünüm döndürür.
+    Bellek kullanımı oturum boyunca sabit kalır.
+    """
+    
+    def __init__(self, fields: Dict[str, Any], capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            fields: Alan adı -> NumPy veri tipi
+            capacity: Saklanacak en fazla örnek sayısı
+        """
+        self.capacity = capacity
+        self.fields = ['timestamp'] + list(fields)
+        self.columns: Dict[str, np.ndarray] = {
+            'timestamp': np.zeros(2 * capacity, dtype=np.float64)
+        }
+        for name, dtype in fields.items():
+            self.columns[name] = np.zeros(2 * capacity, dtype=dtype)
+        self.total = 0
+        self._head = 0
+    
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+    
+    @property
+    def nbytes(self) -> int:
+        """Ayrılan toplam bellek (bayt)"""
+        return sum(column.nbytes for column in self.columns.values())
+    
+    def append(self, timestamp: float, record: Any):
+        """
+        Tek bir örnek ekler (O(1))
+        
+        Args:
+            timestamp: Alınma zamanı
+            record: Alanları nitelik olarak taşıyan kayıt (örn. `RocketData`)
+        """
+        head = self._head
+        mirror = head + self.capacity
+        for name, column in self.columns.items():
+            value = timestamp if name == 'timestamp' else getattr(record, name)
+            column[head] = value
+            column[mirror] = value
+        self._head = (head + 1) % self.capacity
+        self.total += 1
+    
+    def extend(self, timestamps, columns: Dict[str, np.ndarray]):
+        """
+        Birden çok örneği sütun dizilerinden toplu olarak ekler
+        
+        Args:
+            timestamps: Örnek zamanları
+            columns: Alan adı -> değer dizisi (eksik alanlar sıfırlanır)
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        count = timestamps.size
+        if count == 0:
+            return
+        
+        # Kapasiteden fazlası gelirse yalnızca en yenileri tutulur
+        skip = max(0, count - self.capacity)
+        positions = (self._head + skip + np.arange(count - skip)) % self.capacity
+        for name, column in self.columns.items():
+            if name == 'timestamp':
+                values = timestamps[skip:]
+            elif name in columns:
+                values = np.asarray(columns[name])[skip:]
+            else:
+                values = 0
+            column[positions] = values
+            column[positions + self.capacity] = values
+        self._head = (self._head + count) % self.capacity
+        self.total += count
+    
+    def window(self, name: str, count: Optional[int] = None) -> np.ndarray:
+        """
+        Bir sütunun son `count` örneğini kopyasız görünüm olarak döndürür
+        
+        Args:
+            name: Alan adı
+            count: Örnek sayısı (None ise tüm geçmiş)
+        
+        Returns:
+            np.ndarray: Eskiden yeniye sıralı, salt okunur görünüm
+        """
+        size = len(self)
+        count = size if count is None else min(count, size)
+        end = self._head + self.capacity
+        view = self.columns[name][end - count:end]
+        view.flags.writeable = False
+        return view
+    
+    def latest(self, name: str):
+        """Bir sütunun en son değerini döndürür"""
+        if not self.total:
+            return None
+        return self.columns[name][self._head + self.capacity - 1]
+    
+    def clear(self):
+        """Geçmişi temizler (bellek serbest bırakılmaz)"""
+        self.total = 0
+        self._head = 0
+
+
+class TelemetryHistory:
+    """Şemadaki her veri grubu için bir halka tampon tutan telemetri geçmişi"""
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 schema: Optional[Dict[str, Any]] = None,
+                 groups: Iterable[str] = ('rocket', 'payload')):
+        """
+        Args:
+            capacity: Grup başına saklanacak en fazla örnek sayısı
+            schema: Telemetri şeması (None ise yüklü şema)
+            groups: Geçmişi tutulacak şema grupları
+        """
+        self.schema = schema or TELEMETRY_SCHEMA
+        self.capacity = capacity
+        self.buffers: Dict[str, ColumnarRingBuffer] = {}
+        for group in groups:
+            self.add_group(group)
+    
+    def __getitem__(self, group: str) -> ColumnarRingBuffer:
+        return self.buffers[group]
+    
+    def __contains__(self, group: str) -> bool:
+        return group in self.buffers
+    
+    def add_group(self, group: str, schema_group: Optional[str] = None) -> ColumnarRingBuffer:
+        """
+        Geçmişe yeni bir grup ekler (varsa mevcut tamponu döndürür)
+        
+        Args:
+            group: Grup adı (örn. ek bir roket bağlantısının kimliği)
+            schema_group: Alanların alınacağı şema grubu (None ise `group`)
+        """
+        buffer = self.buffers.get(group)
+        if buffer is None:
+            fields = schema_fields(schema_group or group, self.schema)
+            buffer = self.buffers[group] = ColumnarRingBuffer(fields, self.capacity)
+        return buffer
+    
+    def append(self, group: str, timestamp: float, record: Any):
+        """Gruba tek bir örnek ekler"""
+        self.buffers[group].append(timestamp, record)
+    
+    def extend(self, group: str, timestamps, columns: Dict[str, np.ndarray]):
+        """Gruba sütun dizilerinden toplu örnek ekler"""
+        self.buffers[group].extend(timestamps, columns)
+    
+    @property
+    def nbytes(self) -> int:
+        """Tüm grupların ayırdığı toplam bellek (bayt)"""
+        return sum(buffer.nbytes for buffer in self.buffers.values())
+    
+    def clear(self):
+        """Tüm geçmişi temizler"""
+        for buffer in self.buffers.values():
+            buffer.clear()
@@ -0,0 +1,198 @@
+"""
+Toplu Telemetri Ayrıştırıcı
+CSV telemetri satırlarını tek NumPy geçişinde sütun dizilerine dönüştürür.
+"""
+
+import warnings
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+class CSVBatch:
+    """
+    Toplu ayrıştırılmış CSV satırları.
+    
+    Her alan için satır sayısı uzunluğunda bir dizi ve hangi satırların
+    geçerli olduğunu gösteren `valid` maskesi tutar. Geçersiz satırların
+    değerleri sıfırdır ve maskeyle ayıklanmalıdır.
+    """
+    
+    def __init__(self, columns: Dict[str, np.ndarray], valid: np.ndarray):
+        self.columns = columns
+        self.valid = valid
+    
+    def __len__(self) -> int:
+        return self.valid.size
+    
+    @property
+    def valid_count(self) -> int:
+        """Geçerli satır sayısı"""
+        return int(np.count_nonzero(self.valid))
+    
+    @property
+    def invalid_count(self) -> int:
+        """Geçersiz satır sayısı"""
+        return len(self) - self.valid_count
+    
+    def valid_columns(self) -> Dict[str, np.ndarray]:
+        """Yalnızca geçerli satırları içeren sütunları döndürür"""
+        return {name: column[self.valid] for name, column in self.columns.items()}
+    
+    def last_valid_index(self) -> Optional[int]:
+        """Son geçerli satırın sırasını döndürür"""
+        indices = np.flatnonzero(self.valid)
+        return int(indices[-1]) if indices.size else None
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """Bir satırı Python değerlerinden oluşan sözlük olarak döndürür"""
+        return {name: column[index].item() for name, column in self.columns.items()}
+    
+    def record(self, index: int, record_type):
+        """Bir satırı `record_type` kaydına (örn. `RocketData`) dönüştürür"""
+        return record_type._make([column[index].item() for column in self.columns.values()])
+
+
+def _split_lines(data: Union[str, bytes, Sequence[Union[str, bytes]]]) -> List[str]:
+    """Tampon ya da satır listesini metin satırlarına çevirir"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8', errors='replace')
+    if isinstance(data, str):
+        return data.splitlines()
+    return [line.decode('utf-8', errors='replace') if isinstance(line, (bytes, bytearray))
+            else line for line in data]
+
+
+def _parse_rows(lines: List[str], field_count: int):
+    """
+    Tam `field_count` alanlı satırları tek seferde float matrise çevirir
+    
+    Returns:
+        (matris, geçerlilik maskesi); hatalı satırlar maskede False olur
+    """
+    matrix = np.zeros((len(lines), field_count), dtype=np.float64)
+    valid = np.zeros(len(lines), dtype=bool)
+    if not lines:
+        return matrix, valid
+    
+    # Hızlı yol: tüm satırlar tek metin olarak ayrıştırılır
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            values = np.fromstring(','.join(lines), dtype=np.float64, sep=',')
+        if values.size == matrix.size:
+            matrix[:] = values.reshape(matrix.shape)
+            valid[:] = True
+            return matrix, valid
+    except (ValueError, DeprecationWarning):
+        pass
+    
+    # Yavaş yol: hatalı satırları bulmak için satır satır ayrıştır
+    for row, line in enumerate(lines):
+        try:
+            matrix[row] = [float(value) for value in line.split(',')]
+            valid[row] = True
+        except ValueError:
+            pass
+    return matrix, valid
+
+
+def _integer_mask(rows: List[str], field_count: int, positions: List[int]) -> np.ndarray:
+    """
+    Tamsayı alanları yalnızca rakam, işaret ve boşluktan oluşan satırların maskesi
+    
+    `float` ile okunan `3.7` ya da `3.0` gibi değerler tek satır ayrıştırıcıdaki
+    `int()` gibi reddedilir. Satırların tam `field_count` alanlı olması gerekir.
+    """
+    data = np.frombuffer('\n'.join(rows).encode('utf-8') + b'\n', dtype=np.uint8)
+    bounds = np.concatenate(([-1], np.flatnonzero((data == ord(',')) | (data == ord('\n')))))
+    rejected = ((data < ord('0')) | (data > ord('9'))) & (data != ord(' ')) & (data != ord('\t'))
+    rejected &= (data != ord('+')) & (data != ord('-'))
+    
+    # Her tamsayı alanının [başlangıç, ayraç) aralığındaki reddedilen baytlar toplanır
+    tokens = np.arange(len(rows)) * field_count
+    valid = np.ones(len(rows), dtype=bool)
+    for position in positions:
+        ranges = np.empty(2 * len(rows), dtype=np.intp)
+        ranges[0::2] = bounds[tokens + position] + 1
+        ranges[1::2] = bounds[tokens + position + 1]
+        valid &= np.add.reduceat(rejected, ranges)[0::2] == 0
+    return valid
+
+
+def parse_csv_batch(data: Union[str, bytes, Sequence[Union[str, bytes]]],
+                    fields: Dict[str, Any]) -> CSVBatch:
+    """
+    CSV satırlarını sütun dizilerine ayrıştırır
+    
+    Alan sayısından az değer içeren ya da sayıya çevrilemeyen satırlar
+    geçersiz işaretlenir; fazla alanlar yok sayılır. Tamsayı alanlarında
+    ondalık ya da üslü yazım (örn. `3.7`, `3.0`, `1e3`) da geçersizdir;
+    böylece `RocketData.from_csv_line` ile aynı satırlar kabul edilir.
+    
+    Args:
+        data: Satır listesi ya da satır sonlarıyla ayrılmış tampon
+        fields: Alan adı -> NumPy veri tipi (CSV sırasıyla)
+    
+    Returns:
+        CSVBatch: Sütunlar ve satır geçerlilik maskesi
+    """
+    lines = [line.strip() for line in _split_lines(data)]
+    field_count = len(fields)
+    separators = field_count - 1
+    
+    # Alan sayısına göre satırları ayır; fazla alanlı satırları kırp
+    rows = []
+    row_indices = []
+    for index, line in enumerate(lines):
+        count = line.count(',')
+        if count == separators:
+            rows.append(line)
+        elif count > separators:
+            rows.append(line.rsplit(',', count - separators)[0])
+        else:
+            continue
+        row_indices.append(index)
+    
+    matrix, parsed = _parse_rows(rows, field_count)
+    integer_positions = [position for position, dtype in enumerate(fields.values())
+                         if np.issubdtype(dtype, np.integer)]
+    if rows and integer_positions:
+        rejected = ~_integer_mask(rows, field_count, integer_positions)
+        parsed &= ~rejected
+        matrix[rejected] = 0
+    if len(rows) < len(lines):
+        # Eksik alanlı satırlar sıfır ve geçersiz olarak yerleştirilir
+        full = np.zeros((len(lines), field_count), dtype=np.float64)
+        full[row_indices] = matrix
+        matrix = full
+        valid = np.zeros(len(lines), dtype=bool)
+        valid[row_indices] = parsed
+    else:
+        valid = parsed
+    
+    columns = {
+        name: matrix[:, position].astype(dtype)
+        for position, (name, dtype) in enumerate(fields.items())
+    }
+    return CSVBatch(columns, valid)
+
+
+def parse_csv_file(path: str, fields: Dict[str, Any]) -> CSVBatch:
+    """
+    CSV kayıt dosyasını (örn. uçuş sonrası SD kart kaydı) toplu ayrıştırır
+    
+    Boş satırlar ve alan adlarından oluşan başlık satırı atlanır.
+    
+    Args:
+        path: CSV dosyası
+        fields: Alan adı -> NumPy veri tipi (CSV sırasıyla)
+    
+    Returns:
+        CSVBatch: Sütunlar ve satır geçerlilik maskesi
+    """
+    with open(path, encoding='utf-8', errors='replace') as csv_file:
+        lines = [line for line in csv_file.read().splitlines() if line.strip()]
+    if lines and lines[0].strip().split(',')[:len(fields)] == list(fields):
+        lines = lines[1:]
+    return parse_csv_batch(lines, fields)
@@ -0,0 +1,429 @@
+"""
+Telemetri Yayın Sunucusu
+Çözülen telemetri anlık görüntülerini yerel TCP, UDP ve WebSocket abonelerine dağıtır.
+
+Biçimler:
+    json   - Satır başına bir JSON nesnesi: {"seq", "t", "rocket", "payload", "bmp280"}
+    binary - `SNAPSHOT_STRUCT` (küçük endian): 'GSTM', sürüm, sıra, zaman damgası,
+             roket alanları, görev yükü alanları (alan sırası ve tipleri şemadan)
+
+UDP aboneliği: sunucu portuna herhangi bir datagram gönderen adres abone olur;
+`UDP_SUBSCRIPTION_TIMEOUT` saniye içinde yenilenmeyen abonelik düşer.
+WebSocket aboneleri JSON metin çerçeveleri alır.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from .data_models import RocketData, PayloadData, SCHEMA_CODECS
+
+
+# Abone başına bekleyebilecek en fazla anlık görüntü
+DEFAULT_CLIENT_QUEUE = 64
+
+# UDP aboneliğinin yenilenmeden geçerli kalacağı süre (saniye)
+UDP_SUBSCRIPTION_TIMEOUT = 10.0
+
+# TCP/WebSocket soketinin gönderme tamponu üst sınırı (bayt)
+TRANSPORT_HIGH_WATER = 64 * 1024
+
+SNAPSHOT_MAGIC = b'GSTM'
+SNAPSHOT_VERSION = 1
+
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Roket ve görev yükü alanlarının struct biçimleri şemadan derlenir
+SNAPSHOT_STRUCT = struct.Struct(
+    '<4sBId' + SCHEMA_CODECS['rocket'].struct_format + SCHEMA_CODECS['payload'].struct_format
+)
+
+
+def encode_json(sequence: int, timestamp: float, telemetry) -> bytes:
+    """Anlık görüntüyü tek satırlık JSON olarak kodlar"""
+    data = {'seq': sequence, 't': timestamp}
+    data.update(telemetry.to_dict())
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def encode_binary(sequence: int, timestamp: float, telemetry) -> bytes:
+    """Anlık görüntüyü `SNAPSHOT_STRUCT` ile kodlar"""
+    return SNAPSHOT_STRUCT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sequence, timestamp,
+                                *telemetry.rocket, *telemetry.payload)
+
+
+def decode_binary(data: bytes) -> Dict:
+    """`encode_binary` çıktısını sözlüğe çözer (istemciler ve testler için)"""
+    values = SNAPSHOT_STRUCT.unpack(data)
+    if values[0] != SNAPSHOT_MAGIC:
+        raise ValueError("Geçersiz anlık görüntü başlığı")
+    rocket_end = 4 + len(SCHEMA_CODECS['rocket'])
+    return {
+        'seq': values[2],
+        't': values[3],
+        'rocket': RocketData(*values[4:rocket_end]),
+        'payload': PayloadData(*values[rocket_end:])
+    }
+
+
+def websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Sunucudan istemciye maskesiz WebSocket çerçevesi oluşturur"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class Subscriber:
+    """
+    Tek bir abonenin sınırlı kuyruğu.
+    
+    Kuyruk dolduğunda yeni anlık görüntü sondakinin yerine yazılır
+    (birleştirme): yavaş abone daha az, ama her zaman en güncel veriyi alır
+    ve yayıncıyı hiçbir zaman bekletmez.
+    """
+    
+    def __init__(self, name: str, protocol: str, frame_format: str, maxsize: int,
+                 writer: asyncio.StreamWriter):
+        self.name = name
+        self.writer = writer
+        self.protocol = protocol
+        self.frame_format = frame_format
+        self.queue: deque = deque()
+        self.maxsize = maxsize
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.coalesced = 0
+    
+    def offer(self, data: bytes):
+        """Veriyi kuyruğa ekler; kuyruk doluysa son bekleyeni değiştirir"""
+        if len(self.queue) >= self.maxsize:
+            self.queue[-1] = data
+            self.coalesced += 1
+        else:
+            self.queue.append(data)
+        self.ready.set()
+    
+    async def next_batch(self) -> List[bytes]:
+        """Kuyrukta veri olana kadar bekler ve hepsini döndürür"""
+        while not self.queue:
+            self.ready.clear()
+            await self.ready.wait()
+        batch = list(self.queue)
+        self.queue.clear()
+        return batch
+
+
+class UDPPublisher(asyncio.DatagramProtocol):
+    """UDP abonelerini datagramla kaydeden ve anlık görüntüleri gönderen protokol"""
+    
+    def __init__(self, server: 'TelemetryServer'):
+        self.server = server
+        self.transport = None
+        self.subscribers: Dict[tuple, float] = {}
+        self.sent = 0
+    
+    def connection_made(self, transport):
+        self.transport = transport
+    
+    def datagram_received(self, data: bytes, address):
+        if address not in self.subscribers:
+            self.server.log(f"UDP abonesi: {address[0]}:{address[1]}")
+        self.subscribers[address] = time.monotonic()
+    
+    def publish(self, data: bytes):
+        """Anlık görüntüyü tüm abonelere gönderir, süresi dolanları siler"""
+        expired = time.monotonic() - UDP_SUBSCRIPTION_TIMEOUT
+        for address, renewed in list(self.subscribers.items()):
+            if renewed < expired:
+                del self.subscribers[address]
+                continue
+            # Datagram gönderimi beklemez; çekirdek tamponu doluysa paket düşer
+            self.transport.sendto(data, address)
+            self.sent += 1
+
+
+class TelemetryServer:
+    """
+    Telemetri yayın sunucusu.
+    
+    Kendi thread'indeki bir asyncio olay döngüsünde TCP, UDP ve WebSocket
+    dinleyicilerini çalıştırır. `publish` veri thread'inden çağrılır:
+    anlık görüntü her biçim için bir kez kodlanır ve abonelerin kuyruklarına
+    bırakılır. Abone başına bir gönderici görevi kuyruğu soketin kabul ettiği
+    hızda boşaltır; yavaş aboneler yalnızca kendi kuyruklarını etkiler.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', tcp_port: Optional[int] = None,
+                 udp_port: Optional[int] = None, ws_port: Optional[int] = None,
+                 frame_format: str = 'json', queue_size: int = DEFAULT_CLIENT_QUEUE,
+                 log=print):
+        """
+        Args:
+            host: Dinlenecek adres (varsayılan yalnızca yerel)
+            tcp_port: TCP portu (None ise kapalı, 0 ise boş port seçilir)
+            udp_port: UDP portu (None ise kapalı)
+            ws_port: WebSocket portu (None ise kapalı)
+            frame_format: TCP ve UDP biçimi ('json' ya da 'binary')
+            queue_size: Abone başına bekleyebilecek en fazla anlık görüntü
+            log: Durum mesajlarını yazan fonksiyon
+        """
+        if frame_format not in ('json', 'binary'):
+            raise ValueError(f"Bilinmeyen yayın biçimi: {frame_format}")
+        self.host = host
+        self.requested_ports = {'tcp': tcp_port, 'udp': udp_port, 'ws': ws_port}
+        self.ports: Dict[str, int] = {}
+        self.frame_format = frame_format
+        self.queue_size = queue_size
+        self.log = log
+        
+        self.subscribers: List[Subscriber] = []
+        self.udp: Optional[UDPPublisher] = None
+        self.sequence = 0
+        self.published = 0
+        self.coalesced = 0
+        self.encode_errors = 0
+        self._servers = []
+        self._tasks = set()
+        self.loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> bool:
+        """
+        Dinleyicileri açar
+        
+        Returns:
+            bool: En az bir dinleyici açıldıysa True
+        """
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name="TelemetryServer", daemon=True)
+        self._thread.start()
+        future = asyncio.run_coroutine_threadsafe(self._start(), self.loop)
+        return future.result()
+    
+    def publish(self, telemetry, timestamp: Optional[float] = None):
+        """
+        Anlık görüntüyü abonelere dağıtır (herhangi bir thread'den çağrılabilir)
+        
+        Args:
+            telemetry: `TelemetryData`
+            timestamp: Zaman damgası (None ise şimdi)
+        """
+        if not (self.subscribers or (self.udp and self.udp.subscribers)):
+            return
+        sequence = self.sequence + 1
+        timestamp = time.time() if timestamp is None else timestamp
+        try:
+            encoded = {'json': encode_json(sequence, timestamp, telemetry)}
+            if self.frame_format == 'binary':
+                encoded['binary'] = encode_binary(sequence, timestamp, telemetry)
+        except (struct.error, TypeError, ValueError, OverflowError) as e:
+            # Kodlanamayan anlık görüntü atlanır; veri thread'i durmaz
+            self.encode_errors += 1
+            self.log(f"Anlık görüntü kodlanamadı: {e}")
+            return
+        self.sequence = sequence
+        self.published += 1
+        self.loop.call_soon_threadsafe(self._fan_out, encoded)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Abone ve gönderim istatistiklerini döndürür"""
+        subscribers = list(self.subscribers)
+        return {
+            'clients': len(subscribers) + (len(self.udp.subscribers) if self.udp else 0),
+            'published': self.published,
+            'sent': sum(subscriber.sent for subscriber in subscribers)
+                    + (self.udp.sent if self.udp else 0),
+            'coalesced': self.coalesced + sum(subscriber.coalesced for subscriber in subscribers),
+            'encode_errors': self.encode_errors
+        }
+    
+    def close(self):
+        """Dinleyicileri ve abone bağlantılarını kapatır"""
+        if self._thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._close(), self.loop)
+        try:
+            future.result(timeout=2.0)
+        except Exception as e:
+            self.log(f"Yayın sunucusu kapatma hatası: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2.0)
+        self._thread = None
+    
+    # Olay döngüsü tarafı
+    
+    async def _start(self) -> bool:
+        tcp_port, udp_port, ws_port = (self.requested_ports[key] for key in ('tcp', 'udp', 'ws'))
+        try:
+            if tcp_port is not None:
+                server = await asyncio.start_server(self._serve_tcp, self.host, tcp_port)
+                self._servers.append(server)
+                self.ports['tcp'] = server.sockets[0].getsockname()[1]
+            if ws_port is not None:
+                server = await asyncio.start_server(self._serve_websocket, self.host, ws_port)
+                self._servers.append(server)
+                self.ports['ws'] = server.sockets[0].getsockname()[1]
+            if udp_port is not None:
+                transport, self.udp = await self.loop.create_datagram_endpoint(
+                    lambda: UDPPublisher(self), local_addr=(self.host, udp_port)
+                )
+                self.ports['udp'] = transport.get_extra_info('sockname')[1]
+        except OSError as e:
+            self.log(f"Yayın sunucusu başlatılamadı: {e}")
+            await self._close()
+            return False
+        
+        for protocol, port in self.ports.items():
+            self.log(f"Telemetri yayını ({protocol}): {self.host}:{port}")
+        return bool(self.ports)
+    
+    def _fan_out(self, encoded: Dict[str, bytes]):
+        for subscriber in self.subscribers:
+            subscriber.offer(encoded[subscriber.frame_format])
+        if self.udp:
+            self.udp.publish(encoded[self.frame_format])
+    
+    async def _serve_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await self._serve(reader, writer, 'tcp', self.frame_format, lambda data: data,
+                          self._wait_closed(reader))
+    
+    async def _serve_websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # El sıkışma: HTTP Upgrade isteğinden Sec-WebSocket-Key okunur
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5.0)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            writer.close()
+            return
+        key = None
+        for line in request.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            if name.strip().lower() == b'sec-websocket-key':
+                key = value.strip()
+        if not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            writer.close()
+            return
+        accept = base64.b64encode(hashlib.sha1(key + WEBSOCKET_GUID).digest())
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                     b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+        await self._serve(reader, writer, 'ws', 'json',
+                          lambda data: websocket_frame(data.rstrip(b'\n')),
+                          self._wait_websocket_closed(reader, writer))
+    
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                     protocol: str, frame_format: str, frame, wait_closed):
+        """
+        Aboneyi kaydeder ve bağlantı kapanana kadar kuyruğunu gönderir
+        
+        Args:
+            frame: Kodlanmış anlık görüntüyü protokol çerçevesine saran fonksiyon
+            wait_closed: İstemci bağlantıyı kapatınca biten eşyordam
+        """
+        peer = writer.get_extra_info('peername')
+        name = f"{protocol}:{peer[0]}:{peer[1]}" if peer else protocol
+        writer.transport.set_write_buffer_limits(high=TRANSPORT_HIGH_WATER)
+        subscriber = Subscriber(name, protocol, frame_format, self.queue_size, writer)
+        self.subscribers.append(subscriber)
+        self.log(f"Abone bağlandı: {name}")
+        
+        closed = self.loop.create_task(wait_closed)
+        self._tasks.add(closed)
+        try:
+            while not closed.done():
+                batch_task = self.loop.create_task(subscriber.next_batch())
+                done, _ = await asyncio.wait({batch_task, closed},
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if batch_task not in done:
+                    batch_task.cancel()
+                    break
+                batch = batch_task.result()
+                writer.write(b''.join(frame(data) for data in batch))
+                subscriber.sent += len(batch)
+                # Soket tamponu doluysa yalnızca bu abone bekler, kuyruğu birleşir
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            closed.cancel()
+            self._tasks.discard(closed)
+            self.subscribers.remove(subscriber)
+            self.coalesced += subscriber.coalesced
+            writer.close()
+            self.log(f"Abone ayrıldı: {name} ({subscriber.sent} gönderilen, "
+                     f"{subscriber.coalesced} birleştirilen)")
+    
+    async def _wait_closed(self, reader: asyncio.StreamReader):
+        """İstemciden gelen veriyi okuyup atar; EOF bağlantıyı sonlandırır"""
+        try:
+            while await reader.read(4096):
+                pass
+        except (ConnectionError, OSError):
+            pass
+    
+    async def _wait_websocket_closed(self, reader: asyncio.StreamReader,
+                                     writer: asyncio.StreamWriter):
+        """İstemci çerçevelerini okur; ping'e pong, kapatmaya kapatma ile yanıt verir"""
+        try:
+            while True:
+                header = await reader.readexactly(2)
+                opcode = header[0] & 0x0F
+                length = header[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack('!H', await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack('!Q', await reader.readexactly(8))[0]
+                mask = await reader.readexactly(4) if header[1] & 0x80 else b'\0\0\0\0'
+                payload = bytes(byte ^ mask[index % 4] for index, byte
+                                in enumerate(await reader.readexactly(length)))
+                if opcode == 0x8:
+                    writer.write(websocket_frame(payload[:2], 0x8))
+                    return
+                if opcode == 0x9:
+                    writer.write(websocket_frame(payload, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+    
+    async def _close(self):
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self.udp and self.udp.transport:
+            self.udp.transport.close()
+        # Tamponu boşalmayan abonelerde `drain` beklemesin, bağlantıyı kes
+        for subscriber in self.subscribers:
+            subscriber.writer.transport.abort()
+        deadline = time.monotonic() + 1.0
+        while self.subscribers and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+
+def create_telemetry_server(args, log=print) -> Optional[TelemetryServer]:
+    """
+    Komut satırı argümanlarından yayın sunucusunu oluşturup başlatır
+    
+    Returns:
+        TelemetryServer: Hiç port verilmediyse ya da başlatılamadıysa None
+    """
+    if args.serve_tcp is None and args.serve_udp is None and args.serve_ws is None:
+        return None
+    server = TelemetryServer(args.serve_host, args.serve_tcp, args.serve_udp, args.serve_ws,
+                             args.serve_format, log=log)
+    if not server.start():
+        server.close()
+        return None
+    return server
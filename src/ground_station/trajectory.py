@@ -0,0 +1,137 @@
+"""
+Uçuş İzi Modülü
+GPS konumlarını yerel doğu-yukarı-kuzey koordinatlarına çevirir ve
+3D görünüm için sınırlı büyüklükte bir köşe (vertex) dizisinde tutar.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# Ortalama Dünya yarıçapı (metre)
+EARTH_RADIUS = 6371000.0
+
+# İzde tutulacak en fazla köşe sayısı
+DEFAULT_TRAIL_CAPACITY = 16384
+
+
+class TrajectoryTrail:
+    """
+    Uçuş yolunu çizgi şeridi (line strip) köşeleri olarak tutan tampon.
+    
+    Konumlar ilk geçerli GPS konumuna göre metre cinsinden yerel eksenlere
+    çevrilir (x: doğu, y: yukarı, z: güney). Tampon dolduğunda eski yarı
+    2:1 seyreltilir; yeni noktalar tam çözünürlükte kalır ve köşe sayısı,
+    dolayısıyla çizim maliyeti, uçuş boyunca `capacity` ile sınırlı kalır.
+    
+    `synced` GPU'ya yüklenmiş köşe sayısıdır; `pending` yalnızca yeni
+    köşeleri döndürür. Seyreltme sonrası tüm tampon yeniden yüklenir.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_TRAIL_CAPACITY):
+        """
+        Args:
+            capacity: Tutulacak en fazla köşe sayısı
+        """
+        self.capacity = capacity
+        self.vertices = np.zeros((capacity, 3), dtype=np.float32)
+        self.count = 0
+        self.synced = 0
+        self.total_points = 0
+        self.decimations = 0
+        self.origin: Optional[Tuple[float, float, float]] = None
+        self._cos_lat = 1.0
+        self._minimum = np.zeros(3, dtype=np.float32)
+        self._maximum = np.zeros(3, dtype=np.float32)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    @property
+    def latest(self) -> np.ndarray:
+        """Son köşe (roketin yerel konumu)"""
+        if not self.count:
+            return np.zeros(3, dtype=np.float32)
+        return self.vertices[self.count - 1]
+    
+    @property
+    def extent(self) -> float:
+        """İzin en geniş eksendeki boyu (metre)"""
+        return float((self._maximum - self._minimum).max())
+    
+    def clear(self):
+        """İzi ve başlangıç noktasını sıfırlar"""
+        self.count = 0
+        self.synced = 0
+        self.total_points = 0
+        self.decimations = 0
+        self.origin = None
+        self._minimum[:] = 0
+        self._maximum[:] = 0
+    
+    def extend(self, latitude, longitude, altitude):
+        """
+        GPS konumlarını ize ekler
+        
+        Enlem ve boylamı birlikte sıfır olan (konum bulunamamış) örnekler atlanır.
+        
+        Args:
+            latitude: Enlem dizisi (derece)
+            longitude: Boylam dizisi (derece)
+            altitude: İrtifa dizisi (metre)
+        """
+        latitude = np.atleast_1d(np.asarray(latitude, dtype=np.float64))
+        longitude = np.atleast_1d(np.asarray(longitude, dtype=np.float64))
+        altitude = np.atleast_1d(np.asarray(altitude, dtype=np.float64))
+        fix = (latitude != 0) | (longitude != 0)
+        if not fix.all():
+            latitude, longitude, altitude = latitude[fix], longitude[fix], altitude[fix]
+        if not latitude.size:
+            return
+        
+        if self.origin is None:
+            self.origin = (float(latitude[0]), float(longitude[0]), float(altitude[0]))
+            self._cos_lat = math.cos(math.radians(self.origin[0]))
+        origin_lat, origin_lon, origin_alt = self.origin
+        
+        points = np.empty((latitude.size, 3), dtype=np.float32)
+        points[:, 0] = np.radians(longitude - origin_lon) * EARTH_RADIUS * self._cos_lat
+        points[:, 1] = altitude - origin_alt
+        points[:, 2] = -np.radians(latitude - origin_lat) * EARTH_RADIUS
+        np.minimum(self._minimum, points.min(axis=0), out=self._minimum)
+        np.maximum(self._maximum, points.max(axis=0), out=self._maximum)
+        self.total_points += points.shape[0]
+        
+        while points.shape[0]:
+            if self.count == self.capacity:
+                self._decimate()
+            take = min(self.capacity - self.count, points.shape[0])
+            self.vertices[self.count:self.count + take] = points[:take]
+            self.count += take
+            points = points[take:]
+    
+    def pending(self) -> Tuple[int, np.ndarray]:
+        """
+        Henüz yüklenmemiş köşeleri döndürür
+        
+        Returns:
+            (ilk köşenin sırası, köşe dizisi görünümü)
+        """
+        return self.synced, self.vertices[self.synced:self.count]
+    
+    def mark_synced(self):
+        """Bekleyen köşelerin yüklendiğini işaretler"""
+        self.synced = self.count
+    
+    def _decimate(self):
+        """Eski yarıyı 2:1 seyreltir, yeni yarıyı olduğu gibi korur"""
+        half = self.count // 2
+        older = self.vertices[:half:2].copy()
+        newer = self.vertices[half:self.count].copy()
+        self.vertices[:older.shape[0]] = older
+        self.vertices[older.shape[0]:older.shape[0] + newer.shape[0]] = newer
+        self.count = older.shape[0] + newer.shape[0]
+        self.synced = 0
+        self.decimations += 1
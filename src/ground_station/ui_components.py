@@ -5,10 +5,29 @@ Yer istasyonu arayüzü için özel widget'lar ve bileşenler.
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QComboBox, QPushButton, QLineEdit, QGroupBox, 
-                            QGridLayout, QSpinBox, QTextEdit, QFrame)
-from PyQt5.QtCore import Qt, QTime
+                            QGridLayout, QSpinBox, QTextEdit, QFrame,
+                            QCheckBox, QDoubleSpinBox)
+from PyQt5.QtCore import Qt, QTime, QTimer
 from PyQt5.QtGui import QFont
 
+from .latency import LATENCY_STAGES
+
+
+# Kayıt oynatma hızları (None: olabildiğince hızlı)
+REPLAY_SPEEDS = [
+    ("Gerçek Zaman", 1.0),
+    ("2x", 2.0),
+    ("5x", 5.0),
+    ("10x", 10.0),
+    ("En Hızlı", None)
+]
+
+
+def set_text_if_changed(label: QLabel, text: str):
+    """Metin değiştiyse etiketi günceller; aynı metin için yeniden çizim yapılmaz"""
+    if label.text() != text:
+        label.setText(text)
+
 
 class ModernLabel(QLabel):
     """Modern görünümlü etiket widget'ı"""
@@ -69,6 +88,18 @@ class SerialConnectionWidget(QGroupBox):
         self.status_label = QLabel("Bağlantı bekleniyor...")
         self.status_label.setStyleSheet("color: #666; font-style: italic;")
         layout.addWidget(self.status_label)
+        
+        # Hız, sayaç boşluğu ve kayıp istatistikleri (ilk veriyle görünür)
+        self.stats_label = QLabel()
+        self.stats_label.setWordWrap(True)
+        self.stats_label.setStyleSheet("color: #BDC3C7; font-size: 11px;")
+        self.stats_label.hide()
+        layout.addWidget(self.stats_label)
+    
+    def set_stats(self, text: str):
+        """Bağlantı istatistiklerini gösterir"""
+        set_text_if_changed(self.stats_label, text)
+        self.stats_label.show()
     
     def get_port(self) -> str:
         """Seçili portu döndürür"""
@@ -94,6 +125,42 @@ class SerialConnectionWidget(QGroupBox):
             self.status_label.setStyleSheet("color: red; font-weight: bold;")
 
 
+class LinkAddWidget(QGroupBox):
+    """Ek telemetri bağlantısı (örn. ikinci roket) tanımlama widget'ı"""
+    
+    # Rol seçenekleri: (görünen ad, rol)
+    ROLES = (("🚀 Roket", "rocket"), ("📦 Görev Yükü", "payload"))
+    
+    def __init__(self, title: str = "➕ Bağlantı Ekle"):
+        super().__init__(title)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+        
+        layout.addWidget(QLabel("Kimlik:"))
+        self.link_id_edit = QLineEdit()
+        self.link_id_edit.setPlaceholderText("örn: roket2")
+        layout.addWidget(self.link_id_edit)
+        
+        layout.addWidget(QLabel("Rol:"))
+        self.role_combo = QComboBox()
+        for label, role in self.ROLES:
+            self.role_combo.addItem(label, role)
+        layout.addWidget(self.role_combo)
+        
+        self.add_button = QPushButton("➕ Ekle")
+        layout.addWidget(self.add_button)
+    
+    def get_link_id(self) -> str:
+        """Girilen bağlantı kimliğini döndürür"""
+        return self.link_id_edit.text().strip()
+    
+    def get_role(self) -> str:
+        """Seçili rolü döndürür"""
+        return self.role_combo.currentData()
+
+
 class TelemetryDisplayWidget(QGroupBox):
     """Telemetri verilerini gösteren widget"""
     
@@ -101,6 +168,7 @@ class TelemetryDisplayWidget(QGroupBox):
         super().__init__(title)
         self.fields = fields
         self.labels = {}
+        self.texts = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -120,22 +188,50 @@ class TelemetryDisplayWidget(QGroupBox):
             self.labels[field_name] = value_label
     
     def update_field(self, field_name: str, value: str):
-        """Belirli bir alanı günceller"""
-        if field_name in self.labels:
+        """Belirli bir alanı günceller (metin değişmediyse dokunmaz)"""
+        if field_name in self.labels and self.texts.get(field_name) != value:
+            self.texts[field_name] = value
             self.labels[field_name].setText(value)
     
     def update_all_fields(self, data_dict: dict):
         """Tüm alanları günceller"""
         for field_name, value in data_dict.items():
-            if field_name in self.labels:
-                self.labels[field_name].setText(str(value))
+            self.update_field(field_name, str(value))
+    
+    def update_record(self, record):
+        """Tüm alanları kayıttan (örn. `RocketData`) sözlük oluşturmadan günceller"""
+        labels = self.labels
+        texts = self.texts
+        for field_name, value in zip(record._fields, record):
+            text = str(value)
+            if texts.get(field_name) != text:
+                label = labels.get(field_name)
+                if label is not None:
+                    texts[field_name] = text
+                    label.setText(text)
 
 
 class DebugConsole(QTextEdit):
-    """Debug mesajları için konsol widget'ı"""
+    """
+    Debug mesajları için konsol widget'ı.
     
-    def __init__(self):
+    Mesajlar hemen yazılmaz; biriktirilip `flush_interval` aralıklarla tek
+    seferde eklenir. Aynı aralıktaki özdeş mesajlar "(xN)" olarak birleştirilir,
+    aralık başına farklı mesaj sayısı sınırlıdır ve belge en fazla
+    `max_blocks` satır tutar. Böylece gürültülü bir bağlantıda da log
+    maliyeti sabit kalır.
+    """
+    
+    def __init__(self, max_blocks: int = 1000, flush_interval: int = 250,
+                 max_per_flush: int = 100):
         super().__init__()
+        self.max_per_flush = max_per_flush
+        self.pending = {}
+        self.dropped = 0
+        self.document().setMaximumBlockCount(max_blocks)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
         self.setReadOnly(True)
         self.setMaximumHeight(150)
         self.setPlaceholderText("Debug mesajları burada görünecek...")
@@ -153,19 +249,82 @@ class DebugConsole(QTextEdit):
     
     def log(self, message: str):
         """Debug mesajı ekler"""
-        timestamp = QTime.currentTime().toString('hh:mm:ss')
-        self.append(f"[{timestamp}] {message}")
+        entry = self.pending.get(message)
+        if entry:
+            entry[1] += 1
+        elif len(self.pending) < self.max_per_flush:
+            self.pending[message] = [QTime.currentTime().toString('hh:mm:ss'), 1]
+        else:
+            self.dropped += 1
+            
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def flush(self):
+        """Biriken mesajları konsola tek seferde yazar"""
+        if not self.pending and not self.dropped:
+            self.flush_timer.stop()
+            return
+        
+        lines = []
+        for message, (timestamp, count) in self.pending.items():
+            suffix = f" (x{count})" if count > 1 else ""
+            lines.append(f"[{timestamp}] {message}{suffix}")
+        if self.dropped:
+            lines.append(f"... {self.dropped} mesaj atlandı")
+        self.pending = {}
+        self.dropped = 0
+        
+        self.append("\n".join(lines))
         # Otomatik scroll
         self.verticalScrollBar().setValue(
             self.verticalScrollBar().maximum()
         )
 
 
+class LatencyWidget(QGroupBox):
+    """Aşama gecikme histogramlarının özet tablosu"""
+    
+    def __init__(self, title: str = "⏱ Gecikme (roket verisi, ms)"):
+        super().__init__(title)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        self.table_label = QLabel("Henüz ölçüm yok")
+        self.table_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.table_label.setStyleSheet(
+            "font-family: 'Consolas', 'Monaco', monospace; font-size: 11px; color: #BDC3C7;"
+        )
+        layout.addWidget(self.table_label)
+        
+        button_layout = QHBoxLayout()
+        self.export_button = QPushButton("JSON Dışa Aktar")
+        self.reset_button = QPushButton("Sıfırla")
+        button_layout.addWidget(self.export_button)
+        button_layout.addWidget(self.reset_button)
+        layout.addLayout(button_layout)
+    
+    def set_stats(self, stats: dict):
+        """`LatencyTracker.get_stats()` sonucunu tablo olarak gösterir"""
+        lines = [f"{'Aşama':<28}{'n':>7}{'p50':>8}{'p90':>8}{'p99':>8}{'p99.9':>8}{'en çok':>8}"]
+        for stage, label in LATENCY_STAGES.items():
+            stage_stats = stats[stage]
+            lines.append(
+                f"{label:<28}{stage_stats['count']:>7}{stage_stats['p50_ms']:>8.2f}"
+                f"{stage_stats['p90_ms']:>8.2f}{stage_stats['p99_ms']:>8.2f}"
+                f"{stage_stats['p99.9_ms']:>8.2f}{stage_stats['max_ms']:>8.2f}"
+            )
+        set_text_if_changed(self.table_label, "\n".join(lines))
+
+
 class StatusIndicator(QLabel):
     """Durum göstergesi widget'ı"""
     
     def __init__(self, text: str = "Hazır"):
         super().__init__(text)
+        self.current_status = (text, "#27AE60")
         self.setAlignment(Qt.AlignCenter)
         self.setStyleSheet("""
             QLabel {
@@ -180,6 +339,9 @@ class StatusIndicator(QLabel):
     
     def set_status(self, status: str, color: str = "#27AE60"):
         """Durumu günceller"""
+        if (status, color) == self.current_status:
+            return
+        self.current_status = (status, color)
         self.setText(status)
         self.setStyleSheet(f"""
             QLabel {{
@@ -215,9 +377,17 @@ class ControlPanel(QGroupBox):
         self.send_hyi_button = QPushButton("HYI Paketi Gönder")
         hyi_layout.addWidget(self.send_hyi_button, 1, 0, 1, 2)
         
+        self.auto_hyi_check = QCheckBox("Otomatik Gönderim (Hz):")
+        hyi_layout.addWidget(self.auto_hyi_check, 2, 0)
+        self.hyi_rate_spin = QDoubleSpinBox()
+        self.hyi_rate_spin.setRange(0.5, 50.0)
+        self.hyi_rate_spin.setSingleStep(1.0)
+        self.hyi_rate_spin.setValue(5.0)
+        hyi_layout.addWidget(self.hyi_rate_spin, 2, 1)
+        
         self.hyi_status_label = QLabel("HYI Durumu: Beklemede")
         self.hyi_status_label.setStyleSheet("font: italic 10px; color: #666;")
-        hyi_layout.addWidget(self.hyi_status_label, 2, 0, 1, 2)
+        hyi_layout.addWidget(self.hyi_status_label, 3, 0, 1, 2)
         
         layout.addWidget(hyi_group)
         
@@ -233,16 +403,59 @@ class ControlPanel(QGroupBox):
         self.longitude_edit = QLineEdit("28.0079479217529")
         map_layout.addWidget(self.longitude_edit, 1, 1)
         
+        map_layout.addWidget(QLabel("Karolar:"), 2, 0)
+        tiles_layout = QHBoxLayout()
+        self.map_tiles_edit = QLineEdit()
+        self.map_tiles_edit.setPlaceholderText("karo dizini ya da .mbtiles")
+        tiles_layout.addWidget(self.map_tiles_edit)
+        self.map_tiles_browse_button = QPushButton("...")
+        tiles_layout.addWidget(self.map_tiles_browse_button)
+        map_layout.addLayout(tiles_layout, 2, 1)
+        
         self.load_map_button = QPushButton("Haritayı Yükle")
-        map_layout.addWidget(self.load_map_button, 2, 0, 1, 2)
+        map_layout.addWidget(self.load_map_button, 3, 0, 1, 2)
         
         layout.addWidget(map_group)
+        
+        # Kayıt Oynatma
+        replay_group = QGroupBox("Kayıt Oynatma")
+        replay_layout = QGridLayout(replay_group)
+        
+        replay_layout.addWidget(QLabel("Kayıt:"), 0, 0)
+        self.replay_path_edit = QLineEdit()
+        self.replay_path_edit.setPlaceholderText("recordings/ucus_....gsrec")
+        replay_layout.addWidget(self.replay_path_edit, 0, 1)
+        self.replay_browse_button = QPushButton("...")
+        replay_layout.addWidget(self.replay_browse_button, 0, 2)
+        
+        replay_layout.addWidget(QLabel("Hız:"), 1, 0)
+        self.replay_speed_combo = QComboBox()
+        for text, speed in REPLAY_SPEEDS:
+            self.replay_speed_combo.addItem(text, speed)
+        replay_layout.addWidget(self.replay_speed_combo, 1, 1, 1, 2)
+        
+        self.replay_button = QPushButton("▶ Oynat")
+        self.replay_button.setCheckable(True)
+        replay_layout.addWidget(self.replay_button, 2, 0, 1, 3)
+        
+        self.import_csv_button = QPushButton("📄 CSV İçe Aktar")
+        replay_layout.addWidget(self.import_csv_button, 3, 0, 1, 3)
+        
+        self.replay_status_label = QLabel("Oynatma: Beklemede")
+        self.replay_status_label.setStyleSheet("font: italic 10px; color: #666;")
+        replay_layout.addWidget(self.replay_status_label, 4, 0, 1, 3)
+        
+        layout.addWidget(replay_group)
         layout.addStretch()
     
     def get_team_id(self) -> int:
         """Takım ID'sini döndürür"""
         return self.team_id_spin.value()
     
+    def get_hyi_rate(self) -> float:
+        """Otomatik HYI gönderim hızını döndürür (Hz)"""
+        return self.hyi_rate_spin.value()
+    
     def get_coordinates(self) -> tuple:
         """Koordinatları döndürür"""
         try:
@@ -257,6 +470,22 @@ class ControlPanel(QGroupBox):
         self.latitude_edit.setText(f"{latitude:.6f}")
         self.longitude_edit.setText(f"{longitude:.6f}")
     
+    def get_map_tiles_path(self) -> str:
+        """Harita karo kaynağını döndürür"""
+        return self.map_tiles_edit.text().strip()
+    
+    def get_replay_path(self) -> str:
+        """Oynatılacak kayıt dosyasını döndürür"""
+        return self.replay_path_edit.text().strip()
+    
+    def get_replay_speed(self):
+        """Oynatma hızını döndürür (None: olabildiğince hızlı)"""
+        return self.replay_speed_combo.currentData()
+    
+    def update_replay_status(self, status: str):
+        """Oynatma durumunu günceller"""
+        self.replay_status_label.setText(f"Oynatma: {status}")
+    
     def update_hyi_status(self, status: str):
         """HYI durumunu günceller"""
         self.hyi_status_label.setText(f"HYI Durumu: {status}")